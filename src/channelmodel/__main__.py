@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright 2026 Johannes Demel.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+"""
+Command line tool to generate channel realization datasets and to benchmark channel configurations.
+
+    channelmodel generate --output dataset --realizations 1000000 --workers 8 --domain frequency --subcarriers 1024
+    channelmodel bench --domain time frequency --subcarriers 64 1024
+"""
+
+import argparse
+import itertools
+import json
+import multiprocessing
+import os
+import sys
+import time
+
+import numpy as np
+
+from .channel import ChannelFactory
+from .conformance import format_results, run_conformance
+from .server import ChannelServer
+
+
+def add_factory_arguments(parser, multi=False):
+    nargs = '+' if multi else None
+    parser.add_argument('--domain', nargs=nargs, default=['time'] if multi else 'time',
+                        choices=('time', 'frequency'))
+    parser.add_argument('--type', nargs=nargs, default=['rayleigh'] if multi else 'rayleigh',
+                        choices=('awgn', 'rayleigh'))
+    parser.add_argument('--subcarriers', nargs=nargs, type=int, default=[64] if multi else 64)
+    parser.add_argument('--bandwidth', nargs=nargs, type=float, default=[20.e6] if multi else 20.e6)
+    parser.add_argument('--rms-delay-spread', type=float, default=46.e-9)
+    parser.add_argument('--max-delay-spread', type=float, default=250.e-9)
+    parser.add_argument('--carrier-frequency', type=float, default=None)
+    parser.add_argument('--velocity', type=float, default=None)
+    parser.add_argument('--tx-antennas', type=int, default=1)
+    parser.add_argument('--rx-antennas', type=int, default=1)
+    parser.add_argument('--effective-rate', type=float, default=1.)
+    parser.add_argument('--equalizer-type', default='ZF', choices=('MF', 'ZF', 'MMSE'))
+    parser.add_argument('--tap-threshold-db', type=float, default=None)
+    parser.add_argument('--max-taps', type=int, default=None)
+    parser.add_argument('--backend', default=None, choices=('numpy', 'numba'),
+                        help='numba requires the numba extra, i.e. pip install py-channelmodel[numba]')
+    parser.add_argument('--time-delta', type=float, default=1.e-3,
+                        help='time between consecutive realizations in seconds')
+
+
+def factory_kwargs(args, **overrides):
+    kwargs = {'channel_domain': args.domain, 'channel_type': args.type,
+              'effective_rate': args.effective_rate, 'subcarriers': args.subcarriers,
+              'rms_delay_spread': args.rms_delay_spread, 'max_delay_spread': args.max_delay_spread,
+              'bandwidth': args.bandwidth, 'carrier_frequency': args.carrier_frequency,
+              'velocity': args.velocity, 'tx_antennas': args.tx_antennas,
+              'rx_antennas': args.rx_antennas, 'equalizer_type': args.equalizer_type,
+              'tap_threshold_db': args.tap_threshold_db, 'max_taps': args.max_taps,
+              'backend': args.backend}
+    kwargs.update(overrides)
+    return kwargs
+
+
+def shard_seed(seed, shard_index):
+    """Independent, reproducible seed for every shard, regardless of the number of workers."""
+    return int(np.random.SeedSequence([seed, shard_index]).generate_state(1)[0])
+
+
+def generate_realizations(fading_channel, num_steps, time_delta):
+    """Step a batch of fading links `num_steps` times and collect their realizations."""
+    frequency_domain = hasattr(fading_channel, 'freq_domain_taps')
+    res = {'taps': [], 'gains': []}
+    if frequency_domain:
+        res['freq_taps'] = []
+    for i in range(num_steps):
+        if i > 0:
+            fading_channel.step(time_delta)
+        if frequency_domain:
+            res['taps'].append(fading_channel.time_domain_taps())
+            res['freq_taps'].append(fading_channel.freq_domain_taps())
+            res['gains'].append(fading_channel.freq_domain_gains())
+        else:
+            taps = fading_channel.channel_taps()
+            res['taps'].append(taps)
+            res['gains'].append(np.sum(taps.real ** 2 + taps.imag ** 2, axis=-1))
+    return {k: np.array(v) for k, v in res.items()}
+
+
+def generate_shard(job):
+    kwargs, shard_index, num_steps, num_links, time_delta, seed, output, file_format, fields = job
+    np.random.seed(shard_seed(seed, shard_index))
+    fading_channel = ChannelFactory(**kwargs).create_fading_channel((num_links, ))
+    res = generate_realizations(fading_channel, num_steps, time_delta)
+    res = {k: v for k, v in res.items() if k in fields}
+    basename = os.path.join(output, 'shard_{:06d}'.format(shard_index))
+    if file_format == 'npz':
+        filenames = [basename + '.npz']
+        np.savez(filenames[0], **res)
+    else:
+        filenames = []
+        for k, v in res.items():
+            filenames.append('{}_{}.npy'.format(basename, k))
+            np.save(filenames[-1], v)
+    return shard_index, [os.path.basename(f) for f in filenames]
+
+
+def generate(args):
+    """generate
+
+    Every shard holds `--chunk-size` realizations of shape `(steps, links, ...)`.
+    `--links` independent links are stepped by `--time-delta` to fill a shard,
+    i.e. `--links` equal to `--chunk-size` yields independent realizations only.
+    Workers write their shards themselves, thus memory is bounded by `workers * chunk-size` realizations.
+    """
+    if args.type != 'rayleigh':
+        raise ValueError('Only Rayleigh channels have realizations to generate!')
+    num_links = min(args.links or args.chunk_size, args.chunk_size)
+    num_steps = int(np.ceil(args.chunk_size / num_links))
+    num_shards = int(np.ceil(args.realizations / (num_steps * num_links)))
+    os.makedirs(args.output, exist_ok=True)
+    kwargs = factory_kwargs(args)
+    fields = args.fields.split(',')
+    jobs = [(kwargs, i, num_steps, num_links, args.time_delta, args.seed,
+             args.output, args.format, fields) for i in range(num_shards)]
+
+    shards = [None] * num_shards
+    start = time.time()
+    with multiprocessing.Pool(args.workers) as pool:
+        for i, filenames in pool.imap_unordered(generate_shard, jobs):
+            shards[i] = filenames
+    duration = time.time() - start
+
+    manifest = {'factory': ChannelFactory(**kwargs).state(), 'seed': args.seed,
+                'time_delta': args.time_delta, 'steps_per_shard': num_steps,
+                'links_per_shard': num_links, 'realizations': num_shards * num_steps * num_links,
+                'fields': fields, 'shards': shards}
+    with open(os.path.join(args.output, 'manifest.json'), 'w') as f:
+        json.dump(manifest, f, indent=2, default=str)
+    print('{} realizations in {} shards: {:.1f}s, {:.0f} realizations/s'.format(
+        manifest['realizations'], num_shards, duration, manifest['realizations'] / duration))
+    return 0
+
+
+def benchmark_configuration(kwargs, args):
+    factory = ChannelFactory(**kwargs)
+    channel = factory.create(args.snr_db)
+    block_size = args.block_size
+    if kwargs['channel_domain'] == 'frequency':
+        # frequency domain channels require full OFDM symbols.
+        block_size = int(np.ceil(block_size / kwargs['subcarriers'])) * kwargs['subcarriers']
+    block = (np.ones(block_size) * np.sqrt(.5) * (1. + 1.j)).astype(np.complex64)
+    if kwargs['channel_type'] == 'rayleigh' and kwargs['channel_domain'] == 'time':
+        block = [block] * kwargs['tx_antennas']
+
+    iterations = 0
+    start = time.time()
+    while time.time() - start < args.duration:
+        channel.step(args.time_delta)
+        channel.transmit(block)
+        iterations += 1
+    transmit_duration = time.time() - start
+
+    res = {'steps/s': iterations / transmit_duration,
+           'samples/s': iterations * block_size / transmit_duration}
+    if kwargs['channel_type'] == 'rayleigh':
+        fading_channel = factory.create_fading_channel((args.links, ))
+        iterations = 0
+        start = time.time()
+        while time.time() - start < args.duration:
+            fading_channel.step(args.time_delta)
+            iterations += 1
+        res['realizations/s'] = iterations * args.links / (time.time() - start)
+    return res
+
+
+def bench(args):
+    """bench
+
+    Report the throughput of every combination of the given configurations.
+    """
+    for domain, channel_type, subcarriers, bandwidth in itertools.product(
+            args.domain, args.type, args.subcarriers, args.bandwidth):
+        kwargs = factory_kwargs(args, channel_domain=domain, channel_type=channel_type,
+                                subcarriers=subcarriers, bandwidth=bandwidth)
+        res = benchmark_configuration(kwargs, args)
+        config = 'domain={}, type={}, subcarriers={}, bandwidth={:.0f}MHz'.format(
+            domain, channel_type, subcarriers, bandwidth * 1.e-6)
+        print(config + ': ' + ', '.join('{:.3g} {}'.format(v, k) for k, v in res.items()))
+    return 0
+
+
+def conformance(args):
+    factory = ChannelFactory(**factory_kwargs(args))
+    results = run_conformance(factory, args.realizations, args.time_deltas, args.alpha)
+    print(factory)
+    print(format_results(results))
+    return 0 if all(r.passed for r in results) else 1
+
+
+def serve(args):
+    factory = ChannelFactory(**factory_kwargs(args))
+    factory.set_snr(args.snr_db)
+    address = args.unix_socket if args.unix_socket else (args.host, args.port)
+    server = ChannelServer(factory, address, args.max_batch)
+    print('Serving {} on {}'.format(factory, server.address()))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.shutdown()
+    return 0
+
+
+def create_parser():
+    parser = argparse.ArgumentParser(prog='channelmodel', description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    subparsers = parser.add_subparsers(dest='command')
+    subparsers.required = True
+
+    gen = subparsers.add_parser('generate', help='generate channel realization datasets')
+    add_factory_arguments(gen)
+    gen.add_argument('--output', required=True, help='output directory')
+    gen.add_argument('--realizations', type=int, default=1000000)
+    gen.add_argument('--chunk-size', type=int, default=10000, help='realizations per shard')
+    gen.add_argument('--links', type=int, default=None,
+                     help='independent links per shard, defaults to chunk size')
+    gen.add_argument('--workers', type=int, default=os.cpu_count())
+    gen.add_argument('--seed', type=int, default=0)
+    gen.add_argument('--format', default='npz', choices=('npz', 'npy'))
+    gen.add_argument('--fields', default='taps,freq_taps,gains',
+                     help='comma separated list of taps, freq_taps, gains')
+    gen.set_defaults(func=generate)
+
+    ben = subparsers.add_parser('bench', help='report throughput per configuration')
+    add_factory_arguments(ben, multi=True)
+    ben.add_argument('--snr-db', type=float, default=10.)
+    ben.add_argument('--block-size', type=int, default=1024, help='samples per transmit call')
+    ben.add_argument('--links', type=int, default=1024, help='batch size for realization generation')
+    ben.add_argument('--duration', type=float, default=1., help='seconds per configuration')
+    ben.set_defaults(func=bench)
+
+    con = subparsers.add_parser('conformance', help='check the fading statistics of a configuration')
+    add_factory_arguments(con)
+    con.add_argument('--realizations', type=int, default=2 ** 16, help='independent links per check')
+    con.add_argument('--time-deltas', nargs='+', type=float, default=[1.e-4, 1.e-3, 1.e-2])
+    con.add_argument('--alpha', type=float, default=1.e-3, help='false alarm probability')
+    con.set_defaults(func=conformance)
+
+    srv = subparsers.add_parser('serve', help='run a local channel emulation service')
+    add_factory_arguments(srv)
+    srv.add_argument('--snr-db', type=float, default=10.)
+    srv.add_argument('--unix-socket', default=None, help='serve on this Unix domain socket path')
+    srv.add_argument('--host', default='127.0.0.1')
+    srv.add_argument('--port', type=int, default=5678)
+    srv.add_argument('--max-batch', type=int, default=64, help='maximum number of coalesced requests')
+    srv.set_defaults(func=serve)
+    return parser
+
+
+def main(argv=None):
+    args = create_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
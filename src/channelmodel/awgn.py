@@ -9,26 +9,29 @@
 import numpy as np
 
 
-def get_complex_noise_vector(vec_len, sigma=1., dtype=np.complex64):
+def get_complex_noise_vector(vec_len, sigma=1., dtype=np.complex64, rng=None):
     """ Get complex random vector with variance sigma**2
 
     We use standard deviation.
     It translates to noise power (variance) with sigma ** 2
     :param vec_len: number of complex noise samples
     :param sigma: standard deviation of noise.
+    :param rng: optional `np.random.Generator`, defaults to the global numpy random state.
     :return: complex random vector
     """
     # we expect a complex value, needs to be split for I and Q
     # dev = np.sqrt(.5) * sigma
     # noise = np.random.normal(0.0, dev, [2, vec_len])
     # return (noise[0] + 1.j * noise[1]).astype(dtype)
-    return get_complex_noise_matrix(vec_len, sigma, dtype)
+    return get_complex_noise_matrix(vec_len, sigma, dtype, rng)
 
 
-def get_complex_noise_matrix(shape, sigma=1., dtype=np.complex64):
+def get_complex_noise_matrix(shape, sigma=1., dtype=np.complex64, rng=None):
+    if rng is None:
+        rng = np.random
     dev = np.sqrt(.5) * sigma
-    noise_real = np.random.normal(0.0, dev, shape)
-    noise_imag = np.random.normal(0.0, dev, shape)
+    noise_real = rng.normal(0.0, dev, shape)
+    noise_imag = rng.normal(0.0, dev, shape)
     return (noise_real + 1.j * noise_imag).astype(dtype)
 
 
@@ -42,9 +45,16 @@ class AWGN(object):
 
     effective_rate and subcarriers control correct scaling
     such that the overall energy is normalized to 1.0.
+    backend: optional compute backend from `channelmodel.kernels`.
+    stream: optional `KeyedRandomStream`. Then, the noise of every slot is reproducible via `seek`
+    and the stream takes precedence over the backend.
     """
 
-    def __init__(self, ebn0_db, effective_rate=1., subcarriers=1):
+    def __init__(self, ebn0_db, effective_rate=1., subcarriers=1, backend=None, stream=None):
+        self._backend = backend
+        self._stream = stream
+        self._slot = 0
+        self._rng = None if stream is None else stream.generator(0)
         self._snr_db = ebn0_db
         self._effective_rate = effective_rate
         self._subcarriers = subcarriers
@@ -62,17 +72,42 @@ class AWGN(object):
         }
         return my_state
 
+    def dynamic_state(self):
+        """The noise slot with a stream, `noise_slot` does not collide with the `slot` of a fading channel."""
+        if self._stream is None:
+            return {}
+        return {'noise_slot': self._slot}
+
+    def set_dynamic_state(self, dynamic_state):
+        if self._stream is not None and 'noise_slot' in dynamic_state:
+            self.seek(int(np.ravel(dynamic_state['noise_slot'])[0]))
+
     def channel_taps(self):
         return None
 
     def channel_length(self):
         return 1
 
+    def memory(self):
+        """AWGN is memoryless, any chunk can be transmitted on its own."""
+        return 0
+
     def channel_gains(self):
         return None
 
-    def step(self):
-        pass
+    def step(self, time_delta=1.e-3, steps=1):
+        if self._stream is not None:
+            self.seek(self._slot + steps)
+
+    def slot(self):
+        return self._slot
+
+    def seek(self, slot):
+        """Continue with the noise of `slot`. Requires a stream."""
+        if self._stream is None:
+            raise ValueError('Seeking requires a KeyedRandomStream!')
+        self._slot = slot
+        self._rng = self._stream.generator(slot)
 
     def sigma(self):
         return self._sigma
@@ -83,5 +118,8 @@ class AWGN(object):
     def snr(self):
         return self._snr_db
 
-    def transmit(self, tx_mod):
-        return tx_mod + get_complex_noise_matrix(tx_mod.shape, self._sigma, tx_mod.dtype)
+    def transmit(self, tx_mod, out=None):
+        if self._backend is not None and self._rng is None:
+            return self._backend.add_noise(tx_mod, self._sigma, out)
+        noise = get_complex_noise_matrix(tx_mod.shape, self._sigma, tx_mod.dtype, self._rng)
+        return np.add(tx_mod, noise, out=out)
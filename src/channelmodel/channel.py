@@ -6,6 +6,9 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 #
 
+import concurrent.futures
+import threading
+
 import numpy as np
 
 from .coherence import ChannelCoherenceRappaport
@@ -13,17 +16,48 @@ from .powerdelayprofile import FFTPowerDelayProfile, PowerDelayProfile
 from .awgn import AWGN
 from .timevariantchannel import CoherentTimeVariantChannel, TimeVariantChannel, TransmissionChannel
 from .frequencydomainchannel import FrequencyDomainChannel
+from .equalizer import FrequencyDomainEqualizer
+from .estimation import LMMSEChannelEstimator
+from .randomstream import KeyedRandomStream
+from .importancesampling import (ImportanceSamplingAWGN, ImportanceSamplingTimeVariantChannel,
+                                 importance_log_weights)
+from .kernels import get_backend
+from .interference import FrequencyDomainInterferenceChannel, InterferenceChannel
+from .ofdm import CyclicPrefixOFDMChannel
+from .scfde import SingleCarrierFDEChannel
+from .ici import IntercarrierInterferenceChannel
+
+_executors = {}
+_executor_lock = threading.Lock()
+
+
+def shared_executor(workers):
+    """One thread pool per number of workers, shared by all channels of a process."""
+    with _executor_lock:
+        executor = _executors.get(workers, None)
+        if executor is None:
+            executor = concurrent.futures.ThreadPoolExecutor(workers)
+            _executors[workers] = executor
+        return executor
 
 
 class RayleighAWGNSimulationChannel(object):
     """RayleigAWGNSimulationChannel
     awgn_channel: One channel that's stateless
     fading_channels: a matrix of rx_ antennas x tx_antennas identical rayleigh channels
+    backend: optional compute backend from `channelmodel.kernels` that fuses convolution and noise
+    workers: number of threads to compute the rx antennas in parallel. numpy releases the GIL while convolving.
+    All channels with the same number of workers share one thread pool, see `shared_executor`.
+    Noise is still added in rx antenna order, thus results do not depend on the number of workers.
     """
 
-    def __init__(self, awgn_channel, fading_channels):
+    def __init__(self, awgn_channel, fading_channels, backend=None, workers=None):
         self._awgn_channel = awgn_channel
         self._fading_channels = fading_channels
+        self._backend = backend
+        self._executor = None
+        if workers is not None and workers > 1:
+            self._executor = shared_executor(workers)
 
     def state(self):
         s = self._awgn_channel.state()
@@ -32,14 +66,43 @@ class RayleighAWGNSimulationChannel(object):
         s['rx_antennas'] = self.rx_antennas()
         return s
 
-    def step(self, time_delta=1.e-3):
+    def dynamic_state(self):
+        states = [[c.dynamic_state() for c in row] for row in self._fading_channels]
+        s = {k: np.array([[s[k] for s in row] for row in states])
+             for k in states[0][0].keys()}
+        s.update(self._awgn_channel.dynamic_state())
+        return s
+
+    def set_dynamic_state(self, dynamic_state):
+        awgn_keys = self._awgn_channel.dynamic_state().keys()
+        for i, row in enumerate(self._fading_channels):
+            for j, chan in enumerate(row):
+                chan.set_dynamic_state({k: v[i, j] for k, v in dynamic_state.items() if k not in awgn_keys})
+        self._awgn_channel.set_dynamic_state(dynamic_state)
+
+    def step(self, time_delta=1.e-3, steps=1):
+        self._awgn_channel.step(time_delta, steps)
+        for channel_row in self._fading_channels:
+            for chan in channel_row:
+                chan.step(time_delta, steps)
+
+    def seek(self, slot):
+        self._awgn_channel.seek(slot)
         for channel_row in self._fading_channels:
             for chan in channel_row:
-                chan.step(time_delta)
+                chan.seek(slot)
 
     def snr(self):
         return self._awgn_channel.snr()
 
+    def variance(self):
+        return self._awgn_channel.variance()
+
+    def log_weights(self):
+        """Importance sampling log-weight of the current frame, 0 without biased components."""
+        return importance_log_weights(self._awgn_channel, *[c.time_variant_channel()
+                                                            for row in self._fading_channels for c in row])
+
     def channel_taps(self):
         return [[t.channel_taps() for t in row] for row in self._fading_channels]
 
@@ -55,94 +118,156 @@ class RayleighAWGNSimulationChannel(object):
     def channel_length(self):
         return self._fading_channels[0][0].time_domain_length()
 
-    def transmit(self, tx_symbols):
+    def memory(self):
+        """Past TX samples per stream that the convolution of the next chunk needs, e.g. to stream a capture."""
+        return self.channel_length() - 1
+
+    def _receive(self, chans, tx_symbols):
+        return np.sum([c.transmit(s)
+                       for c, s in zip(chans, tx_symbols)], axis=0)
+
+    def transmit(self, tx_symbols, out=None):
+        if self._backend is not None:
+            return self._backend.mimo_transmit(np.asarray(tx_symbols),
+                                               np.asarray(self.channel_taps()),
+                                               self._awgn_channel.sigma(), out)
+        if self._executor is None:
+            faded = (self._receive(chans, tx_symbols) for chans in self._fading_channels)
+        else:
+            faded = self._executor.map(self._receive, self._fading_channels,
+                                       [tx_symbols] * self.rx_antennas())
         res = []
-        for chans in self._fading_channels:
-            r = np.sum((c.transmit(s)
-                        for c, s in zip(chans, tx_symbols)), axis=0)
-            res.append(self._awgn_channel.transmit(r))
+        for i, r in enumerate(faded):
+            res.append(self._awgn_channel.transmit(
+                r, None if out is None else out[i]))
         return res
 
 
-class FrequencyDomainEqualizer(object):
-    def __init__(self, equalizer_type='MF'):
-        equalizer_type = equalizer_type.upper()
-        assert equalizer_type in ('MF', 'ZF', 'MMSE')
-        self._equalizer_type = equalizer_type
-        self._equalizer_func = self.equalize_matched_filter
-        if equalizer_type == 'ZF':
-            self._equalizer_func = self.equalize_zero_forcing
-        elif equalizer_type == 'MMSE':
-            self._equalizer_func = self.equalize_minimum_mean_squared_error
-
-    def state(self):
-        return {'equalizer_type': self._equalizer_type}
-
-    def equalize_matched_filter(self, rx_mod, fd_channel_taps, _):
-        return rx_mod * np.conj(fd_channel_taps)
-
-    def equalize_zero_forcing(self, rx_mod, fd_channel_taps, _):
-        return rx_mod / fd_channel_taps
-
-    def equalize_minimum_mean_squared_error(self, rx_mod, fd_channel_taps, variance):
-        ctaps = np.conj(fd_channel_taps)
-        return rx_mod * ctaps / (ctaps * fd_channel_taps + variance)
-
-    def equalize(self, rx_mod, fd_channel_taps, variance):
-        return self._equalizer_func(rx_mod, fd_channel_taps, variance)
-        # if self._equalizer_type == 'MF':
-        #     return rx_mod * np.conj(fd_channel_taps)
-        # elif self._equalizer_type == 'ZF':
-        #     return rx_mod / fd_channel_taps
-        # elif self._equalizer_type == 'MMSE':
-        #     ctaps = np.conj(fd_channel_taps)
-        #     return rx_mod * ctaps / (ctaps * fd_channel_taps + variance)
-
-
 class FrequencyDomainRayleighChannel:
-    """Channel to simulate transmission over a Rayleigh channel in Frequency Domain"""
+    """Channel to simulate transmission over a Rayleigh channel in Frequency Domain
+
+    estimator: optional channel estimator, e.g. `LMMSEChannelEstimator`.
+    The equalizer then uses a new estimate from noisy pilots per `transmit` call instead of the true taps.
+    The estimation error adds the expected MSE per subcarrier to the noise variance of the equalizer,
+    the effective SNR and the equalizer gain.
+    The effective SNR and the equalizer gain per subcarrier are computed once per channel realization,
+    or per estimate, and `transmit(..., return_snr=True)` returns them for a demapper.
+    """
 
-    def __init__(self, awgn_channel, fading_channel, equalizer_type='MF'):
+    def __init__(self, awgn_channel, fading_channel, equalizer_type='MF', estimator=None):
         self._awgn_channel = awgn_channel
         self._channel = fading_channel
         self._equalizer = FrequencyDomainEqualizer(equalizer_type)
+        self._estimator = estimator
+        self._estimation_error = 0. if estimator is None else estimator.mse()
         self._frequency_domain_gains = self._channel.freq_domain_gains()
         self._frequency_domain_taps = self._channel.freq_domain_taps()
+        self._effective_snr = None
+        self._equalizer_gain = None
 
     def state(self):
         s = self._awgn_channel.state()
         s.update(self._channel.state())
         s.update(self._equalizer.state())
+        if self._estimator is not None:
+            s.update(self._estimator.state())
         return s
 
+    def dynamic_state(self):
+        s = self._channel.dynamic_state()
+        s.update(self._awgn_channel.dynamic_state())
+        return s
+
+    def set_dynamic_state(self, dynamic_state):
+        self._channel.set_dynamic_state(dynamic_state)
+        self._awgn_channel.set_dynamic_state(dynamic_state)
+        self._frequency_domain_gains = self._channel.freq_domain_gains()
+        self._frequency_domain_taps = self._channel.freq_domain_taps()
+        self._effective_snr = None
+
     def channel_taps(self):
         return self._channel.time_domain_taps()
 
     def channel_length(self):
         return self._channel.time_domain_length()
 
+    def memory(self):
+        """Full OFDM symbols are independent, thus no samples carry over between chunks."""
+        return 0
+
     def frequeny_domain_taps(self):
         return self._frequency_domain_taps
 
     def channel_gains(self):
         return self._frequency_domain_gains
 
-    def step(self, time_delta=1.e-3):
-        self._channel.step(time_delta)
+    def freq_domain_gains(self):
+        """Power gains per subcarrier of the current channel realization."""
+        return self._channel.freq_domain_gains()
+
+    def step(self, time_delta=1.e-3, steps=1):
+        self._awgn_channel.step(time_delta, steps)
+        self._channel.step(time_delta, steps)
+        self._effective_snr = None
+
+    def seek(self, slot):
+        self._awgn_channel.seek(slot)
+        self._channel.seek(slot)
+        self._effective_snr = None
+
+    def log_weights(self):
+        """Importance sampling log-weight of the current frame, 0 without biased components."""
+        return importance_log_weights(self._awgn_channel, self._channel.time_variant_channel())
 
     def snr(self):
         return self._awgn_channel.snr()
 
-    def transmit(self, tx_mod):
-        reps = int(np.ceil(1. * tx_mod.size / self._channel.subcarriers()))
+    def noise_variance(self):
+        """Noise variance per subcarrier after the channel, including the channel estimation error."""
+        return self._awgn_channel.variance() + self._estimation_error
+
+    def _update_equalizer_state(self, fd_channel_taps):
+        variance = self.noise_variance()
+        self._effective_snr = self._equalizer.effective_snr(fd_channel_taps, variance)
+        self._equalizer_gain = self._equalizer.gain(fd_channel_taps, variance)
+
+    def effective_snr(self):
+        """Linear SNR per subcarrier after equalization, with an estimator for the last estimate."""
+        if self._effective_snr is None:
+            self._update_equalizer_state(self._channel.freq_domain_taps())
+        return self._effective_snr
+
+    def equalizer_gain(self):
+        """Scale of the symbols per subcarrier after equalization, see `FrequencyDomainEqualizer.gain`."""
+        self.effective_snr()
+        return self._equalizer_gain
+
+    def transmit(self, tx_mod, out=None, return_snr=False):
+        """transmit
+
+        return_snr: additionally return the effective SNR per subcarrier, i.e. `(rx_mod, effective_snr)`.
+        It applies to every OFDM symbol in `rx_mod`.
+        """
+        reps = int(np.ceil(1. * tx_mod.size / self._channel.freq_domain_taps().size))
         self._frequency_domain_taps = np.tile(
             self._channel.freq_domain_taps(), reps)
         self._frequency_domain_gains = np.tile(
             self._channel.freq_domain_gains(), reps)
         rx_mod = tx_mod * self._frequency_domain_taps
         rx_mod = self._awgn_channel.transmit(rx_mod)
-        rx_mod = self._equalizer.equalize(
-            rx_mod, self._frequency_domain_taps, self._awgn_channel.variance())
+        equalizer_taps = self._frequency_domain_taps
+        variance = self._awgn_channel.variance()
+        if self._estimator is not None:
+            estimate = self._estimator.estimate_channel(self._channel.time_variant_channel())
+            equalizer_taps = np.tile(estimate, reps)
+            variance = np.tile(self.noise_variance(), reps)
+            self._update_equalizer_state(estimate)
+        rx_mod = self._equalizer.equalize(rx_mod, equalizer_taps, variance)
+        if out is not None:
+            out[:] = rx_mod
+            rx_mod = out
+        if return_snr:
+            return rx_mod, self.effective_snr()
         return rx_mod
 
 
@@ -150,7 +275,9 @@ class ChannelFactory:
     def __init__(self, channel_domain, channel_type, effective_rate,
                  subcarriers=1, rms_delay_spread=46.e-9, max_delay_spread=250.e-9,
                  bandwidth=20.e6, carrier_frequency=None, velocity=None,
-                 tx_antennas=1, rx_antennas=1, snr_mode='ebn0', equalizer_type='MF'):
+                 tx_antennas=1, rx_antennas=1, snr_mode='ebn0', equalizer_type=None,
+                 tap_threshold_db=None, max_taps=None, subcarrier_indices=None, backend=None,
+                 workers=None, pilot_indices=None, seed=None, noise_scale=None, fading_scale=None):
         self._snr_db = 0.0  # A dummy to carry init member in ctor
         snr_mode = snr_mode.lower()
         assert snr_mode in ('ebn0', 'edn0')
@@ -168,8 +295,21 @@ class ChannelFactory:
         self._velocity = velocity
         self._tx_antennas = tx_antennas
         self._rx_antennas = rx_antennas
-        if channel_domain == 'time' and equalizer_type != 'ZF':
-            raise f'Channel domain: {channel_domain} does not support "{equalizer_type}" equalizer!'
+        self._tap_threshold_db = tap_threshold_db
+        self._max_taps = max_taps
+        self._subcarrier_indices = subcarrier_indices
+        self._backend = backend
+        self._workers = workers
+        self._pilot_indices = pilot_indices
+        self._seed = seed
+        self._noise_scale = noise_scale
+        self._fading_scale = fading_scale
+        # time domain channels equalize with SC-FDE, see `create_scfde_channel`.
+        if equalizer_type is None:
+            equalizer_type = 'ZF' if self._channel_domain in 'time' else 'MF'
+        equalizer_type = equalizer_type.upper()
+        if self._channel_domain in 'time' and equalizer_type not in ('ZF', 'MMSE'):
+            raise ValueError(f'Channel domain: {channel_domain} does not support "{equalizer_type}" equalizer!')
         self._equalizer_type = equalizer_type
 
     def state(self):
@@ -191,46 +331,187 @@ class ChannelFactory:
     def snr(self):
         return self._snr_db
 
-    def _create_awgn(self):
-        if self._channel_domain in 'time':
+    def _stream(self, *link):
+        """Keyed random stream for `link` if the factory has a seed."""
+        if self._seed is None:
+            return None
+        return KeyedRandomStream(self._seed, link)
+
+    def _create_awgn(self, time_domain=None, stream=None):
+        if time_domain is None:
+            time_domain = self._channel_domain in 'time'
+        if time_domain:
             awgnsc = self._subcarriers
         else:
             awgnsc = 1
         eff_rate = self._effective_rate
         if self._snr_mode == 'edn0':
             eff_rate = 1.
-        return AWGN(self._snr_db, eff_rate, awgnsc)
-
-    def _create_rayleigh(self):
-        if self._channel_domain in 'frequency':
+        if self._noise_scale is not None:
+            return ImportanceSamplingAWGN(self._snr_db, eff_rate, awgnsc, self._noise_scale, stream)
+        return AWGN(self._snr_db, eff_rate, awgnsc, self._get_backend(), stream)
+
+    def _get_backend(self):
+        if self._backend is None:
+            return None
+        return get_backend(self._backend)
+
+    def _create_rayleigh(self, batch_shape=(), frequency_domain=None, stream=None):
+        if frequency_domain is None:
+            frequency_domain = self._channel_domain in 'frequency'
+        if frequency_domain:
             pdp = FFTPowerDelayProfile(self._rms_delay_spread,
                                        self._max_delay_spread, self._bandwidth,
-                                       self._subcarriers)
+                                       self._subcarriers,
+                                       threshold_db=self._tap_threshold_db,
+                                       max_taps=self._max_taps)
         else:
             scale = 1. / np.sqrt(1. * self._tx_antennas * self._rx_antennas)
             pdp = PowerDelayProfile(self._rms_delay_spread,
-                                    self._max_delay_spread, self._bandwidth, scale=scale)
-        if self._carrier_frequency is not None and self._velocity is not None:
+                                    self._max_delay_spread, self._bandwidth, scale=scale,
+                                    threshold_db=self._tap_threshold_db,
+                                    max_taps=self._max_taps)
+        coherent = self._carrier_frequency is not None and self._velocity is not None
+        if self._fading_scale is not None:
+            if coherent:
+                raise ValueError('Fading importance sampling requires independent fading!')
+            return ImportanceSamplingTimeVariantChannel(pdp, self._fading_scale, batch_shape, stream)
+        if coherent:
             coherence = ChannelCoherenceRappaport(
                 self._carrier_frequency, self._velocity)
-            channel = CoherentTimeVariantChannel(pdp, coherence)
+            channel = CoherentTimeVariantChannel(pdp, coherence, batch_shape,
+                                                 self._get_backend(), stream)
         else:
-            channel = TimeVariantChannel(pdp)
+            channel = TimeVariantChannel(pdp, batch_shape, stream)
         return channel
 
-    def create(self, snr_db=None):
+    def create_fading_channel(self, batch_shape=(), link=0):
+        """create_fading_channel
+
+        Only the fading part of the configured channel, e.g. to generate channel realizations.
+        A time domain MIMO channel has the batch shape `batch_shape + (rx_antennas, tx_antennas)`.
+        In the frequency domain, the result is a `FrequencyDomainChannel`.
+        link: selects the keyed random stream if the factory has a seed.
+        """
+        stream = self._stream(link, 1)
+        if self._channel_domain in 'frequency':
+            return FrequencyDomainChannel(self._create_rayleigh(batch_shape, stream=stream),
+                                          self._subcarrier_indices,
+                                          workers=self._workers)
+        batch_shape = tuple(batch_shape) + (self._rx_antennas, self._tx_antennas)
+        return self._create_rayleigh(batch_shape, stream=stream)
+
+    def create(self, snr_db=None, link=0):
+        """create
+
+        link: if the factory has a seed, every link gets its own keyed random streams.
+        Then, every slot of a link is reproducible, e.g. in another process, via `seek`.
+        """
         if snr_db is not None:
             self.set_snr(snr_db)
-        channel = awgn_channel = self._create_awgn()
+        channel = awgn_channel = self._create_awgn(stream=self._stream(link, 0))
 
         if self._channel_type in 'rayleigh':
             if self._channel_domain in 'time':
-                fading_channels = [[TransmissionChannel(self._create_rayleigh()) for _ in range(
-                    self._tx_antennas)] for _ in range(self._rx_antennas)]
+                fading_channels = [[TransmissionChannel(self._create_rayleigh(stream=self._stream(link, 1, i, j)))
+                                    for j in range(self._tx_antennas)] for i in range(self._rx_antennas)]
+                # the fused kernels draw from the global random state without a bias.
+                backend = self._get_backend() if self._seed is None and self._noise_scale is None else None
                 channel = RayleighAWGNSimulationChannel(awgn_channel,
-                                                        fading_channels)
+                                                        fading_channels,
+                                                        backend,
+                                                        self._workers)
             else:
-                fading_channel = FrequencyDomainChannel(self._create_rayleigh())
+                fading_channel = FrequencyDomainChannel(self._create_rayleigh(stream=self._stream(link, 1)),
+                                                        self._subcarrier_indices,
+                                                        workers=self._workers)
+                estimator = None
+                if self._pilot_indices is not None:
+                    estimator = LMMSEChannelEstimator(
+                        fading_channel.time_variant_channel().power_delay_profile(),
+                        self._subcarriers, self._pilot_indices,
+                        -10. * np.log10(awgn_channel.variance()), self._subcarrier_indices,
+                        self._stream(link, 2))
                 channel = FrequencyDomainRayleighChannel(
-                    awgn_channel, fading_channel, self._equalizer_type)
+                    awgn_channel, fading_channel, self._equalizer_type, estimator)
         return channel
+
+    def create_interference_channel(self, num_interferers, interference_powers_db=0., snr_db=None, link=0):
+        """create_interference_channel
+
+        A desired link plus `num_interferers` co-channel interferers with the same fading statistics.
+        All links are one batched fading channel, see `channelmodel.interference`.
+        """
+        if self._channel_type != 'rayleigh':
+            raise ValueError('Interference channels require Rayleigh fading!')
+        if snr_db is not None:
+            self.set_snr(snr_db)
+        awgn_channel = self._create_awgn(stream=self._stream(link, 0))
+        batch_shape = (num_interferers + 1, )
+        if self._channel_domain in 'frequency':
+            fading_channel = FrequencyDomainChannel(self._create_rayleigh(batch_shape, stream=self._stream(link, 1)),
+                                                    self._subcarrier_indices,
+                                                    workers=self._workers)
+            return FrequencyDomainInterferenceChannel(awgn_channel, fading_channel,
+                                                      interference_powers_db, self._equalizer_type)
+        if self._tx_antennas != 1 or self._rx_antennas != 1:
+            raise ValueError('Time domain interference channels only support single antenna links!')
+        return InterferenceChannel(awgn_channel, self._create_rayleigh(batch_shape, stream=self._stream(link, 1)),
+                                   interference_powers_db)
+
+    def create_ofdm_channel(self, cp_length, snr_db=None, method=None, link=0):
+        """create_ofdm_channel
+
+        A time domain channel for CP-OFDM symbols with `subcarriers` subcarriers, see `channelmodel.ofdm`.
+        `transmit_subcarriers` skips the OFDM FFTs if the CP covers the channel.
+        """
+        if self._channel_type != 'rayleigh':
+            raise ValueError('OFDM channels require Rayleigh fading!')
+        if self._tx_antennas != 1 or self._rx_antennas != 1:
+            raise ValueError('OFDM channels only support single antenna links!')
+        if snr_db is not None:
+            self.set_snr(snr_db)
+        fading_channel = FrequencyDomainChannel(self._create_rayleigh(frequency_domain=True,
+                                                                      stream=self._stream(link, 1)),
+                                                workers=self._workers)
+        return CyclicPrefixOFDMChannel(self._create_awgn(time_domain=True, stream=self._stream(link, 0)),
+                                       fading_channel, cp_length, method)
+
+    def create_scfde_channel(self, block_length, cp_length, snr_db=None, link=0):
+        """create_scfde_channel
+
+        A time domain channel with a block SC-FDE receiver and the configured equalizer, see `channelmodel.scfde`.
+        The SNR is defined per single-carrier symbol, i.e. the noise is not scaled with `subcarriers`.
+        """
+        if self._channel_domain != 'time' or self._channel_type != 'rayleigh':
+            raise ValueError('SC-FDE channels require time domain Rayleigh fading!')
+        if self._tx_antennas != 1:
+            raise ValueError('SC-FDE channels only support a single tx antenna!')
+        if snr_db is not None:
+            self.set_snr(snr_db)
+        awgn_channel = self._create_awgn(time_domain=False, stream=self._stream(link, 0))
+        fading_channels = [[TransmissionChannel(self._create_rayleigh(stream=self._stream(link, 1, i, 0)))]
+                           for i in range(self._rx_antennas)]
+        backend = self._get_backend() if self._seed is None and self._noise_scale is None else None
+        channel = RayleighAWGNSimulationChannel(awgn_channel, fading_channels, backend, self._workers)
+        return SingleCarrierFDEChannel(channel, block_length, cp_length, self._equalizer_type)
+
+    def create_ici_channel(self, cp_length=0, ici_bandwidth=2, snr_db=None, link=0):
+        """create_ici_channel
+
+        A frequency domain OFDM channel with Doppler-induced ICI, see `channelmodel.ici`.
+        It requires `carrier_frequency` and `velocity`, the symbol duration follows from `bandwidth`.
+        """
+        if self._channel_type != 'rayleigh' or self._carrier_frequency is None or self._velocity is None:
+            raise ValueError('ICI channels require Rayleigh fading with carrier frequency and velocity!')
+        if self._tx_antennas != 1 or self._rx_antennas != 1:
+            raise ValueError('ICI channels only support single antenna links!')
+        if snr_db is not None:
+            self.set_snr(snr_db)
+        fading_channel = FrequencyDomainChannel(self._create_rayleigh(frequency_domain=True,
+                                                                      stream=self._stream(link, 1)),
+                                                workers=self._workers)
+        symbol_duration = (self._subcarriers + cp_length) / self._bandwidth
+        return IntercarrierInterferenceChannel(self._create_awgn(time_domain=False, stream=self._stream(link, 0)),
+                                               fading_channel, symbol_duration, cp_length, ici_bandwidth,
+                                               self._equalizer_type)
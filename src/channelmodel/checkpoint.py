@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright 2026 Johannes Demel.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+import os
+
+import numpy as np
+
+from .kernels import numba_random_used
+
+CHECKPOINT_VERSION = 1
+
+_STATE_PREFIX = 'state_'
+_EXTRA_PREFIX = 'extra_'
+_RNG_PREFIX = 'rng_'
+
+
+def get_rng_state():
+    """Return the state of numpy's global random generator as a dict of arrays."""
+    name, keys, pos, has_gauss, cached_gaussian = np.random.get_state()
+    return {'name': np.array(name), 'keys': keys, 'pos': np.array(pos),
+            'has_gauss': np.array(has_gauss), 'cached_gaussian': np.array(cached_gaussian)}
+
+
+def set_rng_state(rng_state):
+    np.random.set_state((str(rng_state['name']), rng_state['keys'], int(rng_state['pos']),
+                         int(rng_state['has_gauss']), float(rng_state['cached_gaussian'])))
+
+
+def bulk_dynamic_state(channels):
+    """bulk_dynamic_state
+
+    Stack the dynamic states of many equally configured channels into one array per state variable.
+    """
+    states = [c.dynamic_state() for c in channels]
+    keys = set(states[0].keys())
+    if any(set(s.keys()) != keys for s in states):
+        raise ValueError('Bulk checkpoints require channels of the same type!')
+    try:
+        return {k: np.stack([s[k] for s in states]) for k in keys}
+    except ValueError:
+        raise ValueError('Bulk checkpoints require channels with identical dimensions!')
+
+
+def set_bulk_dynamic_state(channels, dynamic_state):
+    for i, c in enumerate(channels):
+        c.set_dynamic_state({k: v[i] for k, v in dynamic_state.items()})
+
+
+def save_checkpoint(filename, channels, include_rng=True, **extra):
+    """save_checkpoint
+
+    Store the full dynamic state of a channel or a list of channels in one binary `.npz` file.
+
+    Fading states, taps and frequency responses are stored as raw arrays,
+    a list of channels is stacked into one array per state variable.
+    `include_rng` adds the state of numpy's global random generator.
+    A restored simulation then continues bit-exactly if all channels draw from the global generator,
+    or from keyed streams if the checkpoint is taken between slots, i.e. right after `step`.
+    The state of the numba backend generator cannot be saved, thus `include_rng` raises a ValueError after
+    the numba backend drew random numbers. With `include_rng=False`, the restored states are only exact
+    up to the random draws.
+    Any `extra` arrays, e.g. the current sweep index, are stored alongside and returned by `load_checkpoint`.
+    The file is replaced atomically, thus a preempted job always finds a complete checkpoint.
+    """
+    if include_rng and numba_random_used():
+        raise ValueError('The random state of the numba backend cannot be saved, use include_rng=False!')
+    bulk = isinstance(channels, (list, tuple))
+    if bulk:
+        dynamic_state = bulk_dynamic_state(channels)
+        class_names = [type(c).__name__ for c in channels]
+    else:
+        dynamic_state = channels.dynamic_state()
+        class_names = [type(channels).__name__]
+
+    arrays = {'version': np.array(CHECKPOINT_VERSION),
+              'bulk': np.array(bulk),
+              'classes': np.array(class_names)}
+    arrays.update({_STATE_PREFIX + k: v for k, v in dynamic_state.items()})
+    arrays.update({_EXTRA_PREFIX + k: v for k, v in extra.items()})
+    if include_rng:
+        arrays.update({_RNG_PREFIX + k: v for k, v in get_rng_state().items()})
+
+    tmp_filename = os.fspath(filename) + '.tmp'
+    with open(tmp_filename, 'wb') as f:
+        np.savez(f, **arrays)
+    os.replace(tmp_filename, filename)
+
+
+def load_checkpoint(filename, channels, restore_rng=True):
+    """load_checkpoint
+
+    Restore a checkpoint written by `save_checkpoint` into already constructed channels.
+    The channels must have the same configuration as the stored ones.
+    Returns the `extra` arrays as a dict.
+    """
+    with np.load(filename) as data:
+        if int(data['version']) != CHECKPOINT_VERSION:
+            raise ValueError('Unsupported checkpoint version: {}'.format(int(data['version'])))
+        bulk = isinstance(channels, (list, tuple))
+        class_names = [type(c).__name__ for c in channels] if bulk else [type(channels).__name__]
+        if bool(data['bulk']) != bulk or list(data['classes']) != class_names:
+            raise ValueError('Checkpoint does not match channels: {}'.format(list(data['classes'])))
+
+        def select(prefix):
+            return {k[len(prefix):]: data[k] for k in data.files if k.startswith(prefix)}
+
+        dynamic_state = select(_STATE_PREFIX)
+        if bulk:
+            set_bulk_dynamic_state(channels, dynamic_state)
+        else:
+            channels.set_dynamic_state(dynamic_state)
+        rng_state = select(_RNG_PREFIX)
+        if restore_rng and rng_state:
+            set_rng_state(rng_state)
+        return select(_EXTRA_PREFIX)
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright 2026 Johannes Demel.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+"""
+Statistical conformance checks for the channel models.
+
+All checks work on large batches of independent links that are generated in one vectorized step,
+e.g. via `ChannelFactory.create_fading_channel((num_realizations, ))`.
+Thus, they also verify accelerated backends and custom configurations.
+
+Every check compares sample statistics against the model with confidence bounds.
+`run_conformance` splits the false alarm probability `alpha` over all individual comparisons (Bonferroni).
+"""
+
+import collections
+
+import numpy as np
+import scipy.stats
+
+ConformanceResult = collections.namedtuple(
+    'ConformanceResult', ['name', 'estimate', 'expected', 'lower', 'upper', 'passed'])
+
+
+def _result(name, estimate, expected, deviation):
+    lower = expected - deviation
+    upper = expected + deviation
+    passed = bool(np.all((lower <= estimate) & (estimate <= upper)))
+    return ConformanceResult(name, estimate, expected, lower, upper, passed)
+
+
+def z_score(alpha, num_comparisons=1):
+    """Two-sided normal quantile for a family-wise false alarm probability `alpha`."""
+    return scipy.stats.norm.isf(alpha / (2. * num_comparisons))
+
+
+def check_tap_variance(time_variant_channel, z):
+    """Mean tap power over all links vs. the power delay profile.
+
+    The power of a Rayleigh tap is exponentially distributed, its standard deviation equals its mean.
+    """
+    _, taps = time_variant_channel.sparse_channel_taps()
+    pdp_taps = time_variant_channel.power_delay_profile().taps()
+    expected = pdp_taps.real ** 2 + pdp_taps.imag ** 2
+    powers = (taps.real ** 2 + taps.imag ** 2).reshape((-1, expected.size))
+    deviation = z * expected / np.sqrt(powers.shape[0])
+    return _result('tap_variance', np.mean(powers, axis=0), expected, deviation)
+
+
+def check_frequency_gains(frequency_domain_channel, z):
+    """Mean gain per subcarrier vs. the power delay profile energy.
+
+    Every subcarrier gain is exponentially distributed with the total tap power as its mean.
+    """
+    pdp_taps = frequency_domain_channel.time_variant_channel().power_delay_profile().taps()
+    gains = frequency_domain_channel.freq_domain_gains()
+    gains = gains.reshape((-1, gains.shape[-1]))
+    expected = np.full(gains.shape[-1], np.sum(pdp_taps.real ** 2 + pdp_taps.imag ** 2))
+    deviation = z * expected / np.sqrt(gains.shape[0])
+    return _result('frequency_gains', np.mean(gains, axis=0), expected, deviation)
+
+
+def check_coherence(time_variant_channel, time_deltas, z):
+    """Correlation of the fading state before and after a step of `time_delta` vs. the coherence curve.
+
+    The AR(1) update weights the previous state with `sqrt(covariance)`,
+    i.e. the normalized correlation after one step is `sqrt(coherence_time(time_delta))`.
+    Independent fading, i.e. no coherence model, must be uncorrelated.
+    The estimate of a correlation `rho` from `n` complex Gaussian pairs
+    has a variance of about `(1 + rho ** 2) / (2 n)`.
+    The channel advances by all `time_deltas`.
+    """
+    coherence = getattr(time_variant_channel, 'coherence', None)
+    estimate = np.zeros(len(time_deltas))
+    expected = np.zeros(len(time_deltas))
+    deviation = np.zeros(len(time_deltas))
+    for i, time_delta in enumerate(time_deltas):
+        before = np.array(time_variant_channel.dynamic_state()['channel_state'])
+        time_variant_channel.step(time_delta)
+        after = time_variant_channel.dynamic_state()['channel_state']
+        estimate[i] = np.real(np.vdot(before, after)) / np.real(np.vdot(before, before))
+        if coherence is not None:
+            expected[i] = np.sqrt(coherence().coherence_time(time_delta))
+        deviation[i] = z * np.sqrt((1. + expected[i] ** 2) / (2. * before.size))
+    return _result('coherence', estimate, expected, deviation)
+
+
+def run_conformance(factory, num_realizations=2 ** 16, time_deltas=(1.e-4, 1.e-3, 1.e-2), alpha=1.e-3):
+    """run_conformance
+
+    Check the fading statistics of the channels a `ChannelFactory` creates.
+    Returns a list of `ConformanceResult`.
+    """
+    fading_channel = factory.create_fading_channel((num_realizations, ))
+    frequency_domain_channel = None
+    time_variant_channel = fading_channel
+    if hasattr(fading_channel, 'time_variant_channel'):
+        frequency_domain_channel = fading_channel
+        time_variant_channel = fading_channel.time_variant_channel()
+
+    num_comparisons = time_variant_channel.power_delay_profile().num_taps() + len(time_deltas)
+    if frequency_domain_channel is not None:
+        num_comparisons += frequency_domain_channel.freq_domain_gains().shape[-1]
+    z = z_score(alpha, num_comparisons)
+
+    results = [check_tap_variance(time_variant_channel, z)]
+    if frequency_domain_channel is not None:
+        results.append(check_frequency_gains(frequency_domain_channel, z))
+    results.append(check_coherence(time_variant_channel, time_deltas, z))
+    return results
+
+
+def format_results(results):
+    lines = []
+    for r in results:
+        normalized = np.abs(np.asarray(r.estimate) - r.expected) / np.maximum(r.upper - r.expected, 1.e-30)
+        lines.append('{:<16} {:<4} max deviation {:.2f} of bound'.format(
+            r.name, 'PASS' if r.passed else 'FAIL', np.amax(normalized)))
+    return '\n'.join(lines)
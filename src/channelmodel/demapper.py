@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright 2026 Johannes Demel.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+import numpy as np
+
+
+def gray_pam_bits(num_levels):
+    """Gray coded bits `(num_levels, log2(num_levels))` of the PAM levels in ascending order, MSB first."""
+    num_bits = int(np.log2(num_levels))
+    indices = np.arange(num_levels)
+    gray = indices ^ (indices >> 1)
+    return (gray[:, None] >> np.arange(num_bits - 1, -1, -1)[None, :]) & 1
+
+
+class QAMModem(object):
+    """QAMModem
+
+    Gray coded square QAM with unit average symbol energy for `order` in (2, 4, 16, 64, 256), 2 is BPSK.
+    The first half of the bits of a symbol select the I level, the second half the Q level.
+
+    `demap` computes max-log LLRs `log P(b = 0) / P(b = 1)`.
+    Square QAM separates into two PAM constellations, thus it only computes the distances
+    to the `sqrt(order)` levels per axis for all symbols at once.
+    """
+
+    def __init__(self, order):
+        if order not in (2, 4, 16, 64, 256):
+            raise ValueError('Unsupported QAM order {}, choose one of (2, 4, 16, 64, 256)'.format(order))
+        self._order = order
+        self._bits_per_symbol = int(np.log2(order))
+        if order == 2:
+            self._num_levels = 2
+            energy = 1.
+        else:
+            self._num_levels = int(np.sqrt(order))
+            energy = 2. * (self._num_levels ** 2 - 1) / 3.
+        levels = 2. * np.arange(self._num_levels) - (self._num_levels - 1)
+        self._levels = (levels / np.sqrt(energy)).astype(np.float32)
+        self._level_bits = gray_pam_bits(self._num_levels)
+        self._level_of_bits = np.argsort(self._level_bits @ (1 << np.arange(self._level_bits.shape[1] - 1, -1, -1)))
+        # masks of the levels with a bit set, per bit position.
+        self._ones = self._level_bits.T.astype(bool)
+
+    def state(self):
+        return {'modulation_order': self._order}
+
+    def order(self):
+        return self._order
+
+    def bits_per_symbol(self):
+        return self._bits_per_symbol
+
+    def constellation(self):
+        """All symbols, indexed by their bits as an integer, MSB first."""
+        bits = (np.arange(self._order)[:, None] >> np.arange(self._bits_per_symbol - 1, -1, -1)) & 1
+        return self.modulate(bits)
+
+    def _axis_levels(self, bits):
+        weights = 1 << np.arange(bits.shape[-1] - 1, -1, -1)
+        return self._levels[self._level_of_bits[bits @ weights]]
+
+    def modulate(self, bits):
+        bits = np.asarray(bits, dtype=np.int64).reshape((-1, self._bits_per_symbol))
+        if self._order == 2:
+            return self._axis_levels(bits).astype(np.complex64)
+        half = self._bits_per_symbol // 2
+        return (self._axis_levels(bits[:, 0:half]) + 1.j * self._axis_levels(bits[:, half:])).astype(np.complex64)
+
+    def _axis_llrs(self, values, snr):
+        distances = (values[..., None] - self._levels) ** 2
+        llrs = np.empty(values.shape + (self._ones.shape[0], ), dtype=np.float32)
+        for i, ones in enumerate(self._ones):
+            llrs[..., i] = np.amin(distances[..., ones], axis=-1) - np.amin(distances[..., ~ones], axis=-1)
+        return llrs * snr[..., None]
+
+    def demap(self, rx_symbols, snr, gain=None):
+        """demap
+
+        Max-log LLRs of shape `(num_symbols * bits_per_symbol, )`.
+        snr: linear SNR per symbol, i.e. `1 / N0`. An SNR per subcarrier applies to every OFDM symbol,
+        e.g. the effective SNR of `FrequencyDomainRayleighChannel.transmit(..., return_snr=True)`.
+        gain: scale of the symbols, e.g. `FrequencyDomainRayleighChannel.equalizer_gain()` for MF and MMSE.
+        """
+        snr = np.asarray(snr, dtype=np.float32)
+        period = snr.size
+        if gain is not None:
+            gain = np.asarray(gain, dtype=np.float32)
+            period = max(period, gain.size)
+        # per subcarrier values broadcast over all OFDM symbols without tiling.
+        rx_symbols = np.asarray(rx_symbols).reshape((-1, period))
+        snr = snr.reshape(-1) if snr.size > 1 else snr.reshape(())
+        if gain is not None:
+            rx_symbols = rx_symbols / (gain.reshape(-1) if gain.size > 1 else gain.reshape(()))
+
+        llrs = self._axis_llrs(rx_symbols.real, snr)
+        if self._order > 2:
+            llrs = np.concatenate((llrs, self._axis_llrs(rx_symbols.imag, snr)), axis=-1)
+        return llrs.reshape(-1)
+
+    def hard_decision(self, llrs):
+        return (np.asarray(llrs) < 0.).astype(np.uint8)
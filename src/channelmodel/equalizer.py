@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright 2026 Johannes Demel.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+"""
+Per subcarrier equalization of frequency domain channels, shared by all OFDM style channels.
+"""
+
+import numpy as np
+
+
+class FrequencyDomainEqualizer(object):
+    def __init__(self, equalizer_type='MF'):
+        equalizer_type = equalizer_type.upper()
+        assert equalizer_type in ('MF', 'ZF', 'MMSE')
+        self._equalizer_type = equalizer_type
+        self._equalizer_func = self.equalize_matched_filter
+        if equalizer_type == 'ZF':
+            self._equalizer_func = self.equalize_zero_forcing
+        elif equalizer_type == 'MMSE':
+            self._equalizer_func = self.equalize_minimum_mean_squared_error
+
+    def state(self):
+        return {'equalizer_type': self._equalizer_type}
+
+    def equalize_matched_filter(self, rx_mod, fd_channel_taps, _):
+        return rx_mod * np.conj(fd_channel_taps)
+
+    def equalize_zero_forcing(self, rx_mod, fd_channel_taps, _):
+        return rx_mod / fd_channel_taps
+
+    def equalize_minimum_mean_squared_error(self, rx_mod, fd_channel_taps, variance):
+        ctaps = np.conj(fd_channel_taps)
+        return rx_mod * ctaps / (ctaps * fd_channel_taps + variance)
+
+    def equalize(self, rx_mod, fd_channel_taps, variance):
+        return self._equalizer_func(rx_mod, fd_channel_taps, variance)
+        # if self._equalizer_type == 'MF':
+        #     return rx_mod * np.conj(fd_channel_taps)
+        # elif self._equalizer_type == 'ZF':
+        #     return rx_mod / fd_channel_taps
+        # elif self._equalizer_type == 'MMSE':
+        #     ctaps = np.conj(fd_channel_taps)
+        #     return rx_mod * ctaps / (ctaps * fd_channel_taps + variance)
+
+    def effective_snr(self, fd_channel_taps, variance):
+        """Linear SNR per subcarrier after equalization, `|H|^2 / variance` for the unbiased output."""
+        return (fd_channel_taps.real ** 2 + fd_channel_taps.imag ** 2) / variance
+
+    def gain(self, fd_channel_taps, variance):
+        """Scale of the transmitted symbols after equalization, e.g. to remove the MMSE bias before demapping."""
+        gains = fd_channel_taps.real ** 2 + fd_channel_taps.imag ** 2
+        if self._equalizer_type == 'MF':
+            return gains
+        if self._equalizer_type == 'ZF':
+            return np.ones_like(gains)
+        return gains / (gains + variance)
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright 2026 Johannes Demel.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+import numpy as np
+
+from .awgn import get_complex_noise_matrix
+from .frequencydomainchannel import cache_value, calculate_partial_dft, partial_dft_basis
+
+_MAX_CACHED_FILTERS = 64
+_lmmse_filter_cache = {}
+
+
+def frequency_correlation(power_delay_profile, fft_len, row_indices, column_indices):
+    """frequency_correlation
+
+    Correlation `E[H_k H_l^*] = sum_n p_n exp(-2j pi n (k - l) / fft_len)` between the subcarriers
+    in `row_indices` and `column_indices` for the tap powers `p_n` of a power delay profile.
+    """
+    taps = power_delay_profile.taps()
+    powers = (taps.real ** 2 + taps.imag ** 2).astype(np.float64)
+    indices = power_delay_profile.tap_indices()
+    rows = partial_dft_basis(indices, fft_len, row_indices).astype(np.complex128)
+    columns = partial_dft_basis(indices, fft_len, column_indices).astype(np.complex128)
+    return rows.T @ (powers[:, None] * np.conj(columns))
+
+
+def lmmse_filter(power_delay_profile, fft_len, pilot_indices, noise_variance, subcarrier_indices=None):
+    """lmmse_filter
+
+    LMMSE interpolation filter `W = R_dp (R_pp + noise_variance I)^-1` of shape `(K, P)`
+    from `P` least squares pilot estimates to `K` subcarriers.
+    Filters are cached per power delay profile, pilot pattern, subcarriers and noise variance.
+    """
+    if subcarrier_indices is None:
+        subcarrier_indices = np.arange(fft_len)
+    pilot_indices = np.asarray(pilot_indices, dtype=np.int64)
+    subcarrier_indices = np.asarray(subcarrier_indices, dtype=np.int64)
+    key = (fft_len, power_delay_profile.tap_indices().tobytes(), power_delay_profile.taps().tobytes(),
+           pilot_indices.tobytes(), subcarrier_indices.tobytes(), float(noise_variance))
+    w = _lmmse_filter_cache.get(key, None)
+    if w is None:
+        r_pp = frequency_correlation(power_delay_profile, fft_len, pilot_indices, pilot_indices)
+        r_dp = frequency_correlation(power_delay_profile, fft_len, subcarrier_indices, pilot_indices)
+        a = r_pp + noise_variance * np.eye(pilot_indices.size)
+        w = np.linalg.solve(a.T, r_dp.T).T.astype(np.complex64)
+        cache_value(_lmmse_filter_cache, key, w, _MAX_CACHED_FILTERS)
+    return w
+
+
+class LMMSEChannelEstimator(object):
+    """LMMSEChannelEstimator
+
+    Pilot based channel estimation with unit power pilots on `pilot_indices`.
+    The LMMSE filter interpolates least squares estimates at the pilots to `subcarrier_indices`.
+
+    power_delay_profile: the PDP the channel is drawn from.
+    snr_db: pilot SNR, i.e. `-10 log10(noise_variance)` for unit power pilots.
+    stream: optional `KeyedRandomStream` for the pilot noise. `estimate_channel` then draws it from the generator
+    of the current slot of the channel, thus all estimates within one slot are the same.
+    """
+
+    def __init__(self, power_delay_profile, fft_len, pilot_indices, snr_db, subcarrier_indices=None, stream=None):
+        self._pdp = power_delay_profile
+        self._stream = stream
+        self._fft_len = fft_len
+        self._pilot_indices = np.asarray(pilot_indices)
+        self._subcarrier_indices = subcarrier_indices
+        self._snr_db = snr_db
+        self._noise_variance = 10. ** (-snr_db / 10.)
+        self._filter = lmmse_filter(power_delay_profile, fft_len, self._pilot_indices,
+                                    self._noise_variance, subcarrier_indices)
+
+    def state(self):
+        return {'estimator': 'LMMSE',
+                'pilot_indices': self._pilot_indices,
+                'pilot_snr': self._snr_db}
+
+    def pilot_indices(self):
+        return self._pilot_indices
+
+    def noise_variance(self):
+        return self._noise_variance
+
+    def filter(self):
+        return self._filter
+
+    def mse(self):
+        """Expected squared estimation error per subcarrier."""
+        subcarriers = self._subcarrier_indices
+        if subcarriers is None:
+            subcarriers = np.arange(self._fft_len)
+        r_dd = np.real(np.diag(frequency_correlation(self._pdp, self._fft_len, subcarriers, subcarriers)))
+        r_dp = frequency_correlation(self._pdp, self._fft_len, subcarriers, self._pilot_indices)
+        return r_dd - np.real(np.sum(self._filter * np.conj(r_dp), axis=-1))
+
+    def estimate(self, pilot_estimates):
+        """Interpolate least squares pilot estimates `(..., P)` to `(..., K)` subcarriers."""
+        return pilot_estimates @ self._filter.T
+
+    def estimate_channel(self, time_variant_channel):
+        """estimate_channel
+
+        Estimate the current taps of a (batched) time variant channel from noisy pilots.
+        The least squares estimates at the pilots are the true frequency response plus noise.
+        """
+        indices, taps = time_variant_channel.sparse_channel_taps()
+        pilots = calculate_partial_dft(taps, indices, self._fft_len, self._pilot_indices)
+        rng = None if self._stream is None else self._stream.generator(time_variant_channel.slot())
+        pilots += get_complex_noise_matrix(pilots.shape, np.sqrt(self._noise_variance), pilots.dtype, rng)
+        return self.estimate(pilots)
@@ -7,42 +7,132 @@
 #
 
 import numpy as np
+import scipy.fft
+
+_MAX_CACHED_BASES = 64
+_dft_basis_cache = {}
+
+
+def cache_value(cache, key, value, max_entries):
+    """Store `value` in the dict `cache`, which is cleared first if it holds `max_entries` values."""
+    if len(cache) >= max_entries:
+        cache.clear()
+    cache[key] = value
+    return value
+
+
+def partial_dft_basis(tap_indices, fft_len, subcarrier_indices=None):
+    """partial_dft_basis
+
+    Return the `(L, K)` DFT matrix that maps `L` taps at `tap_indices`
+    to the `K` subcarriers in `subcarrier_indices` of an `fft_len` point DFT.
+    Bases are cached, thus repeated calls with the same configuration are cheap.
+    """
+    tap_indices = np.asarray(tap_indices, dtype=np.int64)
+    if subcarrier_indices is None:
+        subcarrier_indices = np.arange(fft_len)
+    subcarrier_indices = np.asarray(subcarrier_indices, dtype=np.int64)
+    key = (fft_len, tap_indices.tobytes(), subcarrier_indices.tobytes())
+    basis = _dft_basis_cache.get(key, None)
+    if basis is None:
+        # reduce the exponent first to keep the phase accurate for large indices.
+        exponent = np.outer(tap_indices, subcarrier_indices) % fft_len
+        basis = np.exp(-2.j * np.pi * exponent / fft_len).astype(np.complex64)
+        cache_value(_dft_basis_cache, key, basis, _MAX_CACHED_BASES)
+    return basis
+
+
+def calculate_partial_dft(taps, tap_indices, fft_len, subcarrier_indices=None):
+    """calculate_partial_dft
+
+    Frequency response of one channel `(L, )` or a batch of channels `(..., L)`
+    on the selected subcarriers via a single matrix product.
+    """
+    return taps @ partial_dft_basis(tap_indices, fft_len, subcarrier_indices)
 
 
 class FrequencyDomainChannel(object):
-    def __init__(self, time_variant_channel):
+    """FrequencyDomainChannel
+
+    Converts the taps of a time variant channel into a frequency domain representation.
+
+    subcarrier_indices: optional subset of subcarriers, e.g. the allocated resource blocks.
+    method: 'fft' computes a full FFT, 'dft' multiplies with a cached partial DFT basis.
+    The default is 'fft' for all subcarriers and 'dft' for an allocated subset.
+    workers: number of threads for the FFT via `scipy.fft`, e.g. for batches of links or large FFT sizes.
+    `scipy.fft` caches its plans, thus they are reused in every step.
+    The frequency domain taps are only recomputed when they are read after a step. Thus, idle links are cheap.
+    """
+
+    def __init__(self, time_variant_channel, subcarrier_indices=None, method=None, workers=None):
         state = time_variant_channel.state()
         self._fft_len = state['subcarriers']
+        if method is None:
+            method = 'fft' if subcarrier_indices is None else 'dft'
+        method = method.lower()
+        assert method in ('fft', 'dft')
+        self._method = method
+        self._subcarrier_indices = subcarrier_indices
+        self._workers = workers
 
         self._channel = time_variant_channel
-        self._freq_taps = self.calculate_freq_domain_taps()
-        self._freq_gains = self.calculate_freq_domain_gains()
+        self._update_freq_domain()
 
     def __repr__(self):
         s = type(self).__name__ + '('
         s += repr(self._channel)
-        s += repr(self._freq_taps)
-        s += repr(self._freq_gains)
+        s += repr(self.freq_domain_taps())
+        s += repr(self.freq_domain_gains())
         s += 'subcarriers={}'.format(self._fft_len)
         return s + ')'
 
     def __str__(self):
         s = type(self).__name__ + '('
         s += 'subcarriers={}'.format(self._fft_len)
-        s += ', mean_gain={:.2f}'.format(np.mean(self._freq_gains))
+        s += ', mean_gain={:.2f}'.format(np.mean(self.freq_domain_gains()))
         return s + ')'
 
     def state(self):
         return self._channel.state()
 
-    def step(self, time_delta=1.e-3):
-        self._channel.step(time_delta)
+    def dynamic_state(self):
+        s = self._channel.dynamic_state()
+        s.update({'freq_taps': self.freq_domain_taps(), 'freq_gains': self.freq_domain_gains()})
+        return s
+
+    def set_dynamic_state(self, dynamic_state):
+        self._channel.set_dynamic_state(dynamic_state)
+        self._freq_taps = np.array(dynamic_state['freq_taps'], dtype=self._freq_taps.dtype)
+        self._freq_gains = np.array(dynamic_state['freq_gains'], dtype=self._freq_gains.dtype)
+        self._stale = False
+
+    def step(self, time_delta=1.e-3, steps=1):
+        self._channel.step(time_delta, steps)
+        self._stale = True
+
+    def seek(self, slot):
+        self._channel.seek(slot)
+        self._stale = True
+
+    def _update_freq_domain(self):
         self._freq_taps = self.calculate_freq_domain_taps()
         self._freq_gains = self.calculate_freq_domain_gains()
+        self._stale = False
 
     def calculate_freq_domain_taps(self):
-        return np.fft.fft(self.time_domain_taps(),
-                          self._fft_len).astype(np.complex64)
+        if self._method == 'dft':
+            indices, taps = self._channel.sparse_channel_taps()
+            return calculate_partial_dft(taps, indices, self._fft_len,
+                                         self._subcarrier_indices)
+        if self._workers is None:
+            freq_taps = np.fft.fft(self.time_domain_taps(), self._fft_len)
+        else:
+            freq_taps = scipy.fft.fft(self.time_domain_taps(), self._fft_len,
+                                      workers=self._workers)
+        freq_taps = freq_taps.astype(np.complex64)
+        if self._subcarrier_indices is not None:
+            freq_taps = freq_taps[self._subcarrier_indices]
+        return freq_taps
 
     def calculate_freq_domain_gains(self):
         return self._freq_taps.real ** 2 + self._freq_taps.imag ** 2
@@ -50,6 +140,18 @@ class FrequencyDomainChannel(object):
     def subcarriers(self):
         return self._fft_len
 
+    def subcarrier_indices(self):
+        if self._subcarrier_indices is None:
+            return np.arange(self._fft_len)
+        return self._subcarrier_indices
+
+    def set_subcarrier_indices(self, subcarrier_indices):
+        self._subcarrier_indices = subcarrier_indices
+        self._update_freq_domain()
+
+    def time_variant_channel(self):
+        return self._channel
+
     def time_domain_length(self):
         return self._channel.channel_length()
 
@@ -57,7 +159,11 @@ class FrequencyDomainChannel(object):
         return self._channel.channel_taps()
 
     def freq_domain_taps(self):
+        if self._stale:
+            self._update_freq_domain()
         return self._freq_taps
 
     def freq_domain_gains(self):
+        if self._stale:
+            self._update_freq_domain()
         return self._freq_gains
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright 2026 Johannes Demel.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+"""
+Inter-carrier interference (ICI) of OFDM over a channel that varies within a symbol.
+
+The taps vary linearly within an OFDM symbol of `N + cp` samples, from the taps at its start to the taps at its end.
+The end taps are one step of the coherent fading channel over the symbol duration, i.e. the start of the next symbol.
+With the taps `h(s) = h_start + (s + 1/2) / (N + cp) (h_end - h_start)` at sample `s` of the symbol,
+subcarrier `k` receives
+
+    Y_k = A_k X_k + sum_{q != 0} xi_q D_{k-q} X_{k-q},    xi_q = -1 / ((1 - exp(-2j pi q / N)) (N + cp))
+
+with `A` the channel in the middle of the symbol body and `D = H_end - H_start`.
+`xi_q` decays with `1 / q`, thus only the `2 Q` nearest subcarriers are kept and the cost is `O(N Q)` per symbol.
+"""
+
+import numpy as np
+
+from .equalizer import FrequencyDomainEqualizer
+
+
+def ici_coefficients(subcarriers, cp_length=0, ici_bandwidth=2):
+    """ICI coefficients `xi_q` for `q = -Q, ..., Q` with `xi_0 = 0`, `Q = ici_bandwidth`."""
+    offsets = np.arange(-ici_bandwidth, ici_bandwidth + 1)
+    # a band that wraps around covers every subcarrier offset only once.
+    offsets = offsets[np.sort(np.unique(offsets % subcarriers, return_index=True)[1])]
+    coefficients = np.zeros(offsets.size, dtype=np.complex128)
+    nonzero = offsets % subcarriers != 0
+    coefficients[nonzero] = -1. / ((1. - np.exp(-2.j * np.pi * offsets[nonzero] / subcarriers))
+                                   * (subcarriers + cp_length))
+    return offsets, coefficients
+
+
+def banded_ici(symbols, offsets, coefficients):
+    """ICI `sum_q xi_q symbols[..., k - q]` per subcarrier of OFDM symbols `(..., N)`, circular in `k`."""
+    res = np.zeros_like(symbols)
+    for q, c in zip(offsets, coefficients):
+        if c != 0.:
+            res += c * np.roll(symbols, q, axis=-1)
+    return res
+
+
+class IntercarrierInterferenceChannel(object):
+    """IntercarrierInterferenceChannel
+
+    Frequency domain OFDM channel with ICI due to Doppler.
+    awgn_channel: frequency domain AWGN.
+    fading_channel: `FrequencyDomainChannel` of a `CoherentTimeVariantChannel` with all subcarriers.
+    symbol_duration: duration of one OFDM symbol including the CP, `(subcarriers + cp_length) / bandwidth`.
+    ici_bandwidth: number of neighbouring subcarriers `Q` on each side that interfere,
+    `Q >= subcarriers // 2` is the exact model for linearly varying taps.
+    The fading channel advances by `symbol_duration` per OFDM symbol. The equalizer uses the channel
+    in the middle of each symbol and treats ICI as noise.
+    """
+
+    def __init__(self, awgn_channel, fading_channel, symbol_duration, cp_length=0, ici_bandwidth=2,
+                 equalizer_type='MF'):
+        self._awgn_channel = awgn_channel
+        self._channel = fading_channel
+        self._symbol_duration = symbol_duration
+        self._cp_length = cp_length
+        self._ici_bandwidth = min(ici_bandwidth, self.subcarriers() // 2)
+        self._offsets, self._coefficients = ici_coefficients(self.subcarriers(), cp_length, self._ici_bandwidth)
+        self._coefficients = self._coefficients.astype(np.complex64)
+        self._equalizer = FrequencyDomainEqualizer(equalizer_type)
+        self._mid_taps = None
+
+    def state(self):
+        s = self._awgn_channel.state()
+        s.update(self._channel.state())
+        s.update(self._equalizer.state())
+        s['symbol_duration'] = self._symbol_duration
+        s['cp_length'] = self._cp_length
+        s['ici_bandwidth'] = self._ici_bandwidth
+        return s
+
+    def dynamic_state(self):
+        s = self._channel.dynamic_state()
+        s.update(self._awgn_channel.dynamic_state())
+        return s
+
+    def set_dynamic_state(self, dynamic_state):
+        self._channel.set_dynamic_state(dynamic_state)
+        self._awgn_channel.set_dynamic_state(dynamic_state)
+
+    def step(self, time_delta=1.e-3, steps=1):
+        self._awgn_channel.step(time_delta, steps)
+        self._channel.step(time_delta, steps)
+
+    def seek(self, slot):
+        self._awgn_channel.seek(slot)
+        self._channel.seek(slot)
+
+    def snr(self):
+        return self._awgn_channel.snr()
+
+    def subcarriers(self):
+        return self._channel.subcarriers()
+
+    def ici_bandwidth(self):
+        return self._ici_bandwidth
+
+    def ici_coefficients(self):
+        return self._offsets, self._coefficients
+
+    def channel_taps(self):
+        return self._channel.time_domain_taps()
+
+    def channel_length(self):
+        return self._channel.time_domain_length()
+
+    def memory(self):
+        """ICI stays within an OFDM symbol, chunks of full symbols are independent."""
+        return 0
+
+    def freq_domain_taps(self):
+        return self._channel.freq_domain_taps()
+
+    def freq_domain_gains(self):
+        return self._channel.freq_domain_gains()
+
+    def mid_symbol_taps(self):
+        """Channel `(num_symbols, subcarriers)` in the middle of every symbol of the last `transmit` call."""
+        return self._mid_taps
+
+    def symbol_taps(self, num_symbols):
+        """Channel at the `num_symbols + 1` symbol boundaries, advances the fading channel by `num_symbols`."""
+        freq_taps = np.empty((num_symbols + 1, self.subcarriers()), dtype=np.complex64)
+        freq_taps[0] = self._channel.freq_domain_taps()
+        for i in range(num_symbols):
+            self._channel.step(self._symbol_duration)
+            freq_taps[i + 1] = self._channel.freq_domain_taps()
+        return freq_taps
+
+    def transmit(self, tx_mod, out=None):
+        tx_mod = np.asarray(tx_mod)
+        subcarriers = self.subcarriers()
+        if tx_mod.size % subcarriers != 0:
+            raise ValueError('Expected full OFDM symbols with {} subcarriers, got {} symbols'.format(
+                subcarriers, tx_mod.size))
+        tx_mod = tx_mod.reshape((-1, subcarriers))
+        freq_taps = self.symbol_taps(tx_mod.shape[0])
+        delta = freq_taps[1:] - freq_taps[:-1]
+        # the channel in the middle of the symbol body, after the CP.
+        self._mid_taps = freq_taps[:-1] + (self._cp_length + .5 * subcarriers) / (subcarriers + self._cp_length) * delta
+        rx_mod = self._mid_taps * tx_mod + banded_ici(delta * tx_mod, self._offsets, self._coefficients)
+        rx_mod = self._awgn_channel.transmit(rx_mod.reshape(-1))
+        rx_mod = self._equalizer.equalize(rx_mod, self._mid_taps.reshape(-1), self._awgn_channel.variance())
+        if out is not None:
+            out[:] = rx_mod
+            return out
+        return rx_mod
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright 2026 Johannes Demel.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+"""
+Importance sampling for very low error rates.
+
+The biased channels draw noise with a larger variance and fading with a smaller variance, i.e. deep fades.
+They report the log-likelihood ratio `log p(x) / q(x)` of their draws, i.e. the log-weight of a frame.
+`ImportanceSamplingEstimator` then estimates the error rate as the weighted mean of the frame errors.
+
+A complex Gaussian draw `x` with variance `v` under the nominal and `s v` under the biased density has the log-weight
+`-|x|^2 / v + |x|^2 / (s v) + log(s)`.
+"""
+
+import numpy as np
+
+from .awgn import AWGN, get_complex_noise_matrix
+from .timevariantchannel import TimeVariantChannel
+
+
+def gaussian_log_weights(samples, variance, scale, axis=None):
+    """Sum of the log-likelihood ratios of complex Gaussian `samples` drawn with `scale * variance` over `axis`."""
+    power = samples.real.astype(np.float64) ** 2 + samples.imag.astype(np.float64) ** 2
+    num_samples = power.size if axis is None else power.shape[axis]
+    return -np.sum(power, axis=axis) * (1. - 1. / scale) / variance + num_samples * np.log(scale)
+
+
+def importance_log_weights(*components):
+    """Sum the log-weights of all components that sample with a bias."""
+    res = 0.
+    for c in components:
+        if hasattr(c, 'log_weights'):
+            res = res + c.log_weights()
+    return res
+
+
+class ImportanceSamplingAWGN(AWGN):
+    """ImportanceSamplingAWGN
+
+    AWGN with the noise variance scaled by `noise_scale`, e.g. 2. to 4. for low error rates.
+    The log-weights accumulate over all `transmit` calls of a frame, `step` starts a new frame.
+    Inputs of shape `(frames, N)` yield one log-weight per frame.
+    """
+
+    def __init__(self, ebn0_db, effective_rate=1., subcarriers=1, noise_scale=1., stream=None):
+        super(ImportanceSamplingAWGN, self).__init__(ebn0_db, effective_rate, subcarriers, stream=stream)
+        if noise_scale <= 0.:
+            raise ValueError('noise_scale must be positive, got {}'.format(noise_scale))
+        self._noise_scale = noise_scale
+        self._log_weights = 0.
+
+    def state(self):
+        s = super(ImportanceSamplingAWGN, self).state()
+        s['noise_scale'] = self._noise_scale
+        return s
+
+    def log_weights(self):
+        return self._log_weights
+
+    def dynamic_state(self):
+        """Also the log-weights accumulated in the current frame."""
+        s = super(ImportanceSamplingAWGN, self).dynamic_state()
+        s['noise_log_weights'] = np.asarray(self._log_weights, dtype=np.float64)
+        return s
+
+    def set_dynamic_state(self, dynamic_state):
+        super(ImportanceSamplingAWGN, self).set_dynamic_state(dynamic_state)
+        if 'noise_log_weights' in dynamic_state:
+            log_weights = np.array(dynamic_state['noise_log_weights'], dtype=np.float64)
+            self._log_weights = float(log_weights) if log_weights.ndim == 0 else log_weights
+
+    def step(self, time_delta=1.e-3, steps=1):
+        super(ImportanceSamplingAWGN, self).step(time_delta, steps)
+        self._log_weights = 0.
+
+    def transmit(self, tx_mod, out=None):
+        noise = get_complex_noise_matrix(tx_mod.shape, self._sigma * np.sqrt(self._noise_scale),
+                                         tx_mod.dtype, self._rng)
+        self._log_weights = self._log_weights + gaussian_log_weights(noise, self._variance,
+                                                                     self._noise_scale, axis=-1)
+        return np.add(tx_mod, noise, out=out)
+
+
+class ImportanceSamplingTimeVariantChannel(TimeVariantChannel):
+    """ImportanceSamplingTimeVariantChannel
+
+    Independent Rayleigh fading with the variance of the fading state scaled by `fading_scale`,
+    e.g. 0.1 to 0.01 for deep fades. `log_weights` has the batch shape, one log-weight per link.
+    """
+
+    def __init__(self, power_delay_profile, fading_scale=1., batch_shape=(), stream=None):
+        if fading_scale <= 0.:
+            raise ValueError('fading_scale must be positive, got {}'.format(fading_scale))
+        self._fading_scale = fading_scale
+        super(ImportanceSamplingTimeVariantChannel, self).__init__(power_delay_profile, batch_shape, stream)
+        # redraw the biased initial state from a fresh slot 0 generator, i.e. exactly like `seek(0)`.
+        if stream is not None:
+            self._rng = stream.generator(0)
+        self.update_channel_state()
+        self.update_channel_taps()
+
+    def state(self):
+        s = super(ImportanceSamplingTimeVariantChannel, self).state()
+        s['fading_scale'] = self._fading_scale
+        return s
+
+    def log_weights(self):
+        return self._log_weights
+
+    def set_dynamic_state(self, dynamic_state):
+        super(ImportanceSamplingTimeVariantChannel, self).set_dynamic_state(dynamic_state)
+        self._log_weights = gaussian_log_weights(self._channel_state, 1., self._fading_scale, axis=-1)
+
+    def update_channel_state(self, time_delta=1.e-3, steps=1):
+        self._channel_state = get_complex_noise_matrix(self.state_shape(), np.sqrt(self._fading_scale),
+                                                       rng=self._rng)
+        self._log_weights = gaussian_log_weights(self._channel_state, 1., self._fading_scale, axis=-1)
+
+
+class ImportanceSamplingEstimator(object):
+    """ImportanceSamplingEstimator
+
+    Streaming estimate of an error rate from per-frame errors and log-weights.
+
+    The estimate is the mean of `w e`, its variance `var(w e) / n`.
+    The effective sample size `(sum w) ** 2 / sum w ** 2` and the mean weight, which must be close to 1,
+    indicate a too strong bias.
+    """
+
+    def __init__(self):
+        self._num_frames = 0
+        self._sum = 0.
+        self._sum_squares = 0.
+        self._sum_weights = 0.
+        self._sum_squared_weights = 0.
+
+    def update(self, errors, log_weights):
+        errors = np.asarray(errors, dtype=np.float64)
+        weights = np.broadcast_to(np.exp(log_weights), errors.shape)
+        weighted = weights * errors
+        self._num_frames += errors.size
+        self._sum += np.sum(weighted)
+        self._sum_squares += np.sum(weighted ** 2)
+        self._sum_weights += np.sum(weights)
+        self._sum_squared_weights += np.sum(weights ** 2)
+
+    def num_frames(self):
+        return self._num_frames
+
+    def estimate(self):
+        return self._sum / max(self._num_frames, 1)
+
+    def variance(self):
+        if self._num_frames < 2:
+            return np.inf
+        mean = self.estimate()
+        return max(self._sum_squares / self._num_frames - mean ** 2, 0.) / (self._num_frames - 1)
+
+    def relative_error(self):
+        """Standard deviation of the estimate relative to the estimate."""
+        estimate = self.estimate()
+        return np.sqrt(self.variance()) / estimate if estimate > 0. else np.inf
+
+    def effective_sample_size(self):
+        if self._sum_squared_weights == 0.:
+            return 0.
+        return self._sum_weights ** 2 / self._sum_squared_weights
+
+    def mean_weight(self):
+        return self._sum_weights / max(self._num_frames, 1)
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright 2026 Johannes Demel.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+"""
+Co-channel interference with one desired link and `K` interferers.
+
+All `K + 1` fading links are one batched fading channel with batch shape `(K + 1, )`.
+Link 0 is the desired link. The input has the shape `(K + 1, N)`, one row per transmitter.
+Interferer powers are relative to the desired signal.
+Noise is added once to the sum of all links.
+"""
+
+import numpy as np
+
+from .equalizer import FrequencyDomainEqualizer
+from .frequencydomainchannel import calculate_partial_dft
+
+
+def interference_amplitudes(interference_powers_db, num_interferers):
+    """Amplitude scale per link, the desired link first."""
+    powers_db = np.broadcast_to(np.asarray(interference_powers_db, dtype=float), (num_interferers, ))
+    return np.concatenate(([1.], 10. ** (powers_db / 20.))).astype(np.float32)
+
+
+class InterferenceChannel(object):
+    """InterferenceChannel
+
+    Time domain interference channel.
+    awgn_channel: adds noise once after all links are summed up.
+    fading_channel: `TimeVariantChannel` with batch shape `(K + 1, )`.
+    interference_powers_db: scalar or `K` interferer powers in dB relative to the desired link.
+    """
+
+    def __init__(self, awgn_channel, fading_channel, interference_powers_db=0.):
+        self._awgn_channel = awgn_channel
+        self._channel = fading_channel
+        if len(self._channel.batch_shape()) != 1:
+            raise ValueError('Expected a fading channel with batch shape (K + 1, ), got {}'.format(
+                self._channel.batch_shape()))
+        self._amplitudes = interference_amplitudes(interference_powers_db, self.num_interferers())
+
+    def state(self):
+        s = self._awgn_channel.state()
+        s.update(self._channel.state())
+        s['num_interferers'] = self.num_interferers()
+        s['interference_powers_db'] = 20. * np.log10(self._amplitudes[1:])
+        return s
+
+    def dynamic_state(self):
+        s = self._channel.dynamic_state()
+        s.update(self._awgn_channel.dynamic_state())
+        return s
+
+    def set_dynamic_state(self, dynamic_state):
+        self._channel.set_dynamic_state(dynamic_state)
+        self._awgn_channel.set_dynamic_state(dynamic_state)
+
+    def num_interferers(self):
+        return self._channel.batch_shape()[0] - 1
+
+    def interference_amplitudes(self):
+        return self._amplitudes
+
+    def step(self, time_delta=1.e-3, steps=1):
+        self._awgn_channel.step(time_delta, steps)
+        self._channel.step(time_delta, steps)
+
+    def seek(self, slot):
+        self._awgn_channel.seek(slot)
+        self._channel.seek(slot)
+
+    def snr(self):
+        return self._awgn_channel.snr()
+
+    def channel_taps(self):
+        return self._channel.channel_taps()
+
+    def channel_length(self):
+        return self._channel.channel_length()
+
+    def sinr(self):
+        """Per-subcarrier SINR (linear) of an OFDM system with `subcarriers` subcarriers.
+
+        The time domain AWGN noise is scaled with the number of subcarriers, thus it is scaled back here.
+        """
+        subcarriers = self._awgn_channel.state()['subcarriers']
+        indices, taps = self._channel.sparse_channel_taps()
+        freq_taps = calculate_partial_dft(self._amplitudes[:, None] * taps, indices, subcarriers)
+        gains = freq_taps.real ** 2 + freq_taps.imag ** 2
+        return gains[0] / (np.sum(gains[1:], axis=0) + subcarriers * self._awgn_channel.variance())
+
+    def transmit(self, tx_symbols, out=None):
+        tx_symbols = np.asarray(tx_symbols)
+        if tx_symbols.shape[0] != self.num_interferers() + 1:
+            raise ValueError('Expected {} TX streams, got {}'.format(
+                self.num_interferers() + 1, tx_symbols.shape[0]))
+        indices, taps = self._channel.sparse_channel_taps()
+        taps = self._amplitudes[:, None] * taps
+        num_samples = tx_symbols.shape[-1]
+        rx = np.zeros(num_samples, dtype=np.result_type(tx_symbols, taps))
+        # one matrix-vector product per tap sums up all links at once.
+        for i, t in zip(indices, taps.T):
+            if i < num_samples:
+                rx[i:] += t @ tx_symbols[:, 0:num_samples - i]
+        return self._awgn_channel.transmit(rx, out)
+
+
+class FrequencyDomainInterferenceChannel(object):
+    """FrequencyDomainInterferenceChannel
+
+    Frequency domain interference channel, the input consists of full OFDM symbols per link.
+    fading_channel: `FrequencyDomainChannel` with batch shape `(K + 1, )`.
+    The equalizer only knows the desired link. The MMSE equalizer uses the interference plus noise power per subcarrier.
+    """
+
+    def __init__(self, awgn_channel, fading_channel, interference_powers_db=0., equalizer_type='MF'):
+        self._awgn_channel = awgn_channel
+        self._channel = fading_channel
+        batch_shape = self._channel.time_variant_channel().batch_shape()
+        if len(batch_shape) != 1:
+            raise ValueError('Expected a fading channel with batch shape (K + 1, ), got {}'.format(batch_shape))
+        self._amplitudes = interference_amplitudes(interference_powers_db, self.num_interferers())
+        self._equalizer = FrequencyDomainEqualizer(equalizer_type)
+
+    def state(self):
+        s = self._awgn_channel.state()
+        s.update(self._channel.state())
+        s.update(self._equalizer.state())
+        s['num_interferers'] = self.num_interferers()
+        s['interference_powers_db'] = 20. * np.log10(self._amplitudes[1:])
+        return s
+
+    def dynamic_state(self):
+        s = self._channel.dynamic_state()
+        s.update(self._awgn_channel.dynamic_state())
+        return s
+
+    def set_dynamic_state(self, dynamic_state):
+        self._channel.set_dynamic_state(dynamic_state)
+        self._awgn_channel.set_dynamic_state(dynamic_state)
+
+    def num_interferers(self):
+        return self._channel.time_variant_channel().batch_shape()[0] - 1
+
+    def interference_amplitudes(self):
+        return self._amplitudes
+
+    def step(self, time_delta=1.e-3, steps=1):
+        self._awgn_channel.step(time_delta, steps)
+        self._channel.step(time_delta, steps)
+
+    def seek(self, slot):
+        self._awgn_channel.seek(slot)
+        self._channel.seek(slot)
+
+    def snr(self):
+        return self._awgn_channel.snr()
+
+    def channel_taps(self):
+        return self._channel.time_domain_taps()
+
+    def channel_length(self):
+        return self._channel.time_domain_length()
+
+    def interference_plus_noise(self):
+        """Interference plus noise power per subcarrier."""
+        gains = self._channel.freq_domain_gains()
+        return np.sum(self._amplitudes[1:, None] ** 2 * gains[1:], axis=0) + self._awgn_channel.variance()
+
+    def sinr(self):
+        """Per-subcarrier SINR (linear) `|H_0|^2 / (sum_k P_k |H_k|^2 + sigma^2)`."""
+        return self._channel.freq_domain_gains()[0] / self.interference_plus_noise()
+
+    def transmit(self, tx_mod, out=None):
+        tx_mod = np.asarray(tx_mod)
+        freq_taps = self._channel.freq_domain_taps()
+        num_links, num_subcarriers = freq_taps.shape
+        if tx_mod.shape[0] != num_links or tx_mod.shape[-1] % num_subcarriers != 0:
+            raise ValueError('Expected {} TX streams of full OFDM symbols with {} subcarriers, got {}'.format(
+                num_links, num_subcarriers, tx_mod.shape))
+        tx_mod = tx_mod.reshape((num_links, -1, num_subcarriers))
+        rx_mod = np.einsum('ks,kms->ms', self._amplitudes[:, None] * freq_taps, tx_mod).reshape(-1)
+        rx_mod = self._awgn_channel.transmit(rx_mod)
+        reps = rx_mod.size // num_subcarriers
+        rx_mod = self._equalizer.equalize(
+            rx_mod, np.tile(freq_taps[0], reps), np.tile(self.interference_plus_noise(), reps))
+        if out is not None:
+            out[:] = rx_mod
+            return out
+        return rx_mod
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright 2026 Johannes Demel.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+"""
+Adapters for interleaved I/Q sample buffers and capture files, e.g. SDR recordings.
+
+Interleaved float32 I/Q is the memory layout of complex64. Thus, float32 buffers and memory-mapped files
+are used as complex64 views without any copy, and channels write their output directly into the output file.
+int16 I/Q is converted chunk-wise with a single scaling pass per direction.
+Files are processed chunk by chunk, memory stays constant regardless of the file size.
+"""
+
+import os
+
+import numpy as np
+
+IQ_DTYPES = {'float32': np.float32, 'int16': np.int16}
+INT16_SCALE = 32768.
+
+
+def _iq_dtype(dtype):
+    dtype = np.dtype(IQ_DTYPES.get(dtype, dtype) if isinstance(dtype, str) else dtype)
+    if dtype not in (np.dtype(np.float32), np.dtype(np.int16)):
+        raise ValueError('Unsupported I/Q sample type {}, choose float32 or int16'.format(dtype))
+    return dtype
+
+
+def iq_view(buffer):
+    """Complex64 view of an interleaved float32 I/Q buffer, no copy."""
+    buffer = np.asarray(buffer)
+    if buffer.dtype != np.float32:
+        raise ValueError('Only float32 I/Q buffers can be viewed as complex64, got {}'.format(buffer.dtype))
+    return buffer.reshape(-1).view(np.complex64)
+
+
+def iq_to_complex(buffer, out=None, scale=None):
+    """iq_to_complex
+
+    Complex64 samples from an interleaved float32 or int16 I/Q buffer.
+    float32 without `out` returns a view. int16 is scaled by `1 / 32768` unless `scale` is given.
+    """
+    buffer = np.asarray(buffer).reshape(-1)
+    if buffer.dtype == np.float32 and out is None and scale is None:
+        return iq_view(buffer)
+    _iq_dtype(buffer.dtype)
+    if scale is None:
+        scale = 1. / INT16_SCALE if buffer.dtype == np.int16 else 1.
+    if out is None:
+        out = np.empty(buffer.size // 2, dtype=np.complex64)
+    np.multiply(buffer, np.float32(scale), out=out.view(np.float32))
+    return out
+
+
+def complex_to_iq(samples, out, scale=None):
+    """complex_to_iq
+
+    Write complex samples into the interleaved float32 or int16 I/Q buffer `out`.
+    int16 is scaled by 32768 unless `scale` is given, rounded and saturated.
+    """
+    out = out.reshape(-1)
+    values = np.asarray(samples, dtype=np.complex64).view(np.float32)
+    if out.dtype == np.float32:
+        if scale is None:
+            out[:] = values
+        else:
+            np.multiply(values, np.float32(scale), out=out)
+        return out
+    _iq_dtype(out.dtype)
+    if scale is None:
+        scale = INT16_SCALE
+    scaled = np.multiply(values, np.float32(scale))
+    np.rint(scaled, out=scaled)
+    np.clip(scaled, -32768., 32767., out=scaled)
+    out[:] = scaled
+    return out
+
+
+class IQReader(object):
+    """IQReader
+
+    Memory-mapped interleaved I/Q capture file. `chunks` yields complex64 chunks of `chunk_size` samples,
+    views into the file for float32 and one reused conversion buffer for int16.
+    mode: 'r+' maps the file writable, e.g. to write the output back in place via `IQWriter(..., data=values())`.
+    """
+
+    def __init__(self, filename, dtype='float32', chunk_size=2 ** 16, scale=None, offset=0, mode='r'):
+        self._dtype = _iq_dtype(dtype)
+        self._chunk_size = chunk_size
+        self._scale = scale
+        self._data = np.memmap(filename, dtype=self._dtype, mode=mode, offset=offset)
+        if self._data.size % 2 != 0:
+            raise ValueError('Interleaved I/Q files have an even number of values, got {}'.format(self._data.size))
+
+    def num_samples(self):
+        return self._data.size // 2
+
+    def values(self):
+        """The mapped interleaved values."""
+        return self._data
+
+    def chunks(self):
+        buffer = None
+        for start in range(0, self.num_samples(), self._chunk_size):
+            stop = min(start + self._chunk_size, self.num_samples())
+            raw = self._data[2 * start:2 * stop]
+            if self._dtype == np.float32 and self._scale is None:
+                yield iq_view(raw)
+                continue
+            if buffer is None:
+                buffer = np.empty(self._chunk_size, dtype=np.complex64)
+            yield iq_to_complex(raw, buffer[0:stop - start], self._scale)
+
+
+class IQWriter(object):
+    """IQWriter
+
+    Memory-mapped interleaved I/Q output file of `num_samples` samples.
+    For float32, `view` returns a complex64 view into the file, i.e. a channel can write its output there directly.
+    data: already mapped interleaved values to write to instead of creating `filename`, e.g. for in-place processing.
+    """
+
+    def __init__(self, filename, num_samples, dtype='float32', scale=None, data=None):
+        self._dtype = _iq_dtype(dtype)
+        self._scale = scale
+        if data is None:
+            data = np.memmap(filename, dtype=self._dtype, mode='w+', shape=(2 * num_samples, ))
+        elif data.dtype != self._dtype or data.size != 2 * num_samples:
+            raise ValueError('Expected {} {} values, got {} {} values'.format(
+                2 * num_samples, self._dtype, data.size, data.dtype))
+        self._data = data
+
+    def num_samples(self):
+        return self._data.size // 2
+
+    def view(self, start, stop):
+        """Complex64 view of the samples `[start, stop)` or `None` if the file format requires a conversion."""
+        if self._dtype != np.float32 or self._scale is not None:
+            return None
+        return iq_view(self._data[2 * start:2 * stop])
+
+    def write(self, start, samples):
+        complex_to_iq(samples, self._data[2 * start:2 * (start + len(samples))], self._scale)
+
+    def flush(self):
+        self._data.flush()
+
+    def close(self):
+        self.flush()
+        del self._data
+
+
+def channel_memory(channel):
+    """channel_memory
+
+    Number of past input samples a channel needs to continue its convolution in the next chunk, 0 if memoryless.
+    Only channels with a `memory` method can be streamed in chunks, all others raise a ValueError,
+    e.g. wrappers that change the stream layout.
+    """
+    if not hasattr(channel, 'memory'):
+        raise ValueError('{} cannot be streamed in chunks, it does not report its memory!'.format(
+            type(channel).__name__))
+    return channel.memory()
+
+
+def process_iq_file(channel, input_filename, output_filename, dtype='float32', output_dtype=None,
+                    chunk_size=2 ** 16, input_scale=None, output_scale=None):
+    """process_iq_file
+
+    Stream an I/Q capture through a single antenna `channel` chunk by chunk and write the output
+    in the same interleaved format, or in `output_dtype`.
+    Memoryless channels, e.g. AWGN, transmit directly from the input view into the output view.
+    Time domain fading channels carry the last `memory()` input samples into the next chunk,
+    thus the output equals one transmit call on the whole file. See `channel_memory`.
+    Frequency domain channels require a `chunk_size` that is a multiple of the number of subcarriers.
+    If `output_filename` is the input file, every chunk is written back in place, this requires the same sample type.
+    Returns the number of processed samples.
+    """
+    mimo = hasattr(channel, 'tx_antennas')
+    if mimo and (channel.tx_antennas() != 1 or channel.rx_antennas() != 1):
+        raise ValueError('Only single antenna channels can process I/Q files!')
+    memory = channel_memory(channel)
+    in_place = os.path.exists(output_filename) and os.path.samefile(input_filename, output_filename)
+    if in_place:
+        if _iq_dtype(output_dtype or dtype) != _iq_dtype(dtype):
+            raise ValueError('In-place processing requires the same input and output sample type!')
+        # one writable map, a second map with mode 'w+' would truncate the input.
+        reader = IQReader(input_filename, dtype, chunk_size, input_scale, mode='r+')
+        writer = IQWriter(output_filename, reader.num_samples(), dtype, output_scale, data=reader.values())
+    else:
+        reader = IQReader(input_filename, dtype, chunk_size, input_scale)
+        writer = IQWriter(output_filename, reader.num_samples(), output_dtype or dtype, output_scale)
+    buffer = np.zeros(chunk_size + memory, dtype=np.complex64)
+    rx_buffer = np.empty(chunk_size + memory, dtype=np.complex64)
+
+    start = 0
+    for chunk in reader.chunks():
+        stop = start + chunk.size
+        target = writer.view(start, stop)
+        if memory == 0 and not mimo:
+            rx = channel.transmit(chunk, out=target if target is not None else rx_buffer[0:chunk.size])
+        else:
+            # copied before the output overwrites the chunk, also in place.
+            buffer[memory:memory + chunk.size] = chunk
+            tx = buffer[0:memory + chunk.size]
+            if mimo:
+                rx = channel.transmit([tx], out=[rx_buffer[0:tx.size]])[0]
+            else:
+                rx = channel.transmit(tx, out=rx_buffer[0:tx.size])
+            rx = rx[memory:]
+            # keep the history for the next chunk.
+            buffer[0:memory] = tx[tx.size - memory:]
+        if target is None:
+            writer.write(start, rx)
+        elif rx is not target:
+            target[:] = rx
+        start = stop
+    writer.close()
+    return start
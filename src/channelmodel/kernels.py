@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright 2026 Johannes Demel.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+"""
+Compute backends for the hot path of the channel models.
+
+A backend fuses the AR fading update, the MIMO convolution and the AWGN noise into single-pass kernels.
+The 'numpy' backend is the reference implementation and produces bit-exact the same results as the channel classes.
+The 'numba' backend compiles parallel kernels if numba is installed.
+It uses numba's own random generator, thus its results are only statistically equivalent and not reproducible.
+Use `verify_backend` to check a backend against the reference.
+"""
+
+import warnings
+
+import numpy as np
+
+from .awgn import get_complex_noise_matrix
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+# numba does not expose the state of its random generator, see `numba_random_used`.
+_numba_random_used = False
+
+
+def numba_random_used():
+    """True once the numba backend drew random numbers in this process, then its state cannot be restored."""
+    return _numba_random_used
+
+
+def _use_numba_random():
+    global _numba_random_used
+    _numba_random_used = True
+
+
+class NumpyBackend(object):
+    """NumpyBackend
+
+    The reference path. Every operation uses the same numpy calls in the same order as the channel classes.
+    """
+
+    def name(self):
+        return 'numpy'
+
+    def seed(self, seed):
+        np.random.seed(seed)
+
+    def ar_update(self, state, current_weight, next_weight):
+        """In place: `state = current_weight * state + next_weight * noise`."""
+        n = get_complex_noise_matrix(state.shape)
+        state *= current_weight
+        state += next_weight * n
+        return state
+
+    def add_noise(self, tx, sigma, out=None):
+        noise = get_complex_noise_matrix(tx.shape, sigma, tx.dtype)
+        return np.add(tx, noise, out=out)
+
+    def mimo_transmit(self, tx, taps, sigma, out=None):
+        """mimo_transmit
+
+        tx: `(tx_antennas, N)` samples
+        taps: `(rx_antennas, tx_antennas, L)` channel impulse responses
+        sigma: noise standard deviation, `0.` disables noise.
+        Returns `(rx_antennas, N)` samples.
+        """
+        rx = []
+        for i, row in enumerate(taps):
+            r = np.sum([np.convolve(s, h, 'full')[0:s.size]
+                        for h, s in zip(row, tx)], axis=0)
+            if sigma > 0.:
+                r = self.add_noise(r, sigma)
+            if out is not None:
+                out[i][:] = r
+            rx.append(r)
+        return rx if out is None else out
+
+
+if numba is not None:
+    @numba.njit(cache=True)
+    def _numba_seed(seed):
+        np.random.seed(seed)
+
+    @numba.njit(parallel=True, cache=True)
+    def _numba_ar_update(state, current_weight, next_weight, dev):
+        for i in numba.prange(state.size):
+            n = np.random.normal(0., dev) + 1.j * np.random.normal(0., dev)
+            state[i] = current_weight * state[i] + next_weight * n
+
+    @numba.njit(parallel=True, cache=True)
+    def _numba_add_noise(tx, dev, out):
+        for i in numba.prange(tx.size):
+            out[i] = tx[i] + np.random.normal(0., dev) + 1.j * np.random.normal(0., dev)
+
+    @numba.njit(parallel=True, cache=True)
+    def _numba_mimo_transmit(tx, taps, dev, out):
+        rx_antennas, tx_antennas, num_taps = taps.shape
+        num_samples = tx.shape[1]
+        for idx in numba.prange(rx_antennas * num_samples):
+            r = idx // num_samples
+            n = idx % num_samples
+            acc = 0.j
+            for t in range(tx_antennas):
+                for k in range(min(num_taps, n + 1)):
+                    acc += taps[r, t, k] * tx[t, n - k]
+            if dev > 0.:
+                acc += np.random.normal(0., dev) + 1.j * np.random.normal(0., dev)
+            out[r, n] = acc
+
+
+class NumbaBackend(object):
+    """NumbaBackend
+
+    Fused, parallel kernels. Each kernel makes a single pass over memory.
+    Every numba thread draws from its own random generator, `seed` only seeds the calling thread.
+    Thus, results of the parallel kernels are not reproducible, use a factory `seed` for reproducible runs.
+    """
+
+    def __init__(self):
+        if numba is None:
+            raise ImportError('The numba backend requires numba!')
+
+    def name(self):
+        return 'numba'
+
+    def seed(self, seed):
+        _numba_seed(seed)
+
+    def ar_update(self, state, current_weight, next_weight):
+        flat = state.reshape(-1)
+        if not np.shares_memory(flat, state):
+            raise ValueError('The in-place AR update requires a state that flattens into a view!')
+        _use_numba_random()
+        _numba_ar_update(flat, current_weight, next_weight, np.sqrt(.5))
+        return state
+
+    def add_noise(self, tx, sigma, out=None):
+        if out is None:
+            out = np.empty_like(tx)
+        # reshape copies non-contiguous arrays, thus the kernel writes into a contiguous buffer first.
+        rx = out if out.flags.c_contiguous else np.empty(out.shape, dtype=out.dtype)
+        _use_numba_random()
+        _numba_add_noise(np.ascontiguousarray(tx).reshape(-1), np.sqrt(.5) * sigma, rx.reshape(-1))
+        if rx is not out:
+            out[...] = rx
+        return out
+
+    def mimo_transmit(self, tx, taps, sigma, out=None):
+        tx = np.ascontiguousarray(tx)
+        taps = np.ascontiguousarray(taps)
+        rx = out
+        if out is None or not isinstance(out, np.ndarray):
+            rx = np.empty((taps.shape[0], tx.shape[1]), dtype=np.result_type(tx, taps))
+        if sigma > 0.:
+            _use_numba_random()
+        _numba_mimo_transmit(tx, taps, np.sqrt(.5) * sigma, rx)
+        if out is not None and rx is not out:
+            for o, r in zip(out, rx):
+                o[:] = r
+            return out
+        return rx
+
+
+_backends = {'numpy': NumpyBackend, 'numba': NumbaBackend}
+
+
+def get_backend(backend=None):
+    """get_backend
+
+    Return a backend object for `backend` in ('numpy', 'numba') or pass through backend objects.
+    If numba is not available, 'numba' falls back to the numpy reference with a warning.
+    """
+    if backend is None:
+        backend = 'numpy'
+    if not isinstance(backend, str):
+        return backend
+    backend = backend.lower()
+    if backend not in _backends:
+        raise ValueError('Unknown backend "{}", choose one of {}'.format(backend, tuple(_backends.keys())))
+    if backend == 'numba' and numba is None:
+        warnings.warn('numba is not installed, falling back to the numpy backend!')
+        backend = 'numpy'
+    return _backends[backend]()
+
+
+def verify_backend(backend, num_samples=2 ** 16, rx_antennas=4, tx_antennas=2, num_taps=8, rtol=1.e-5):
+    """verify_backend
+
+    Compare `backend` against the numpy reference.
+    The noise-free convolution must match within `rtol`, noise and AR statistics must agree within 3 sigma.
+    Returns a dict of check name -> passed.
+    """
+    backend = get_backend(backend)
+    reference = NumpyBackend()
+    tx = get_complex_noise_matrix((tx_antennas, num_samples))
+    taps = get_complex_noise_matrix((rx_antennas, tx_antennas, num_taps))
+    expected = np.array(reference.mimo_transmit(tx, taps, 0.))
+    result = np.array(backend.mimo_transmit(tx, taps, 0.))
+    scale = np.amax(np.abs(expected))
+    checks = {'convolution': bool(np.amax(np.abs(result - expected)) <= rtol * scale)}
+
+    # The mean of N unit exponential variables has a standard deviation of 1/sqrt(N).
+    sigma = .5
+    noise = backend.add_noise(np.zeros(num_samples, dtype=np.complex64), sigma)
+    variance = np.mean(noise.real ** 2 + noise.imag ** 2) / sigma ** 2
+    checks['noise_variance'] = bool(np.abs(variance - 1.) < 3. / np.sqrt(num_samples))
+
+    # A stationary AR(1) process keeps unit variance.
+    state = get_complex_noise_matrix(num_samples)
+    for _ in range(8):
+        backend.ar_update(state, np.sqrt(.9), np.sqrt(.1))
+    variance = np.mean(state.real ** 2 + state.imag ** 2)
+    checks['ar_variance'] = bool(np.abs(variance - 1.) < 3. / np.sqrt(num_samples))
+    return checks
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright 2026 Johannes Demel.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+import numpy as np
+import scipy.constants as spc
+import scipy.fft
+
+
+class PathLoss(object):
+    """PathLoss
+
+    Log-distance path loss `PL(d) = PL(d0) + 10 n log10(d / d0)` in dB.
+
+    exponent: path loss exponent `n`, 2 for free space.
+    reference_loss_db: `PL(d0)`. If `None`, it is the free space loss at `reference_distance` and `carrier_freq`.
+    Distances below `reference_distance` are clipped to it.
+    """
+
+    def __init__(self, exponent=3., reference_distance=1., reference_loss_db=None, carrier_freq=None):
+        if reference_loss_db is None:
+            if carrier_freq is None:
+                raise ValueError('Either reference_loss_db or carrier_freq is required!')
+            reference_loss_db = 20. * np.log10(4. * np.pi * reference_distance * carrier_freq / spc.speed_of_light)
+        self._exponent = exponent
+        self._reference_distance = reference_distance
+        self._reference_loss_db = reference_loss_db
+
+    def state(self):
+        return {'path_loss_exponent': self._exponent,
+                'reference_distance': self._reference_distance,
+                'reference_loss_db': self._reference_loss_db}
+
+    def loss_db(self, distance):
+        distance = np.maximum(distance, self._reference_distance)
+        return self._reference_loss_db + 10. * self._exponent * np.log10(distance / self._reference_distance)
+
+
+class ShadowingMap(object):
+    """ShadowingMap
+
+    Log-normal shadowing with spatial correlation after Gudmundson, i.e. `R(d) = sigma^2 exp(-d / d_corr)`.
+
+    The map is generated once on a grid via FFT filtering of white Gaussian noise,
+    the grid is padded such that the circular FFT does not correlate opposite edges.
+    Lookups interpolate bilinearly and are vectorized over any number of positions.
+
+    sigma_db: shadowing standard deviation in dB.
+    decorrelation_distance: `d_corr` in meters.
+    size: `(width, height)` of the map in meters, starting at `origin`.
+    resolution: grid spacing in meters, defaults to a tenth of the decorrelation distance.
+    """
+
+    def __init__(self, sigma_db, decorrelation_distance, size, resolution=None, origin=(0., 0.)):
+        if resolution is None:
+            resolution = decorrelation_distance / 10.
+        self._sigma_db = sigma_db
+        self._decorrelation_distance = decorrelation_distance
+        self._size = tuple(size)
+        self._resolution = resolution
+        self._origin = np.asarray(origin, dtype=float)
+        self._map = self.generate_map()
+
+    def state(self):
+        return {'sigma_db': self._sigma_db,
+                'decorrelation_distance': self._decorrelation_distance,
+                'size': self._size,
+                'resolution': self._resolution}
+
+    def generate_map(self):
+        grid_shape = [int(np.ceil(s / self._resolution)) + 1 for s in self._size]
+        pad = int(np.ceil(5. * self._decorrelation_distance / self._resolution))
+        fft_shape = [scipy.fft.next_fast_len(n + pad) for n in grid_shape]
+
+        # correlation on the torus, distances wrap around.
+        axes = [np.minimum(np.arange(n), n - np.arange(n)) * self._resolution for n in fft_shape]
+        distance = np.hypot(axes[0][:, None], axes[1][None, :])
+        correlation = np.exp(-distance / self._decorrelation_distance)
+        psd = np.maximum(scipy.fft.fft2(correlation).real, 0.)
+
+        noise = np.random.normal(0., 1., fft_shape)
+        field = scipy.fft.ifft2(np.sqrt(psd) * scipy.fft.fft2(noise)).real
+        return (self._sigma_db * field[0:grid_shape[0], 0:grid_shape[1]]).astype(np.float32)
+
+    def map(self):
+        return self._map
+
+    def resolution(self):
+        return self._resolution
+
+    def shadowing_db(self, positions):
+        """Shadowing in dB at `positions` with shape `(..., 2)`. Positions outside the map are clipped to its edges."""
+        positions = np.asarray(positions, dtype=float)
+        coords = (positions - self._origin) / self._resolution
+        weights = []
+        indices = []
+        for axis, n in enumerate(self._map.shape):
+            c = np.clip(coords[..., axis], 0., n - 1.)
+            i = np.minimum(np.floor(c).astype(np.intp), n - 2)
+            indices.append(i)
+            weights.append(c - i)
+        (ix, iy), (wx, wy) = indices, weights
+        return (self._map[ix, iy] * (1. - wx) * (1. - wy) + self._map[ix + 1, iy] * wx * (1. - wy)
+                + self._map[ix, iy + 1] * (1. - wx) * wy + self._map[ix + 1, iy + 1] * wx * wy)
+
+
+class LargeScaleFading(object):
+    """LargeScaleFading
+
+    Path loss and optional shadowing towards a base station at `bs_position`.
+    """
+
+    def __init__(self, path_loss, shadowing_map=None, bs_position=(0., 0.)):
+        self._path_loss = path_loss
+        self._shadowing_map = shadowing_map
+        self._bs_position = np.asarray(bs_position, dtype=float)
+
+    def state(self):
+        s = self._path_loss.state()
+        if self._shadowing_map is not None:
+            s.update(self._shadowing_map.state())
+        return s
+
+    def loss_db(self, positions):
+        positions = np.asarray(positions, dtype=float)
+        distance = np.linalg.norm(positions - self._bs_position, axis=-1)
+        loss = self._path_loss.loss_db(distance)
+        if self._shadowing_map is not None:
+            loss = loss + self._shadowing_map.shadowing_db(positions)
+        return loss
+
+    def gain(self, positions):
+        return 10. ** (-self.loss_db(positions) / 10.)
+
+    def amplitude(self, positions):
+        return 10. ** (-self.loss_db(positions) / 20.)
+
+
+class LargeScaleFadingChannel(object):
+    """LargeScaleFadingChannel
+
+    Combine large scale fading with any small scale channel of this module.
+    The TX signal is scaled with the large scale amplitude at the current position
+    before the wrapped channel applies fading and noise.
+    Thus, the SNR of the wrapped channel is the SNR without any large scale loss.
+    """
+
+    def __init__(self, channel, large_scale_fading, position=(0., 0.)):
+        self._channel = channel
+        self._large_scale_fading = large_scale_fading
+        self.set_position(position)
+
+    def state(self):
+        s = self._channel.state()
+        s.update(self._large_scale_fading.state())
+        return s
+
+    def set_position(self, position):
+        self._position = np.asarray(position, dtype=float)
+        self._amplitude = float(self._large_scale_fading.amplitude(self._position))
+
+    def position(self):
+        return self._position
+
+    def loss_db(self):
+        return -20. * np.log10(self._amplitude)
+
+    def snr(self):
+        return self._channel.snr() - self.loss_db()
+
+    def channel_taps(self):
+        return self._channel.channel_taps()
+
+    def channel_length(self):
+        return self._channel.channel_length()
+
+    def step(self, time_delta=1.e-3, steps=1):
+        self._channel.step(time_delta, steps)
+
+    def transmit(self, tx_symbols, out=None):
+        return self._channel.transmit(self._amplitude * np.asarray(tx_symbols), out=out)
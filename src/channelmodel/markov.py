@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright 2026 Johannes Demel.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+"""
+Finite-state Markov approximation of a fading channel for very long per-slot traces.
+
+`fit_markov_model` simulates a batch of links with the full model of a `ChannelFactory` configuration,
+quantizes their effective gain into equiprobable states and counts the transitions between consecutive slots.
+Fitted models are cached per configuration.
+
+`MarkovChannelModel.generate` draws state sequences in blocks.
+It draws the sequence of visited states, i.e. the jump chain, with a vectorized prefix composition
+of random transition functions and the geometric sojourn times with one call per block.
+Thus, its cost scales with the number of state changes instead of the number of slots.
+"""
+
+import numpy as np
+
+from .frequencydomainchannel import cache_value
+
+_MAX_CACHED_MODELS = 16
+# states are stored as uint8 indices.
+MAX_STATES = np.iinfo(np.uint8).max + 1
+_model_cache = {}
+
+
+def mean_gain(fading_channel):
+    """Effective gain per link: mean power gain over subcarriers, antennas and taps respectively."""
+    if hasattr(fading_channel, 'freq_domain_gains'):
+        gains = fading_channel.freq_domain_gains()
+        return np.mean(gains.reshape(gains.shape[0], -1), axis=-1)
+    taps = fading_channel.channel_taps()
+    powers = (taps.real ** 2 + taps.imag ** 2).reshape(taps.shape[0], -1, taps.shape[-1])
+    return np.mean(np.sum(powers, axis=-1), axis=-1)
+
+
+def simulate_gains(factory, num_links=1024, num_steps=512, time_delta=1.e-3, gain_function=mean_gain):
+    """Effective gain traces of shape `(num_steps, num_links)` from the full channel model."""
+    fading_channel = factory.create_fading_channel((num_links, ))
+    gains = np.empty((num_steps, num_links))
+    for i in range(num_steps):
+        if i > 0:
+            fading_channel.step(time_delta)
+        gains[i] = gain_function(fading_channel)
+    return gains
+
+
+def quantize_gains(gains, thresholds):
+    return np.searchsorted(thresholds, gains).astype(np.uint8)
+
+
+def fading_statistics(gains, thresholds, time_delta):
+    """fading_statistics
+
+    Level crossing rate, i.e. downward crossings per second, and average fade duration in seconds
+    of gain traces `(num_steps, ...)` for every threshold.
+    """
+    gains = np.asarray(gains)
+    duration = (gains.shape[0] - 1) * np.prod(gains.shape[1:], dtype=int) * time_delta
+    lcr = np.zeros(len(thresholds))
+    afd = np.zeros(len(thresholds))
+    for i, t in enumerate(thresholds):
+        below = gains < t
+        crossings = np.count_nonzero(below[1:] & ~below[:-1])
+        lcr[i] = crossings / duration
+        afd[i] = np.count_nonzero(below[1:]) * time_delta / max(crossings, 1)
+    return lcr, afd
+
+
+def _compose_prefix(maps):
+    """Hillis-Steele scan over transition functions `(n, S)`: `res[t] = maps[t] o ... o maps[0]`."""
+    shift = 1
+    while shift < maps.shape[0]:
+        composed = maps.copy()
+        composed[shift:] = np.take_along_axis(maps[shift:], maps[:-shift], axis=1)
+        maps = composed
+        shift *= 2
+    return maps
+
+
+class MarkovChannelModel(object):
+    """MarkovChannelModel
+
+    thresholds: `S - 1` gain thresholds between the states.
+    levels: representative gain per state, i.e. the mean gain of all samples in a state.
+    transition_matrix: `(S, S)` transition probabilities from one slot to the next.
+    """
+
+    def __init__(self, thresholds, levels, transition_matrix, time_delta=1.e-3):
+        self._thresholds = np.asarray(thresholds)
+        self._levels = np.asarray(levels)
+        self._transition_matrix = np.asarray(transition_matrix)
+        _check_num_states(self.num_states())
+        assert self._transition_matrix.shape == (self.num_states(), self.num_states())
+        self._time_delta = time_delta
+
+        stay = np.diag(self._transition_matrix)
+        self._leave_probability = np.maximum(1. - stay, 1.e-12)
+        jump = self._transition_matrix - np.diag(stay)
+        totals = np.sum(jump, axis=1, keepdims=True)
+        # absorbing states only jump to themselves.
+        jump = np.where(totals > 0., jump / np.where(totals > 0., totals, 1.), np.eye(self.num_states()))
+        self._jump_cdf = np.cumsum(jump, axis=1)
+        self._jump_cdf[:, -1] = 1.
+
+    def state(self):
+        return {'num_states': self.num_states(), 'time_delta': self._time_delta}
+
+    def num_states(self):
+        return self._levels.size
+
+    def thresholds(self):
+        return self._thresholds
+
+    def levels(self):
+        return self._levels
+
+    def transition_matrix(self):
+        return self._transition_matrix
+
+    def time_delta(self):
+        return self._time_delta
+
+    def stationary_distribution(self):
+        w, v = np.linalg.eig(self._transition_matrix.T)
+        p = np.real(v[:, np.argmin(np.abs(w - 1.))])
+        return p / np.sum(p)
+
+    def _jump_chain(self, first_state, num_runs):
+        u = np.random.uniform(size=(num_runs - 1, 1))
+        maps = np.empty((num_runs - 1, self.num_states()), dtype=np.intp)
+        for s in range(self.num_states()):
+            maps[:, s] = np.searchsorted(self._jump_cdf[s], u[:, 0], side='right')
+        chain = np.empty(num_runs, dtype=np.intp)
+        chain[0] = first_state
+        if num_runs > 1:
+            chain[1:] = _compose_prefix(maps)[:, first_state]
+        return chain
+
+    def generate(self, num_slots, initial_state=None, runs_per_block=2 ** 16):
+        """generate
+
+        A state sequence of `num_slots` slots, states are `uint8` indices into `levels()`.
+        The initial state defaults to a draw from the stationary distribution.
+        """
+        if initial_state is None:
+            initial_state = np.random.choice(self.num_states(), p=self.stationary_distribution())
+        states = np.empty(num_slots, dtype=np.uint8)
+        state = initial_state
+        pos = 0
+        while pos < num_slots:
+            chain = self._jump_chain(state, runs_per_block)
+            lengths = np.random.geometric(self._leave_probability[chain])
+            ends = np.minimum(pos + np.cumsum(lengths), num_slots)
+            num_runs = min(np.searchsorted(ends, num_slots) + 1, ends.size)
+            lengths = np.diff(ends[0:num_runs], prepend=pos)
+            states[pos:ends[num_runs - 1]] = np.repeat(chain[0:num_runs], lengths)
+            pos = ends[num_runs - 1]
+            # the next block starts with a jump from the last visited state.
+            state = self._jump_chain(chain[num_runs - 1], 2)[1]
+        return states
+
+    def gains(self, states):
+        return self._levels[states]
+
+
+def _check_num_states(num_states):
+    if not 1 <= num_states <= MAX_STATES:
+        raise ValueError('Expected 1 to {} states, got {}'.format(MAX_STATES, num_states))
+
+
+def _cache_value(value):
+    # `repr` summarizes arrays with more than 1000 elements, thus arrays are keyed by their contents.
+    if isinstance(value, np.ndarray):
+        return value.dtype.str, value.shape, value.tobytes()
+    if isinstance(value, (list, tuple)):
+        return tuple(_cache_value(v) for v in value)
+    return repr(value)
+
+
+def _cache_key(factory, *args):
+    return (tuple((k, _cache_value(v)) for k, v in sorted(factory.state().items(), key=lambda kv: kv[0]))
+            + _cache_value(args))
+
+
+def fit_markov_model(factory, num_states=8, time_delta=1.e-3, num_links=1024, num_steps=512,
+                     gain_function=mean_gain, cache=True, gains=None):
+    """fit_markov_model
+
+    Fit a `MarkovChannelModel` with `num_states` equiprobable states to a `ChannelFactory` configuration.
+    The slot duration is `time_delta`.
+    Models are cached per configuration and parameters unless `cache` is False.
+    gains: optional precomputed traces from `simulate_gains`.
+    """
+    _check_num_states(num_states)
+    key = _cache_key(factory, num_states, time_delta, num_links, num_steps, gain_function)
+    # models from precomputed traces are not cached, the traces are not part of the key.
+    cache = cache and gains is None
+    if cache and key in _model_cache:
+        return _model_cache[key]
+    if gains is None:
+        gains = simulate_gains(factory, num_links, num_steps, time_delta, gain_function)
+    thresholds = np.quantile(gains, np.arange(1, num_states) / num_states)
+    states = quantize_gains(gains, thresholds)
+    levels = np.bincount(states.reshape(-1), gains.reshape(-1), num_states)
+    levels /= np.maximum(np.bincount(states.reshape(-1), minlength=num_states), 1)
+
+    pairs = states[:-1].astype(np.intp) * num_states + states[1:]
+    counts = np.bincount(pairs.reshape(-1), minlength=num_states ** 2).reshape((num_states, num_states))
+    totals = np.sum(counts, axis=1, keepdims=True)
+    transition_matrix = np.where(totals > 0, counts / np.maximum(totals, 1), np.eye(num_states))
+    model = MarkovChannelModel(thresholds, levels, transition_matrix, time_delta)
+    if cache:
+        cache_value(_model_cache, key, model, _MAX_CACHED_MODELS)
+    return model
+
+
+def validate_markov_model(model, reference_gains, num_slots=2 ** 20):
+    """validate_markov_model
+
+    Compare level crossing rates and average fade durations at the state thresholds
+    of a generated trace against `reference_gains` of the full model.
+    Returns a dict with `(markov, reference)` tuples for 'lcr' and 'afd'.
+    """
+    trace = model.gains(model.generate(num_slots))
+    # compare at the thresholds, the generated trace only takes the state levels.
+    markov = fading_statistics(trace, model.thresholds(), model.time_delta())
+    reference = fading_statistics(reference_gains, model.thresholds(), model.time_delta())
+    return {'lcr': (markov[0], reference[0]), 'afd': (markov[1], reference[1])}
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright 2026 Johannes Demel.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+"""
+Ergodic capacity, outage probability and diversity order over batches of channel realizations.
+
+Realizations are drawn as one batched fading channel of a `ChannelFactory` configuration, i.e. independent links.
+The eigenvalues of `H H^H` per realization and subcarrier are computed once,
+all SNRs then only evaluate `sum log2(1 + snr lambda)`.
+Every tx antenna sends with unit power and `H` keeps the normalization of the factory, like the simulation channels.
+The capacity of a realization is the mean over its subcarriers, i.e. a frequency selective block fading channel.
+
+Closed forms for i.i.d. Rayleigh fading with unit mean gain are available as reference,
+the outage probability also for MRC with `diversity` branches.
+"""
+
+import numpy as np
+import scipy.special as sps
+
+from .frequencydomainchannel import calculate_partial_dft
+
+
+def channel_matrices(factory, num_realizations, fft_len=None, batch_size=4096):
+    """channel_matrices
+
+    Channel matrices `(num_realizations, subcarriers, rx_antennas, tx_antennas)` of a `ChannelFactory`.
+    fft_len: DFT size for time domain configurations, default `subcarriers` of the factory.
+    With `fft_len=1`, the channel is the sum of all taps, i.e. flat fading.
+    Every batch is drawn from its own link, thus seeded factories yield independent batches.
+    """
+    state = factory.state()
+    if fft_len is None:
+        fft_len = state['subcarriers']
+    res = []
+    for link, start in enumerate(range(0, num_realizations, batch_size)):
+        size = min(batch_size, num_realizations - start)
+        fading_channel = factory.create_fading_channel((size, ), link=link)
+        if hasattr(fading_channel, 'freq_domain_taps'):
+            res.append(fading_channel.freq_domain_taps()[..., None, None])
+        else:
+            indices, taps = fading_channel.sparse_channel_taps()
+            freq_taps = calculate_partial_dft(taps, indices, fft_len)
+            res.append(np.moveaxis(freq_taps, -1, 1))
+    return np.concatenate(res)
+
+
+def channel_eigenvalues(matrices):
+    """Eigenvalues `(..., min(rx, tx))` of `H H^H` for matrices `(..., rx, tx)`."""
+    matrices = np.asarray(matrices)
+    if min(matrices.shape[-2:]) == 1:
+        # a vector channel has a single eigenvalue, its gain.
+        return np.sum(matrices.real ** 2 + matrices.imag ** 2, axis=(-2, -1))[..., None]
+    if matrices.shape[-2] > matrices.shape[-1]:
+        matrices = np.conj(np.swapaxes(matrices, -2, -1))
+    gram = matrices @ np.conj(np.swapaxes(matrices, -2, -1))
+    return np.maximum(np.linalg.eigvalsh(gram), 0.)
+
+
+def capacity(eigenvalues, snr_db):
+    """capacity
+
+    Capacity in bit/s/Hz of every realization `(len(snr_db), num_realizations)`
+    from eigenvalues `(num_realizations, subcarriers, streams)`, i.e. `log2 det(I + snr H H^H)`
+    averaged over the subcarriers.
+    """
+    snr = 10. ** (np.atleast_1d(snr_db) / 10.)
+    eigenvalues = np.asarray(eigenvalues, dtype=np.float64)
+    res = np.empty((snr.size, eigenvalues.shape[0]))
+    for i, s in enumerate(snr):
+        res[i] = np.mean(np.sum(np.log1p(s * eigenvalues), axis=-1), axis=-1) / np.log(2.)
+    return res
+
+
+def ergodic_capacity(capacities):
+    """Mean capacity per SNR of capacities `(num_snr, num_realizations)`."""
+    return np.mean(capacities, axis=-1)
+
+
+def outage_probability(capacities, rate):
+    """Fraction of realizations per SNR with a capacity below `rate` in bit/s/Hz."""
+    return np.mean(capacities < rate, axis=-1)
+
+
+def diversity_order(snr_db, outage):
+    """Local diversity order `-d log(P_out) / d log(snr)` per SNR, the slope at high SNR is the diversity order."""
+    outage = np.asarray(outage, dtype=np.float64)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return -np.gradient(np.log10(outage), np.asarray(snr_db, dtype=np.float64) / 10.)
+
+
+def rayleigh_ergodic_capacity(snr_db):
+    """Ergodic capacity of i.i.d. Rayleigh SISO fading, `log2(e) exp(1 / snr) E1(1 / snr)`."""
+    inv_snr = 10. ** (-np.asarray(snr_db, dtype=np.float64) / 10.)
+    # exp(x) E1(x) == exp1e for large x without overflow.
+    return np.exp(inv_snr) * sps.exp1(inv_snr) / np.log(2.)
+
+
+def rayleigh_outage_probability(rate, snr_db, diversity=1):
+    """rayleigh_outage_probability
+
+    Outage probability of i.i.d. Rayleigh fading with MRC over `diversity` branches with unit total mean gain,
+    e.g. `1 x diversity` SIMO from a `ChannelFactory`. `diversity=1` is SISO, `1 - exp(-(2^R - 1) / snr)`.
+    """
+    snr = 10. ** (np.asarray(snr_db, dtype=np.float64) / 10.)
+    return sps.gammainc(diversity, diversity * (2. ** rate - 1.) / snr)
+
+
+def capacity_metrics(factory, snr_db, rate, num_realizations=10000, fft_len=None):
+    """capacity_metrics
+
+    Simulated ergodic capacity, outage probability at `rate` and local diversity order per SNR
+    of a `ChannelFactory`. For i.i.d. Rayleigh SISO fading, `rayleigh_ergodic_capacity` is the reference.
+    """
+    snr_db = np.atleast_1d(np.asarray(snr_db, dtype=np.float64))
+    eigenvalues = channel_eigenvalues(channel_matrices(factory, num_realizations, fft_len))
+    capacities = capacity(eigenvalues, snr_db)
+    outage = outage_probability(capacities, rate)
+    return {'snr_db': snr_db, 'ergodic_capacity': ergodic_capacity(capacities), 'outage_probability': outage,
+            'diversity_order': diversity_order(snr_db, outage)}
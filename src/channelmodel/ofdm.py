@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright 2026 Johannes Demel.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+import numpy as np
+
+
+def cyclic_prefix_convolve(tx_symbols, freq_taps, taps, cp_length):
+    """cyclic_prefix_convolve
+
+    Equivalent to `np.convolve(tx, taps, 'full')[0:tx.size]` for CP-OFDM symbols `(M, cp_length + N)`
+    if `cp_length >= taps.size - 1`.
+    The body of every symbol is a circular convolution, i.e. a per-subcarrier multiply with `freq_taps`.
+    The CP is a copy of the body tail, except for its first `L - 1` samples that still see the previous symbol.
+    These samples are corrected directly, vectorized over all symbols.
+    """
+    num_symbols, symbol_length = tx_symbols.shape
+    fft_len = symbol_length - cp_length
+    rx = np.empty_like(tx_symbols)
+    body = np.fft.ifft(np.fft.fft(tx_symbols[:, cp_length:], axis=-1) * freq_taps, axis=-1)
+    rx[:, cp_length:] = body
+    rx[:, 0:cp_length] = body[:, fft_len - cp_length:]
+
+    num_taps = taps.size
+    flat = np.concatenate((np.zeros(num_taps - 1, dtype=tx_symbols.dtype), tx_symbols.reshape(-1)))
+    starts = np.arange(num_symbols) * symbol_length + num_taps - 1
+    for n in range(num_taps - 1):
+        rx[:, n] = np.sum(taps[None, :] * flat[starts[:, None] + n - np.arange(num_taps)[None, :]], axis=-1)
+    return rx
+
+
+class CyclicPrefixOFDMChannel(object):
+    """CyclicPrefixOFDMChannel
+
+    Time domain channel for CP-OFDM signals, i.e. symbols of `cp_length + subcarriers` samples.
+    awgn_channel: time domain AWGN, i.e. with noise scaled for `subcarriers`.
+    fading_channel: `FrequencyDomainChannel` for all subcarriers.
+
+    `transmit` convolves the time domain samples, e.g. with ISI if the CP is too short.
+    method: 'frequency' applies the channel per subcarrier if the CP covers the channel delay spread.
+    Both paths yield the same RX samples, but the FFT round trip is slower than `np.convolve` for typical
+    symbol and channel lengths. Thus, `None` selects 'convolution'.
+
+    `transmit_subcarriers` takes and returns subcarrier symbols. If the CP covers the channel,
+    OFDM modulation, CP and demodulation reduce to a multiply per subcarrier, thus it skips all FFTs.
+    """
+
+    def __init__(self, awgn_channel, fading_channel, cp_length, method=None):
+        self._awgn_channel = awgn_channel
+        self._channel = fading_channel
+        self._cp_length = cp_length
+        method = 'convolution' if method is None else method.lower()
+        assert method in ('frequency', 'convolution')
+        self._method = method
+
+    def state(self):
+        s = self._awgn_channel.state()
+        s.update(self._channel.state())
+        s['cp_length'] = self._cp_length
+        return s
+
+    def dynamic_state(self):
+        s = self._channel.dynamic_state()
+        s.update(self._awgn_channel.dynamic_state())
+        return s
+
+    def set_dynamic_state(self, dynamic_state):
+        self._channel.set_dynamic_state(dynamic_state)
+        self._awgn_channel.set_dynamic_state(dynamic_state)
+
+    def step(self, time_delta=1.e-3, steps=1):
+        self._awgn_channel.step(time_delta, steps)
+        self._channel.step(time_delta, steps)
+
+    def seek(self, slot):
+        self._awgn_channel.seek(slot)
+        self._channel.seek(slot)
+
+    def snr(self):
+        return self._awgn_channel.snr()
+
+    def cp_length(self):
+        return self._cp_length
+
+    def subcarriers(self):
+        return self._channel.subcarriers()
+
+    def symbol_length(self):
+        return self._cp_length + self.subcarriers()
+
+    def channel_taps(self):
+        return self._channel.time_domain_taps()
+
+    def channel_length(self):
+        return self._channel.time_domain_length()
+
+    def memory(self):
+        """The time domain convolution also spans OFDM symbols, e.g. with ISI if the CP is too short."""
+        return self.channel_length() - 1
+
+    def freq_domain_taps(self):
+        return self._channel.freq_domain_taps()
+
+    def freq_domain_gains(self):
+        return self._channel.freq_domain_gains()
+
+    def transmit(self, tx_symbols, out=None):
+        tx_symbols = np.asarray(tx_symbols)
+        if self._method == 'frequency':
+            if self.channel_length() - 1 > self._cp_length or tx_symbols.size % self.symbol_length() != 0:
+                raise ValueError('CP of {} samples with {} samples input does not support a channel with {} taps!'
+                                 .format(self._cp_length, tx_symbols.size, self.channel_length()))
+            rx = cyclic_prefix_convolve(tx_symbols.reshape((-1, self.symbol_length())),
+                                        self._channel.freq_domain_taps(),
+                                        self._channel.time_domain_taps(), self._cp_length).reshape(-1)
+        else:
+            rx = np.convolve(tx_symbols, self._channel.time_domain_taps(), 'full')[0:tx_symbols.size]
+        return self._awgn_channel.transmit(rx.astype(tx_symbols.dtype, copy=False), out)
+
+    def transmit_subcarriers(self, tx_mod, out=None):
+        """transmit_subcarriers
+
+        Subcarrier symbols `tx_mod` of full OFDM symbols to the received subcarrier symbols,
+        equal to `fft(transmit(ifft(tx_mod) with CP) without CP)`. The CP must cover the channel.
+        """
+        tx_mod = np.asarray(tx_mod)
+        subcarriers = self.subcarriers()
+        if self.channel_length() - 1 > self._cp_length or tx_mod.size % subcarriers != 0:
+            raise ValueError('CP of {} samples with {} symbols input does not support a channel with {} taps!'.format(
+                self._cp_length, tx_mod.size, self.channel_length()))
+        rx_mod = (tx_mod.reshape((-1, subcarriers)) * self._channel.freq_domain_taps()).reshape(-1)
+        # the FFT of the time domain noise has `subcarriers` times its variance, i.e. scale, add noise, scale back.
+        scale = np.sqrt(subcarriers).astype(rx_mod.real.dtype)
+        rx_mod = self._awgn_channel.transmit(rx_mod / scale, out)
+        rx_mod *= scale
+        return rx_mod
@@ -13,9 +13,46 @@ def calculate_vector_signal_energy(s):
     return np.sum(s.real ** 2 + s.imag ** 2)
 
 
+def prune_tap_indices(powers, threshold_db=None, max_taps=None):
+    """prune_tap_indices
+
+    Select the significant taps of a power delay profile.
+    `threshold_db` drops all taps that are weaker than the strongest tap by more than this value, e.g. `-30.`.
+    `max_taps` keeps at most the `max_taps` strongest taps.
+    The result are the sorted delay indices of all remaining taps, it always contains the strongest tap.
+    """
+    if threshold_db is not None and threshold_db > 0.:
+        raise ValueError('threshold_db is relative to the strongest tap and must not be positive, got {}'.format(
+            threshold_db))
+    if max_taps is not None and max_taps < 1:
+        raise ValueError('At least one tap must be kept, got max_taps={}'.format(max_taps))
+    indices = np.arange(powers.size)
+    if threshold_db is not None:
+        strongest = np.argmax(powers)
+        limit = powers[strongest] * 10. ** (threshold_db / 10.)
+        keep = powers >= limit
+        keep[strongest] = True
+        indices = indices[keep]
+    if max_taps is not None and indices.size > max_taps:
+        strongest = np.argsort(powers[indices], kind='stable')[::-1]
+        indices = np.sort(indices[strongest[0:max_taps]])
+    return indices
+
+
+def scatter_taps(indices, taps, length):
+    """scatter_taps
+
+    Convert a sparse (delay index, gain) representation into a dense impulse response of `length` samples.
+    Leading dimensions of `taps` are preserved.
+    """
+    dense = np.zeros(np.shape(taps)[:-1] + (length,), dtype=taps.dtype)
+    dense[..., indices] = taps
+    return dense
+
+
 class PowerDelayProfile(object):
     def __init__(self, rms_delay_spread, max_delay_spread, bandwidth,
-                 scale=1., shape='Exp'):
+                 scale=1., shape='Exp', threshold_db=None, max_taps=None):
         if shape != 'Exp':
             raise NotImplementedError("Currently only 'Exp' supported!")
         if rms_delay_spread > 1.e-5:
@@ -33,6 +70,11 @@ class PowerDelayProfile(object):
         num_taps = int(np.ceil(max_delay_spread / samp_dur))
         self._supports = np.arange(0., max_delay_spread, samp_dur)
         assert self._supports.size == num_taps
+        self._threshold_db = threshold_db
+        self._max_taps = max_taps
+        self._indices = prune_tap_indices(
+            self.exp_dist(self._supports, rms_delay_spread) ** 2,
+            threshold_db, max_taps)
         self._scale = scale
         self.initialize_pdp()
 
@@ -41,17 +83,28 @@ class PowerDelayProfile(object):
              'max_delay_spread': self._max_delay_spread,
              'bandwidth': self._bandwidth,
              'scale': self._scale,
-             'shape': self._shape}
+             'shape': self._shape,
+             'threshold_db': self._threshold_db,
+             'max_taps': self._max_taps}
         return s
 
     def samp_ticks(self):
-        return self._supports[1] - self._supports[0]
+        return 1. / self._bandwidth
 
     def num_taps(self):
-        return self._supports.size
+        return self._indices.size
+
+    def delay_length(self):
+        return self._indices[-1] + 1
+
+    def is_sparse(self):
+        return self._indices.size < self._supports.size
+
+    def tap_indices(self):
+        return self._indices
 
     def initialize_pdp(self):
-        self._pdp = self.exp_dist(self._supports, self._rms_delay_spread)
+        self._pdp = self.exp_dist(self.supports(), self._rms_delay_spread)
         self._pdp /= np.sqrt(calculate_vector_signal_energy(self._pdp))
         pdp_energy = calculate_vector_signal_energy(self._pdp)
         assert np.abs(pdp_energy - 1.) < 1e-13
@@ -67,26 +120,33 @@ class PowerDelayProfile(object):
     def taps(self):
         return self._pdp
 
+    def dense_taps(self):
+        if not self.is_sparse():
+            return self._pdp
+        return scatter_taps(self._indices, self._pdp, self.delay_length())
+
     def supports(self):
-        return self._supports
+        return self._supports[self._indices]
 
 
 class FFTPowerDelayProfile(PowerDelayProfile):
     def __init__(self, rms_delay_spread, max_delay_spread, bandwidth,
-                 subcarriers, shape='Exp'):
+                 subcarriers, shape='Exp', threshold_db=None, max_taps=None):
         scale = 1.
         super(FFTPowerDelayProfile, self).__init__(rms_delay_spread,
                                                    max_delay_spread, bandwidth,
-                                                   scale=scale, shape=shape)
+                                                   scale=scale, shape=shape,
+                                                   threshold_db=threshold_db,
+                                                   max_taps=max_taps)
 
-        f_taps = np.fft.fft(self.taps(), subcarriers)
+        f_taps = np.fft.fft(self.dense_taps(), subcarriers)
         assert f_taps.size == subcarriers
         e = calculate_vector_signal_energy(f_taps)
 
         self._scale = 1. / np.sqrt(1. * e / subcarriers)
 
         self.initialize_pdp()
-        freq_taps = np.fft.fft(self.taps(), subcarriers)
+        freq_taps = np.fft.fft(self.dense_taps(), subcarriers)
         assert np.mean(np.abs(freq_taps) ** 2) - 1. < 1.e-6
         self._subcarriers = subcarriers
 
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright 2026 Johannes Demel.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+import numpy as np
+
+
+class KeyedRandomStream(object):
+    """KeyedRandomStream
+
+    Counter-based random numbers for random access to any slot of any link.
+    The Philox key derives from `(seed, link)`, the slot selects a counter block.
+    Thus, `generator(slot)` yields the same numbers regardless of how many slots were generated before
+    or in which process it is called.
+
+    link: int or tuple of ints, e.g. `(link, rx_antenna, tx_antenna)`.
+    Every slot offers 2 ** 64 draws before it overlaps the next one.
+    """
+
+    def __init__(self, seed, link=0):
+        self._seed = seed
+        self._link = tuple(np.atleast_1d(link).tolist())
+        self._key = np.random.SeedSequence((seed, ) + self._link).generate_state(2, np.uint64)
+
+    def state(self):
+        return {'seed': self._seed, 'link': self._link}
+
+    def seed(self):
+        return self._seed
+
+    def link(self):
+        return self._link
+
+    def substream(self, *link):
+        """Stream for a sub link, e.g. one antenna pair of a MIMO link."""
+        return KeyedRandomStream(self._seed, self._link + link)
+
+    def generator(self, slot):
+        bit_generator = np.random.Philox(key=self._key, counter=np.array([0, slot, 0, 0], dtype=np.uint64))
+        return np.random.Generator(bit_generator)
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright 2026 Johannes Demel.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+"""
+Single-carrier frequency domain equalization (SC-FDE) for time domain channels.
+
+The transmitter sends blocks of `block_length` symbols, each preceded by a CP of `cp_length` symbols.
+If the CP covers the channel delay spread, the channel is a circular convolution per block.
+The receiver removes the CP, transforms all blocks of all rx antennas with one FFT,
+combines the rx antennas with ZF or MMSE weights per frequency bin and transforms back.
+"""
+
+import numpy as np
+
+
+def add_cyclic_prefix(symbols, block_length, cp_length):
+    """Blocks `(M, cp_length + block_length)` with the last `cp_length` symbols of each block prepended."""
+    blocks = np.asarray(symbols).reshape((-1, block_length))
+    return np.concatenate((blocks[:, block_length - cp_length:], blocks), axis=-1)
+
+
+class SingleCarrierFDEChannel(object):
+    """SingleCarrierFDEChannel
+
+    Block SC-FDE receiver on top of a time domain `RayleighAWGNSimulationChannel` with one tx antenna.
+    channel: time domain channel, its AWGN defines the SNR per transmitted symbol.
+    block_length: FFT length, i.e. data symbols per block.
+    cp_length: CP length in symbols, it should cover `channel_length - 1` to avoid inter-block interference.
+    equalizer_type: 'ZF' or 'MMSE', both combine all rx antennas, i.e. MRC for a single tap channel.
+
+    The equalizer weights `conj(H_r) / (sum_r |H_r|^2 + lambda)` are computed once per channel realization.
+    """
+
+    def __init__(self, channel, block_length, cp_length, equalizer_type='MMSE'):
+        if channel.tx_antennas() != 1:
+            raise ValueError('SC-FDE only supports a single tx antenna, got {}'.format(channel.tx_antennas()))
+        equalizer_type = equalizer_type.upper()
+        if equalizer_type not in ('ZF', 'MMSE'):
+            raise ValueError('SC-FDE does not support "{}" equalizer, choose ZF or MMSE'.format(equalizer_type))
+        if block_length < channel.channel_length():
+            raise ValueError('Block length {} is shorter than the channel with {} taps!'.format(
+                block_length, channel.channel_length()))
+        self._channel = channel
+        self._block_length = block_length
+        self._cp_length = cp_length
+        self._equalizer_type = equalizer_type
+        self._weights = None
+        self._effective_snr = None
+        self._equalizer_gain = None
+
+    def state(self):
+        s = self._channel.state()
+        s['equalizer_type'] = self._equalizer_type
+        s['block_length'] = self._block_length
+        s['cp_length'] = self._cp_length
+        return s
+
+    def dynamic_state(self):
+        return self._channel.dynamic_state()
+
+    def set_dynamic_state(self, dynamic_state):
+        self._channel.set_dynamic_state(dynamic_state)
+        self._weights = None
+
+    def step(self, time_delta=1.e-3, steps=1):
+        self._channel.step(time_delta, steps)
+        self._weights = None
+
+    def seek(self, slot):
+        self._channel.seek(slot)
+        self._weights = None
+
+    def snr(self):
+        return self._channel.snr()
+
+    def log_weights(self):
+        return self._channel.log_weights()
+
+    def block_length(self):
+        return self._block_length
+
+    def cp_length(self):
+        return self._cp_length
+
+    def channel_taps(self):
+        return self._channel.channel_taps()
+
+    def channel_length(self):
+        return self._channel.channel_length()
+
+    def memory(self):
+        """Every block carries its own CP, chunks of full blocks are independent."""
+        return 0
+
+    def rx_antennas(self):
+        return self._channel.rx_antennas()
+
+    def freq_domain_taps(self):
+        """Channel per rx antenna and frequency bin, `(rx_antennas, block_length)`."""
+        taps = np.array([row[0] for row in self._channel.channel_taps()])
+        return np.fft.fft(taps, self._block_length, axis=-1)
+
+    def _update_weights(self):
+        freq_taps = self.freq_domain_taps()
+        variance = self._channel.variance()
+        gains = np.sum(freq_taps.real ** 2 + freq_taps.imag ** 2, axis=0)
+        regularization = variance if self._equalizer_type == 'MMSE' else 0.
+        self._weights = (np.conj(freq_taps) / (gains + regularization)).astype(np.complex64)
+        if self._equalizer_type == 'ZF':
+            self._equalizer_gain = 1.
+            self._effective_snr = 1. / (variance * np.mean(1. / gains))
+        else:
+            # the MMSE output is biased, its unbiased SNR follows from the mean error per bin.
+            error = np.mean(variance / (gains + variance))
+            self._equalizer_gain = 1. - error
+            self._effective_snr = (1. - error) / error
+
+    def weights(self):
+        """Equalizer weights `(rx_antennas, block_length)` of the current channel realization."""
+        if self._weights is None:
+            self._update_weights()
+        return self._weights
+
+    def effective_snr(self):
+        """Linear SNR per symbol after equalization, the same for all symbols of a realization."""
+        self.weights()
+        return self._effective_snr
+
+    def equalizer_gain(self):
+        """Scale of the symbols after equalization, 1 for ZF and below 1 for MMSE."""
+        self.weights()
+        return self._equalizer_gain
+
+    def transmit(self, tx_symbols, out=None, return_snr=False):
+        """transmit
+
+        tx_symbols: data symbols, a multiple of `block_length`. The CP is inserted here.
+        Returns the equalized data symbols, without CP, and optionally the effective SNR, i.e. `(rx, snr)`.
+        """
+        tx_symbols = np.asarray(tx_symbols)
+        if tx_symbols.size % self._block_length != 0:
+            raise ValueError('Expected full blocks of {} symbols, got {} symbols'.format(
+                self._block_length, tx_symbols.size))
+        tx_blocks = add_cyclic_prefix(tx_symbols, self._block_length, self._cp_length).reshape(-1)
+        rx = np.asarray(self._channel.transmit([tx_blocks]))
+        rx = rx.reshape((self.rx_antennas(), -1, self._cp_length + self._block_length))[..., self._cp_length:]
+        # all blocks of all rx antennas at once, combined per frequency bin.
+        rx_freq = np.fft.fft(rx, axis=-1)
+        rx = np.fft.ifft(np.einsum('rn,rmn->mn', self.weights(), rx_freq), axis=-1)
+        rx = rx.astype(np.result_type(tx_symbols.dtype, np.complex64), copy=False).reshape(-1)
+        if out is not None:
+            out[:] = rx
+            rx = out
+        if return_snr:
+            return rx, self.effective_snr()
+        return rx
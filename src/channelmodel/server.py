@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright 2026 Johannes Demel.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+"""
+A local channel emulation service for tools that do not embed their own channel models, e.g. SDR flowgraphs.
+
+Every connection gets its own channel from a `ChannelFactory`.
+Clients send sample blocks and receive the faded and noisy output.
+
+Framing, all values little-endian:
+
+    header: 4 bytes magic b'CHM1', uint8 code, uint8 flags (0), uint16 reserved (0), uint32 payload length in bytes
+    payload: raw bytes
+
+Request codes:
+
+    1 TRANSMIT: payload interleaved float32 I/Q samples, i.e. complex64.
+                MIMO time domain channels expect `tx_antennas` equally long streams back to back
+                and return `rx_antennas` streams.
+    2 STEP:     payload one float64 time delta in seconds, optionally followed by one uint64 number of steps.
+                Without it, the channel advances one step.
+    3 INFO:     empty payload, returns the channel state as UTF-8 JSON.
+
+Responses use the same header, code 0 signals success and 1 an error with a UTF-8 message as payload.
+"""
+
+import json
+import os
+import queue
+import socket
+import socketserver
+import struct
+import threading
+
+import numpy as np
+
+MAGIC = b'CHM1'
+HEADER = struct.Struct('<4sBBHI')
+STEP = struct.Struct('<dQ')
+SAMPLE_SIZE = np.dtype(np.complex64).itemsize
+OP_TRANSMIT = 1
+OP_STEP = 2
+OP_INFO = 3
+_OP_CREATE = 255
+STATUS_OK = 0
+STATUS_ERROR = 1
+
+
+def _recv_exact(sock, num_bytes):
+    buf = bytearray(num_bytes)
+    view = memoryview(buf)
+    received = 0
+    while received < num_bytes:
+        n = sock.recv_into(view[received:], num_bytes - received)
+        if n == 0:
+            if received == 0:
+                return None
+            raise ConnectionError('Connection closed in the middle of a frame!')
+        received += n
+    return buf
+
+
+def send_frame(sock, code, payload=b''):
+    if isinstance(payload, np.ndarray):
+        payload = np.ascontiguousarray(payload).view(np.uint8)
+    payload = memoryview(payload).cast('B')
+    sock.sendall(HEADER.pack(MAGIC, code, 0, 0, payload.nbytes))
+    if payload.nbytes > 0:
+        sock.sendall(payload)
+
+
+def recv_frame(sock):
+    """Return `(code, payload)` or `None` if the peer closed the connection."""
+    header = _recv_exact(sock, HEADER.size)
+    if header is None:
+        return None
+    magic, code, _, _, length = HEADER.unpack(header)
+    if magic != MAGIC:
+        raise ConnectionError('Invalid frame magic: {}'.format(bytes(magic)))
+    payload = _recv_exact(sock, length) if length > 0 else bytearray()
+    if payload is None:
+        raise ConnectionError('Connection closed in the middle of a frame!')
+    return code, payload
+
+
+class _Job(object):
+    def __init__(self, session, code, payload):
+        self.session = session
+        self.code = code
+        self.payload = payload
+        self.result = b''
+        self.error = None
+        self.done = threading.Event()
+
+
+class _Session(object):
+    def __init__(self):
+        self.channel = None
+
+
+class _RequestHandler(socketserver.BaseRequestHandler):
+    def handle(self):
+        service = self.server.channel_service
+        if isinstance(self.request.getsockname(), tuple):
+            self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        session = _Session()
+        service.submit(session, _OP_CREATE, None)
+        while True:
+            frame = recv_frame(self.request)
+            if frame is None:
+                break
+            code, payload = frame
+            try:
+                send_frame(self.request, STATUS_OK, service.submit(session, code, payload))
+            except Exception as e:
+                send_frame(self.request, STATUS_ERROR, str(e).encode('utf-8'))
+
+
+class _UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+class _TCPServer(socketserver.ThreadingMixIn, socketserver.TCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class ChannelServer(object):
+    """ChannelServer
+
+    Host `ChannelFactory` configured channels on a Unix domain socket (`address` is a path)
+    or on localhost TCP (`address` is a `(host, port)` tuple).
+
+    One connection handler thread per client parses the frames.
+    A single worker thread owns all channels and the random generator.
+    It collects all pending requests, up to `max_batch`, and processes them in one go.
+    Only transmit requests of AWGN sessions are coalesced, into one `transmit` call on the concatenated samples
+    of a single shared channel. Fading sessions own their channel state, thus their requests are processed
+    one after another, the batch only saves the hand-over to the worker thread per request.
+    """
+
+    def __init__(self, factory, address, max_batch=64):
+        self._factory = factory
+        self._max_batch = max_batch
+        self._stateless = factory.state()['channel_type'] == 'awgn'
+        self._shared_channel = factory.create() if self._stateless else None
+        self._jobs = queue.Queue()
+        if isinstance(address, str):
+            self._server = _UnixServer(address, _RequestHandler)
+        else:
+            self._server = _TCPServer(address, _RequestHandler)
+        self._server.channel_service = self
+        self._worker = threading.Thread(target=self._work, daemon=True)
+        self._worker.start()
+        self._serving = False
+
+    def address(self):
+        return self._server.server_address
+
+    def serve_forever(self):
+        self._serving = True
+        self._server.serve_forever()
+
+    def start(self):
+        """Serve in a background thread."""
+        self._serving = True
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+    def shutdown(self):
+        if self._serving:
+            self._server.shutdown()
+        self._server.server_close()
+        self._jobs.put(None)
+        if isinstance(self.address(), str) and os.path.exists(self.address()):
+            os.unlink(self.address())
+
+    def submit(self, session, code, payload):
+        job = _Job(session, code, payload)
+        self._jobs.put(job)
+        job.done.wait()
+        if job.error is not None:
+            raise job.error
+        return job.result
+
+    def _work(self):
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                return
+            batch = [job]
+            while len(batch) < self._max_batch:
+                try:
+                    job = self._jobs.get_nowait()
+                except queue.Empty:
+                    break
+                if job is None:
+                    self._jobs.put(None)
+                    break
+                batch.append(job)
+            try:
+                self._process(batch)
+            except Exception as e:
+                # the worker serves all sessions, no client may wait forever.
+                for j in batch:
+                    if not j.done.is_set():
+                        j.error = e
+                        j.done.set()
+
+    def _process(self, batch):
+        transmits = [j for j in batch if j.code == OP_TRANSMIT and len(j.payload) % SAMPLE_SIZE == 0]
+        if self._stateless and len(transmits) > 1:
+            try:
+                self._transmit_batch(transmits)
+                batch = [j for j in batch if j not in transmits]
+            except Exception:
+                # `_execute` reports the error to the client that caused it.
+                pass
+        for j in batch:
+            try:
+                j.result = self._execute(j)
+            except Exception as e:
+                j.error = e
+            finally:
+                j.done.set()
+
+    def _transmit_batch(self, transmits):
+        blocks = [np.frombuffer(j.payload, dtype=np.complex64) for j in transmits]
+        rx = self._shared_channel.transmit(np.concatenate(blocks))
+        results = np.split(rx, np.cumsum([b.size for b in blocks])[:-1])
+        for j, r in zip(transmits, results):
+            j.result = r
+            j.done.set()
+
+    def _execute(self, job):
+        if job.code == _OP_CREATE:
+            job.session.channel = self._shared_channel or self._factory.create()
+            return b''
+        channel = job.session.channel
+        if job.code == OP_TRANSMIT:
+            if len(job.payload) % SAMPLE_SIZE != 0:
+                raise ValueError('Expected interleaved float32 I/Q samples, got {} bytes'.format(len(job.payload)))
+            tx = np.frombuffer(job.payload, dtype=np.complex64)
+            if hasattr(channel, 'tx_antennas'):
+                if tx.size % channel.tx_antennas() != 0:
+                    raise ValueError('Expected {} equally long streams, got {} samples'.format(
+                        channel.tx_antennas(), tx.size))
+                tx = tx.reshape((channel.tx_antennas(), -1))
+            return np.ascontiguousarray(channel.transmit(tx), dtype=np.complex64)
+        if job.code == OP_STEP:
+            if len(job.payload) == STEP.size:
+                channel.step(*STEP.unpack(job.payload))
+            else:
+                channel.step(struct.unpack('<d', job.payload)[0])
+            return b''
+        if job.code == OP_INFO:
+            return json.dumps(channel.state(), default=str).encode('utf-8')
+        raise ValueError('Unknown request code: {}'.format(job.code))
+
+
+class ChannelClient(object):
+    """ChannelClient
+
+    Python client for a `ChannelServer`. The framing is simple enough to implement in any language.
+    """
+
+    def __init__(self, address):
+        family = socket.AF_UNIX if isinstance(address, str) else socket.AF_INET
+        self._socket = socket.socket(family, socket.SOCK_STREAM)
+        self._socket.connect(address)
+        if family == socket.AF_INET:
+            self._socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def _request(self, code, payload=b''):
+        send_frame(self._socket, code, payload)
+        frame = recv_frame(self._socket)
+        if frame is None:
+            raise ConnectionError('Server closed the connection!')
+        status, payload = frame
+        if status != STATUS_OK:
+            raise RuntimeError(payload.decode('utf-8'))
+        return payload
+
+    def transmit(self, tx_symbols):
+        tx = np.ascontiguousarray(tx_symbols, dtype=np.complex64)
+        return np.frombuffer(self._request(OP_TRANSMIT, tx), dtype=np.complex64)
+
+    def step(self, time_delta=1.e-3, steps=1):
+        self._request(OP_STEP, STEP.pack(time_delta, steps))
+
+    def state(self):
+        return json.loads(self._request(OP_INFO).decode('utf-8'))
+
+    def close(self):
+        self._socket.close()
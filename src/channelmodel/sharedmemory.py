@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright 2026 Johannes Demel.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+import time
+
+import numpy as np
+
+from .iqfile import channel_memory
+
+try:
+    from multiprocessing import shared_memory
+except ImportError:  # Python < 3.8
+    shared_memory = None
+
+# Keep the producer and consumer counters on separate cache lines.
+_CACHE_LINE = 64
+_WRITE_OFFSET = 0
+_READ_OFFSET = _CACHE_LINE
+_CAPACITY_OFFSET = 2 * _CACHE_LINE
+_HEADER_SIZE = 3 * _CACHE_LINE
+
+
+def _open_shared_memory(name=None, size=0):
+    if shared_memory is None:
+        raise ImportError('Shared memory buffers require Python 3.8 or newer!')
+    if name is None:
+        return shared_memory.SharedMemory(create=True, size=size)
+    try:
+        # Attached buffers belong to their creator. Python 3.13+ lets us opt out of tracking.
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        return shared_memory.SharedMemory(name=name)
+
+
+def _counter(shm, offset):
+    return np.ndarray((1, ), dtype=np.uint64, buffer=shm.buf, offset=offset)
+
+
+class SampleRingBuffer(object):
+    """SampleRingBuffer
+
+    A single-producer/single-consumer ring buffer for complex samples in shared memory without locks.
+
+    The producer only ever writes the write counter and the consumer only ever writes the read counter.
+    Both counters increase monotonically, the buffer position is the counter modulo the capacity.
+    Counters are aligned 64bit words, i.e. loads and stores are single machine instructions.
+
+    Limitation: counters and samples are plain numpy stores without memory barriers.
+    x86-64 does not reorder stores with other stores, thus the consumer sees the samples before the counter there.
+    Weakly ordered CPUs, e.g. ARM, give no such guarantee, use a `multiprocessing` lock or queue to synchronize.
+
+    Create a buffer in one process with `SampleRingBuffer(capacity)` and
+    attach in another one with `SampleRingBuffer.attach(name)` or just pass the object to a `multiprocessing.Process`.
+    The `*_view` and `commit_*` methods allow to work on the samples in place without any copies.
+    """
+
+    def __init__(self, capacity, dtype=np.complex64, name=None):
+        self._dtype = np.dtype(dtype)
+        self._owner = name is None
+        self._shm = _open_shared_memory(
+            name, _HEADER_SIZE + capacity * self._dtype.itemsize)
+        self._write_count = _counter(self._shm, _WRITE_OFFSET)
+        self._read_count = _counter(self._shm, _READ_OFFSET)
+        capacity_field = _counter(self._shm, _CAPACITY_OFFSET)
+        if self._owner:
+            self._write_count[0] = 0
+            self._read_count[0] = 0
+            capacity_field[0] = capacity
+        self._capacity = int(capacity_field[0])
+        self._samples = np.ndarray((self._capacity, ), dtype=self._dtype,
+                                   buffer=self._shm.buf, offset=_HEADER_SIZE)
+
+    @classmethod
+    def attach(cls, name, dtype=np.complex64):
+        return cls(0, dtype, name)
+
+    def __reduce__(self):
+        return (type(self).attach, (self.name(), self._dtype))
+
+    def state(self):
+        return {'name': self.name(), 'capacity': self._capacity,
+                'dtype': self._dtype.name}
+
+    def name(self):
+        return self._shm.name
+
+    def dtype(self):
+        return self._dtype
+
+    def capacity(self):
+        return self._capacity
+
+    def available(self):
+        return int(self._write_count[0] - self._read_count[0])
+
+    def free(self):
+        return self._capacity - self.available()
+
+    def _contiguous(self, position, count):
+        start = position % self._capacity
+        return start, min(count, self._capacity - start)
+
+    def write_view(self, num_samples=None):
+        """Contiguous writable view of up to `num_samples` free samples. Call `commit_write` afterwards."""
+        count = self.free() if num_samples is None else min(num_samples, self.free())
+        start, count = self._contiguous(int(self._write_count[0]), count)
+        return self._samples[start:start + count]
+
+    def commit_write(self, num_samples):
+        assert num_samples <= self.free()
+        self._write_count[0] += num_samples
+
+    def read_view(self, num_samples=None):
+        """Contiguous readable view of up to `num_samples` available samples. Call `commit_read` afterwards."""
+        count = self.available() if num_samples is None else min(num_samples, self.available())
+        start, count = self._contiguous(int(self._read_count[0]), count)
+        return self._samples[start:start + count]
+
+    def commit_read(self, num_samples):
+        assert num_samples <= self.available()
+        self._read_count[0] += num_samples
+
+    def write(self, samples):
+        """Copy as many `samples` as fit into the buffer and return their number."""
+        written = 0
+        while written < samples.size:
+            view = self.write_view(samples.size - written)
+            if view.size == 0:
+                break
+            view[:] = samples[written:written + view.size]
+            self.commit_write(view.size)
+            written += view.size
+        return written
+
+    def read(self, num_samples=None, out=None):
+        """Copy up to `num_samples` samples out of the buffer."""
+        count = self.available() if num_samples is None else min(num_samples, self.available())
+        if out is None:
+            out = np.empty(count, dtype=self._dtype)
+        count = min(count, out.size)
+        done = 0
+        while done < count:
+            view = self.read_view(count - done)
+            out[done:done + view.size] = view
+            self.commit_read(view.size)
+            done += view.size
+        return out[0:count]
+
+    def close(self):
+        self._samples = self._write_count = self._read_count = None
+        self._shm.close()
+
+    def unlink(self):
+        self._shm.unlink()
+
+
+class SharedChannelState(object):
+    """SharedChannelState
+
+    Publish the current channel realization, e.g. `channel_taps()`, to other processes.
+
+    One writer publishes, any number of readers take snapshots.
+    A sequence counter (seqlock) guards the values: it is odd while the writer updates them.
+    Readers retry until they observe the same even counter before and after their copy.
+    Thus, readers never block the writer and never see a torn realization,
+    with the same memory ordering limitation as `SampleRingBuffer`, i.e. on x86-64.
+    """
+
+    def __init__(self, shape, dtype=np.complex64, name=None):
+        self._shape = tuple(shape)
+        self._dtype = np.dtype(dtype)
+        self._owner = name is None
+        nbytes = int(np.prod(self._shape)) * self._dtype.itemsize
+        self._shm = _open_shared_memory(name, _CACHE_LINE + nbytes)
+        self._sequence = _counter(self._shm, 0)
+        if self._owner:
+            self._sequence[0] = 0
+        self._values = np.ndarray(self._shape, dtype=self._dtype,
+                                  buffer=self._shm.buf, offset=_CACHE_LINE)
+
+    @classmethod
+    def attach(cls, name, shape, dtype=np.complex64):
+        return cls(shape, dtype, name)
+
+    @classmethod
+    def for_channel(cls, channel):
+        taps = np.asarray(channel.channel_taps())
+        state = cls(taps.shape, taps.dtype)
+        state.publish(taps)
+        return state
+
+    def __reduce__(self):
+        return (type(self).attach, (self.name(), self._shape, self._dtype))
+
+    def name(self):
+        return self._shm.name
+
+    def shape(self):
+        return self._shape
+
+    def version(self):
+        """Number of completed `publish` calls."""
+        return int(self._sequence[0]) // 2
+
+    def publish(self, values):
+        self._sequence[0] += 1
+        self._values[...] = values
+        self._sequence[0] += 1
+
+    def snapshot(self, out=None):
+        """Return a consistent copy of the values and their version."""
+        if out is None:
+            out = np.empty(self._shape, dtype=self._dtype)
+        while True:
+            before = int(self._sequence[0])
+            if before % 2 == 0:
+                out[...] = self._values
+                if before == int(self._sequence[0]):
+                    return out, before // 2
+            time.sleep(0)
+
+    def close(self):
+        self._values = self._sequence = None
+        self._shm.close()
+
+    def unlink(self):
+        self._shm.unlink()
+
+
+class SharedMemoryChannel(object):
+    """SharedMemoryChannel
+
+    Run any channel of this module between shared memory ring buffers.
+
+    `tx_buffer` and `rx_buffer` are `SampleRingBuffer` objects,
+    or lists of those for the per antenna streams of a `RayleighAWGNSimulationChannel`.
+    Memoryless channels, e.g. AWGN, read the TX samples in place and get the RX buffer as `out`.
+    Channels that compute their output in temporaries, e.g. with an equalizer, copy it into the RX buffer.
+    Time domain fading channels carry the last `memory()` TX samples into the next chunk,
+    thus chunk boundaries do not cut the convolution. Then, every chunk is copied once.
+    Channels without `memory`, see `channel_memory`, are rejected.
+    `block_size` ensures that only multiples of e.g. the number of subcarriers are processed at once.
+    The ring buffer capacity should be a multiple of `block_size` such that blocks never wrap around.
+    If `channel_state` is a `SharedChannelState`, every `step` publishes the new realization.
+    """
+
+    def __init__(self, channel, tx_buffer, rx_buffer, channel_state=None, block_size=1):
+        self._channel = channel
+        self._multi_stream = isinstance(tx_buffer, (list, tuple))
+        self._tx_buffers = list(tx_buffer) if self._multi_stream else [tx_buffer]
+        self._rx_buffers = list(rx_buffer) if self._multi_stream else [rx_buffer]
+        self._channel_state = channel_state
+        self._block_size = block_size
+        self._memory = channel_memory(channel)
+        self._history = [np.zeros(self._memory, dtype=b.dtype()) for b in self._tx_buffers]
+        self.publish_state()
+
+    def state(self):
+        s = self._channel.state()
+        s['block_size'] = self._block_size
+        return s
+
+    def channel(self):
+        return self._channel
+
+    def publish_state(self):
+        if self._channel_state is not None:
+            self._channel_state.publish(np.asarray(self._channel.channel_taps()))
+
+    def step(self, time_delta=1.e-3, steps=1):
+        self._channel.step(time_delta, steps)
+        self.publish_state()
+
+    def process(self, max_samples=None):
+        """Transmit the next contiguous chunk of samples. Returns the number of processed samples."""
+        count = min(b.available() for b in self._tx_buffers)
+        count = min(count, min(b.free() for b in self._rx_buffers))
+        if max_samples is not None:
+            count = min(count, max_samples)
+        tx = [b.read_view(count) for b in self._tx_buffers]
+        count = min(v.size for v in tx)
+        rx = [b.write_view(count) for b in self._rx_buffers]
+        count = min(v.size for v in rx)
+        count -= count % self._block_size
+        if count == 0:
+            return 0
+        tx = [v[0:count] for v in tx]
+        rx = [v[0:count] for v in rx]
+        if self._memory == 0:
+            if self._multi_stream:
+                self._channel.transmit(tx, out=rx)
+            else:
+                self._channel.transmit(tx[0], out=rx[0])
+        else:
+            tx = [np.concatenate((h, v)) for h, v in zip(self._history, tx)]
+            res = self._channel.transmit(tx) if self._multi_stream else [self._channel.transmit(tx[0])]
+            for r, v in zip(res, rx):
+                v[:] = r[self._memory:]
+            self._history = [v[v.size - self._memory:] for v in tx]
+        for b in self._tx_buffers:
+            b.commit_read(count)
+        for b in self._rx_buffers:
+            b.commit_write(count)
+        return count
@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright 2026 Johannes Demel.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+"""
+Streaming statistics of channel gains over long runs in constant memory.
+
+Every accumulator takes one array of values per step, e.g. the gains of a batch of links or of all subcarriers,
+and updates its state vectorized over all elements. Results are available at any time.
+`ChannelStatistics` attaches all of them to a channel and updates them on every step.
+"""
+
+import numpy as np
+
+
+def channel_gains(channel):
+    """Power gains of a channel: per subcarrier in the frequency domain, the tap energy in the time domain.
+
+    Frequency domain and OFDM channels, e.g. from `ChannelFactory('frequency', ...).create()`,
+    provide `freq_domain_gains`.
+    """
+    if hasattr(channel, 'freq_domain_gains'):
+        return channel.freq_domain_gains()
+    taps = np.asarray(channel.time_domain_taps() if hasattr(channel, 'time_domain_taps') else channel.channel_taps())
+    return np.sum(taps.real ** 2 + taps.imag ** 2, axis=-1)
+
+
+class RunningMoments(object):
+    """RunningMoments
+
+    Mean and variance per element over all steps with Welford's update, numerically stable for long runs.
+    """
+
+    def __init__(self):
+        self._count = 0
+        self._mean = 0.
+        self._m2 = 0.
+
+    def update(self, values):
+        values = np.asarray(values, dtype=np.float64)
+        count = self._count + 1
+        delta = values - self._mean
+        self._mean = self._mean + delta / count
+        self._m2 = self._m2 + delta * (values - self._mean)
+        self._count = count
+
+    def count(self):
+        return self._count
+
+    def mean(self):
+        return self._mean
+
+    def variance(self):
+        """Unbiased variance per element."""
+        if self._count < 2:
+            return np.full(np.shape(self._mean), np.nan)
+        return self._m2 / (self._count - 1)
+
+    def total_mean(self):
+        """Mean over all elements and steps."""
+        return np.mean(self._mean)
+
+
+class FixedBinHistogram(object):
+    """FixedBinHistogram
+
+    Histogram with `num_bins` equal bins in `[low, high)` over all elements and steps.
+    Values below `low` and from `high` on are counted separately.
+    """
+
+    def __init__(self, low, high, num_bins=100):
+        if high <= low:
+            raise ValueError('Expected low < high, got [{}, {})'.format(low, high))
+        self._low = low
+        self._high = high
+        self._num_bins = num_bins
+        self._width = (high - low) / num_bins
+        # underflow bin first, overflow bin last.
+        self._counts = np.zeros(num_bins + 2, dtype=np.int64)
+
+    def update(self, values):
+        indices = np.floor((np.asarray(values, dtype=np.float64).reshape(-1) - self._low) / self._width)
+        indices = np.clip(indices, -1, self._num_bins).astype(np.int64) + 1
+        self._counts += np.bincount(indices, minlength=self._num_bins + 2)
+
+    def bin_edges(self):
+        return self._low + self._width * np.arange(self._num_bins + 1)
+
+    def counts(self):
+        return self._counts[1:-1]
+
+    def underflow(self):
+        return self._counts[0]
+
+    def overflow(self):
+        return self._counts[-1]
+
+    def num_values(self):
+        return np.sum(self._counts)
+
+    def pdf(self):
+        """Probability density per bin, relative to all values including under- and overflow."""
+        return self.counts() / (max(self.num_values(), 1) * self._width)
+
+    def cdf(self):
+        """Probability of a value below the upper edge of every bin."""
+        return (self.underflow() + np.cumsum(self.counts())) / max(self.num_values(), 1)
+
+
+class LevelCrossingAccumulator(object):
+    """LevelCrossingAccumulator
+
+    Downward level crossings and fades below every threshold, per element and step.
+    The rates and durations follow `channelmodel.markov.fading_statistics`, i.e. the first step only sets the state.
+    Completed fades, from a downward to an upward crossing, are counted per duration in steps,
+    fades of `max_fade_steps` steps and longer in the last bin.
+    """
+
+    def __init__(self, thresholds, time_delta=1.e-3, max_fade_steps=1000):
+        self._thresholds = np.asarray(thresholds, dtype=np.float64).reshape(-1)
+        self._time_delta = time_delta
+        self._max_fade_steps = max_fade_steps
+        self._below = None
+        self._fade_steps = None
+        self._num_steps = 0
+        self._num_elements = 0
+        self._crossings = np.zeros(self._thresholds.size, dtype=np.int64)
+        self._steps_below = np.zeros(self._thresholds.size, dtype=np.int64)
+        self._fade_durations = np.zeros((self._thresholds.size, max_fade_steps + 1), dtype=np.int64)
+
+    def thresholds(self):
+        return self._thresholds
+
+    def update(self, values):
+        values = np.asarray(values).reshape(-1)
+        below = values[None, :] < self._thresholds[:, None]
+        self._num_steps += 1
+        if self._below is None:
+            self._num_elements = values.size
+            self._below = below
+            # fades in progress at the first step have no known start.
+            self._fade_steps = np.zeros(below.shape, dtype=np.int64)
+            return
+        starts = below & ~self._below
+        ends = ~below & self._below & (self._fade_steps > 0)
+        self._crossings += np.count_nonzero(starts, axis=-1)
+        self._steps_below += np.count_nonzero(below, axis=-1)
+
+        rows, cols = np.nonzero(ends)
+        durations = np.minimum(self._fade_steps[rows, cols], self._max_fade_steps)
+        np.add.at(self._fade_durations, (rows, durations), 1)
+        self._fade_steps[ends | ~below] = 0
+        self._fade_steps[starts | (below & (self._fade_steps > 0))] += 1
+        self._below = below
+
+    def num_steps(self):
+        return self._num_steps
+
+    def crossings(self):
+        return self._crossings
+
+    def observed_duration(self):
+        return max(self._num_steps - 1, 0) * self._num_elements * self._time_delta
+
+    def level_crossing_rate(self):
+        """Downward crossings per second per threshold."""
+        return self._crossings / max(self.observed_duration(), self._time_delta)
+
+    def average_fade_duration(self):
+        """Time below every threshold per crossing in seconds."""
+        return self._steps_below * self._time_delta / np.maximum(self._crossings, 1)
+
+    def fade_duration_counts(self):
+        """Completed fades `(num_thresholds, max_fade_steps + 1)` per duration in steps, index 0 is unused."""
+        return self._fade_durations
+
+    def fade_duration_cdf(self):
+        """Probability of a completed fade of at most `n` steps, `(num_thresholds, max_fade_steps + 1)`."""
+        return np.cumsum(self._fade_durations, axis=-1) / np.maximum(np.sum(self._fade_durations, axis=-1,
+                                                                            keepdims=True), 1)
+
+
+class ChannelStatistics(object):
+    """ChannelStatistics
+
+    Streaming statistics of a channel, or a batch of channels, in dB.
+    channel: any channel with `step`, its gains are read with `gain_function`, default `channel_gains`.
+    thresholds_db: fade thresholds for level crossings and fade durations.
+    histogram_range_db: `(low, high)` of the gain histogram with `num_bins` bins.
+    `step` advances the channel and updates all accumulators, `update` only reads the current gains.
+    """
+
+    def __init__(self, channel, thresholds_db=(-10., ), time_delta=1.e-3, histogram_range_db=(-40., 10.),
+                 num_bins=100, max_fade_steps=1000, gain_function=channel_gains):
+        self._channel = channel
+        self._time_delta = time_delta
+        self._gain_function = gain_function
+        self._moments = RunningMoments()
+        self._histogram = FixedBinHistogram(histogram_range_db[0], histogram_range_db[1], num_bins)
+        self._level_crossings = LevelCrossingAccumulator(10. ** (np.asarray(thresholds_db) / 10.), time_delta,
+                                                         max_fade_steps)
+
+    def state(self):
+        return {'time_delta': self._time_delta,
+                'thresholds_db': 10. * np.log10(self._level_crossings.thresholds()),
+                'num_steps': self.num_steps()}
+
+    def moments(self):
+        """Linear gain moments per element."""
+        return self._moments
+
+    def histogram(self):
+        """Gain histogram in dB."""
+        return self._histogram
+
+    def level_crossings(self):
+        return self._level_crossings
+
+    def num_steps(self):
+        return self._moments.count()
+
+    def update(self):
+        gains = np.asarray(self._gain_function(self._channel), dtype=np.float64)
+        self._moments.update(gains)
+        with np.errstate(divide='ignore'):
+            self._histogram.update(10. * np.log10(gains))
+        self._level_crossings.update(gains)
+
+    def step(self, num_steps=1):
+        """Advance the channel by `num_steps` steps of `time_delta` and update after each."""
+        if self.num_steps() == 0:
+            self.update()
+        for _ in range(num_steps):
+            self._channel.step(self._time_delta)
+            self.update()
@@ -9,6 +9,26 @@
 import numpy as np
 
 from .awgn import get_complex_noise_vector
+from .powerdelayprofile import scatter_taps
+
+
+def sparse_convolve(tx_symbols, indices, taps, out=None):
+    """sparse_convolve
+
+    Equivalent to `np.convolve(tx_symbols, h, 'full')[0:tx_symbols.size]`
+    for a channel `h` that is given as (delay index, gain) pairs.
+    The cost scales with the number of significant taps instead of the delay spread.
+    An optional `out` buffer must not overlap `tx_symbols`.
+    """
+    if out is None:
+        rx = np.zeros(tx_symbols.size, dtype=np.result_type(tx_symbols, taps))
+    else:
+        rx = out
+        rx[:] = 0.
+    for i, t in zip(indices, taps):
+        if i < tx_symbols.size:
+            rx[i:] += t * tx_symbols[0:tx_symbols.size - i]
+    return rx
 
 
 class TransmissionChannel(object):
@@ -18,47 +38,139 @@ class TransmissionChannel(object):
     def state(self):
         return self._time_variant_channel.state()
 
-    def transmit(self, tx_symbols):
+    def transmit(self, tx_symbols, out=None):
+        if self._time_variant_channel.is_sparse():
+            indices, taps = self._time_variant_channel.sparse_channel_taps()
+            return sparse_convolve(tx_symbols, indices, taps, out)
         h = self._time_variant_channel.channel_taps()
         rx = np.convolve(tx_symbols, h, 'full')[0:tx_symbols.size]
+        if out is not None:
+            out[:] = rx
+            return out
         return rx
 
+    def time_variant_channel(self):
+        return self._time_variant_channel
+
+    def dynamic_state(self):
+        return self._time_variant_channel.dynamic_state()
+
+    def set_dynamic_state(self, dynamic_state):
+        self._time_variant_channel.set_dynamic_state(dynamic_state)
+
     def time_domain_length(self):
         return self._time_variant_channel.channel_length()
 
+    def memory(self):
+        return self.time_domain_length() - 1
+
     def channel_taps(self):
         return self._time_variant_channel.channel_taps()
 
-    def step(self, time_delta=1.e-3):
-        self._time_variant_channel.step(time_delta)
+    def step(self, time_delta=1.e-3, steps=1):
+        self._time_variant_channel.step(time_delta, steps)
+
+    def seek(self, slot):
+        self._time_variant_channel.seek(slot)
 
 
 class TimeVariantChannel(object):
-    def __init__(self, power_delay_profile):
+    """TimeVariantChannel
+
+    Rayleigh fading taps shaped by a power delay profile.
+
+    batch_shape: simulate a batch of independent links at once.
+    All taps then have the shape `batch_shape + (num_taps, )`.
+    stream: optional `KeyedRandomStream`. Slot `k`, i.e. the state after `k` steps, draws its noise
+    from `stream.generator(k)`. `seek(k)` then jumps to slot `k` without replaying all steps.
+    """
+
+    def __init__(self, power_delay_profile, batch_shape=(), stream=None):
         self._pdp = power_delay_profile
-        self._channel_state = get_complex_noise_vector(
-            self._pdp.num_taps())
+        self._batch_shape = tuple(batch_shape)
+        self._stream = stream
+        self._slot = 0
+        self._rng = None if stream is None else stream.generator(0)
+        self._channel_state = get_complex_noise_vector(self.state_shape(), rng=self._rng)
         self._taps = self._channel_state * self._pdp.taps()
 
     def state(self):
         my_state = self._pdp.state()
         return my_state
 
-    def update_channel_state(self, time_delta=1.e-3):
-        self._channel_state = get_complex_noise_vector(self._pdp.num_taps())
+    def dynamic_state(self):
+        s = {'channel_state': self._channel_state, 'taps': self._taps}
+        if self._stream is not None:
+            s['slot'] = self._slot
+        return s
+
+    def set_dynamic_state(self, dynamic_state):
+        if np.shape(dynamic_state['channel_state']) != self._channel_state.shape:
+            raise ValueError('Channel state shape {} does not match {}'.format(
+                np.shape(dynamic_state['channel_state']), self._channel_state.shape))
+        self._channel_state = np.array(dynamic_state['channel_state'],
+                                       dtype=self._channel_state.dtype)
+        self._taps = np.array(dynamic_state['taps'], dtype=self._taps.dtype)
+        if self._stream is not None and 'slot' in dynamic_state:
+            self._slot = int(np.ravel(dynamic_state['slot'])[0])
+            self._rng = self._stream.generator(self._slot)
+
+    def batch_shape(self):
+        return self._batch_shape
+
+    def power_delay_profile(self):
+        return self._pdp
+
+    def state_shape(self):
+        return self._batch_shape + (self._pdp.num_taps(), )
+
+    def update_channel_state(self, time_delta=1.e-3, steps=1):
+        self._channel_state = get_complex_noise_vector(self.state_shape(), rng=self._rng)
 
     def update_channel_taps(self):
         self._taps = self._channel_state * self._pdp.taps()
 
-    def step(self, time_delta=1.e-3):
-        self.update_channel_state(time_delta)
+    def step(self, time_delta=1.e-3, steps=1):
+        """step
+
+        Advance by `steps` steps of `time_delta` in a single update, e.g. over the idle slots of a link.
+        """
+        if self._stream is not None:
+            self._slot += steps
+            self._rng = self._stream.generator(self._slot)
+        self.update_channel_state(time_delta, steps)
+        self.update_channel_taps()
+
+    def slot(self):
+        return self._slot
+
+    def seek(self, slot):
+        """seek
+
+        Jump to `slot`. Independent fading draws the realization of `slot` directly.
+        Requires a stream.
+        """
+        if self._stream is None:
+            raise ValueError('Seeking requires a KeyedRandomStream!')
+        self._slot = slot
+        self._rng = self._stream.generator(slot)
+        self.update_channel_state()
         self.update_channel_taps()
 
     def channel_taps(self):
+        if self._pdp.is_sparse():
+            return scatter_taps(self._pdp.tap_indices(), self._taps,
+                                self._pdp.delay_length())
         return self._taps
 
+    def sparse_channel_taps(self):
+        return self._pdp.tap_indices(), self._taps
+
+    def is_sparse(self):
+        return self._pdp.is_sparse()
+
     def channel_length(self):
-        return self._pdp.num_taps()
+        return self._pdp.delay_length()
 
     def __str__(self):
         s = type(self).__name__ + '('
@@ -68,23 +180,49 @@ class TimeVariantChannel(object):
 
 
 class CoherentTimeVariantChannel(TimeVariantChannel):
-    def __init__(self, power_delay_profile, coherence):
-        super(CoherentTimeVariantChannel, self).__init__(power_delay_profile)
+    """CoherentTimeVariantChannel
+
+    Fading taps that evolve as an AR(1) process.
+    The coherence model determines the correlation between consecutive steps.
+    backend: optional compute backend from `channelmodel.kernels` for the fused AR update.
+    With a stream, the AR update always draws from the stream, i.e. the backend is not used.
+    A jump over `steps` steps weights the state with `sqrt(covariance ** steps)`.
+    Thus, it has the same distribution as `steps` consecutive steps at the cost of one.
+    The state of slot `k` depends on all previous slots. Thus, `seek` only positions the noise stream
+    and keeps the current state, e.g. one restored from a checkpoint with `set_dynamic_state`.
+    """
+
+    def __init__(self, power_delay_profile, coherence, batch_shape=(), backend=None, stream=None):
+        super(CoherentTimeVariantChannel, self).__init__(power_delay_profile, batch_shape, stream)
         self._coherence = coherence
+        self._backend = backend
 
     def state(self):
         s = super(CoherentTimeVariantChannel, self).state()
         s.update(self._coherence.state())
         return s
 
+    def coherence(self):
+        return self._coherence
+
     def current_weight(self, covariance):
         return np.sqrt(covariance)
 
     def next_weight(self, covariance):
         return np.sqrt(1 - covariance)
 
-    def update_channel_state(self, time_delta=1.e-3):
-        cov = self._coherence.coherence_time(time_delta)
-        n = get_complex_noise_vector(self._pdp.num_taps())
+    def update_channel_state(self, time_delta=1.e-3, steps=1):
+        cov = self._coherence.coherence_time(time_delta) ** steps
+        if self._backend is not None and self._rng is None:
+            self._backend.ar_update(self._channel_state, self.current_weight(cov),
+                                    self.next_weight(cov))
+            return
+        n = get_complex_noise_vector(self.state_shape(), rng=self._rng)
         self._channel_state *= self.current_weight(cov)
         self._channel_state += self.next_weight(cov) * n
+
+    def seek(self, slot):
+        if self._stream is None:
+            raise ValueError('Seeking requires a KeyedRandomStream!')
+        self._slot = slot
+        self._rng = self._stream.generator(slot)
@@ -7,14 +7,17 @@
 #
 
 import numpy as np
+import threading
 import unittest
 
 from channelmodel.coherence import ChannelCoherenceRappaport
 from channelmodel.powerdelayprofile import PowerDelayProfile, FFTPowerDelayProfile
 from channelmodel.timevariantchannel import TimeVariantChannel
 from channelmodel.timevariantchannel import CoherentTimeVariantChannel
-from channelmodel.frequencydomainchannel import FrequencyDomainChannel
+from channelmodel.timevariantchannel import TransmissionChannel
+from channelmodel.frequencydomainchannel import FrequencyDomainChannel, calculate_partial_dft
 from channelmodel import ChannelFactory
+from channelmodel.channel import shared_executor
 
 
 class TimeVariantTests(unittest.TestCase):
@@ -83,6 +86,40 @@ class TimeVariantTests(unittest.TestCase):
         self.assertAlmostEqual(np.std(t0.real), ta, 1)
         self.assertAlmostEqual(np.std(t0.imag), ta, 1)
 
+    def test_005_sparse(self):
+        pdp = PowerDelayProfile(46.8e-9, 250.e-9, 1.e9, threshold_db=-25.)
+        chan = CoherentTimeVariantChannel(pdp, self._coherence)
+        self.assertTrue(chan.is_sparse())
+        self.assertEqual(chan.channel_length(), pdp.delay_length())
+        indices, taps = chan.sparse_channel_taps()
+        self.assertEqual(taps.size, pdp.num_taps())
+        dense = chan.channel_taps()
+        self.assertEqual(dense.size, pdp.delay_length())
+        np.testing.assert_array_equal(dense[indices], taps)
+
+        transmission = TransmissionChannel(chan)
+        tx = (np.random.randn(500) + 1.j * np.random.randn(500)).astype(np.complex64)
+        for _ in range(3):
+            ref = np.convolve(tx, chan.channel_taps(), 'full')[0:tx.size]
+            rx = transmission.transmit(tx)
+            self.assertEqual(rx.size, tx.size)
+            np.testing.assert_allclose(rx, ref, rtol=1.e-5, atol=1.e-6)
+            transmission.step()
+
+    def test_006_jump(self):
+        chan = CoherentTimeVariantChannel(self._pdp, self._coherence, batch_shape=(2 ** 15, ))
+        before = np.array(chan.dynamic_state()['channel_state'])
+        chan.step(1.e-3, steps=20)
+        after = chan.dynamic_state()['channel_state']
+        correlation = np.real(np.vdot(before, after)) / np.real(np.vdot(before, before))
+        expected = np.sqrt(self._coherence.coherence_time(1.e-3) ** 20)
+        self.assertAlmostEqual(correlation, expected, 2)
+        self.assertAlmostEqual(np.mean(np.abs(after) ** 2), 1., 1)
+
+        transmission = TransmissionChannel(chan)
+        transmission.step(1.e-3, steps=3)
+        self.assertEqual(transmission.channel_taps().shape, (2 ** 15, self._pdp.num_taps()))
+
 
 class FrequencyDomainChannelTests(unittest.TestCase):
     def setUp(self):
@@ -118,6 +155,53 @@ class FrequencyDomainChannelTests(unittest.TestCase):
         mgains = np.mean(gains, axis=0)
         self.assertTrue(np.all(np.abs(mgains - 1.) < 3.e-2))
 
+    def test_003_sparse(self):
+        pdp = FFTPowerDelayProfile(46.8e-9, 250.e-9, 1.e9, 1024, max_taps=12)
+        chan = FrequencyDomainChannel(TimeVariantChannel(pdp))
+        self.assertEqual(chan.freq_domain_taps().size, 1024)
+        ref = np.fft.fft(chan.time_domain_taps(), 1024)
+        np.testing.assert_allclose(chan.freq_domain_taps(), ref, rtol=1.e-5, atol=1.e-6)
+
+    def test_004_partial_dft(self):
+        ref = FrequencyDomainChannel(self._timevariantchannel)
+        chan = FrequencyDomainChannel(self._timevariantchannel, method='dft')
+        np.testing.assert_allclose(chan.freq_domain_taps(), ref.freq_domain_taps(), rtol=1.e-4, atol=1.e-5)
+
+        allocation = np.arange(24, 60)
+        chan = FrequencyDomainChannel(self._timevariantchannel, allocation)
+        self.assertEqual(chan.subcarriers(), 135)
+        np.testing.assert_array_equal(chan.subcarrier_indices(), allocation)
+        self.assertEqual(chan.freq_domain_taps().size, allocation.size)
+        np.testing.assert_allclose(chan.freq_domain_taps(),
+                                   ref.freq_domain_taps()[allocation], rtol=1.e-4, atol=1.e-5)
+        self.assertEqual(chan.freq_domain_gains().size, allocation.size)
+        chan.set_subcarrier_indices(np.array([0, 7]))
+        self.assertEqual(chan.freq_domain_gains().size, 2)
+
+        taps = np.random.randn(10, 5) + 1.j * np.random.randn(10, 5)
+        freq_taps = calculate_partial_dft(taps, np.arange(5), 64, allocation)
+        self.assertEqual(freq_taps.shape, (10, allocation.size))
+        np.testing.assert_allclose(freq_taps, np.fft.fft(taps, 64)[:, allocation], rtol=1.e-4, atol=1.e-5)
+
+    def test_005_workers(self):
+        pdp = FFTPowerDelayProfile(46.8e-9, 250.e-9, 20.e6, 4096)
+        links = TimeVariantChannel(pdp, batch_shape=(16, ))
+        ref = FrequencyDomainChannel(links)
+        chan = FrequencyDomainChannel(links, workers=4)
+        self.assertEqual(chan.freq_domain_taps().shape, (16, 4096))
+        np.testing.assert_allclose(chan.freq_domain_taps(), ref.freq_domain_taps(), rtol=1.e-4, atol=1.e-5)
+
+    def test_006_lazy(self):
+        chan = FrequencyDomainChannel(self._timevariantchannel)
+        freq_taps = chan.freq_domain_taps()
+        for _ in range(10):
+            chan.step()
+        chan.step(1.e-3, steps=1000)
+        self.assertFalse(np.all(chan.freq_domain_taps() == freq_taps))
+        ref = np.fft.fft(chan.time_domain_taps(), 135)
+        np.testing.assert_allclose(chan.freq_domain_taps(), ref, rtol=1.e-4, atol=1.e-5)
+        np.testing.assert_allclose(chan.freq_domain_gains(), np.abs(ref) ** 2, rtol=1.e-4, atol=1.e-5)
+
 
 class ChannelFactoryTests(unittest.TestCase):
     def setUp(self):
@@ -172,6 +256,36 @@ class ChannelFactoryTests(unittest.TestCase):
                     energy = np.sum(np.abs(pdp.taps()) ** 2)
                     self.assertAlmostEqual(energy, 1. / txa / rxa)
 
+    def test_003_subcarrier_allocation(self):
+        allocation = np.arange(12, 36)
+        cfac = ChannelFactory('frequency', self._channel_type, self._effective_rate, subcarriers=64,
+                              subcarrier_indices=allocation)
+        chan = cfac.create(10.)
+        tx = np.ones(3 * allocation.size, dtype=np.complex64)
+        rx = chan.transmit(tx)
+        self.assertEqual(rx.size, tx.size)
+        self.assertEqual(chan.channel_gains().size, tx.size)
+
+    def test_004_workers(self):
+        threads = threading.active_count()
+        tx = np.ones((2, 1000), dtype=np.complex64)
+        res = []
+        for workers in (None, 4):
+            np.random.seed(3)
+            cfac = ChannelFactory(self._channel_domain, self._channel_type, self._effective_rate,
+                                  tx_antennas=2, rx_antennas=8, equalizer_type='ZF', workers=workers)
+            chan = cfac.create(10.)
+            chan.step()
+            res.append(np.array(chan.transmit(tx)))
+        np.testing.assert_array_equal(res[0], res[1])
+
+        # many channels share one thread pool.
+        channels = [cfac.create(10.) for _ in range(20)]
+        for c in channels:
+            c.transmit(tx)
+        self.assertIs(shared_executor(4), shared_executor(4))
+        self.assertLessEqual(threading.active_count(), threads + 4)
+
 
 if __name__ == '__main__':
     unittest.main(failfast=True)
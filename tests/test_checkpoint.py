@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright 2026 Johannes Demel.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+import os
+import pathlib
+import shutil
+import tempfile
+import numpy as np
+import unittest
+
+from channelmodel import ChannelFactory
+from channelmodel import kernels
+from channelmodel.checkpoint import save_checkpoint, load_checkpoint
+
+
+class CheckpointTests(unittest.TestCase):
+    def setUp(self):
+        self._directory = tempfile.mkdtemp()
+        self._filename = os.path.join(self._directory, 'checkpoint.npz')
+        self._numba_random_used = kernels._numba_random_used
+        kernels._numba_random_used = False
+
+    def tearDown(self):
+        kernels._numba_random_used = self._numba_random_used
+        shutil.rmtree(self._directory)
+
+    def run_steps(self, channel, num_steps):
+        res = []
+        for _ in range(num_steps):
+            channel.step()
+            res.append(np.array(channel.channel_taps()))
+        return np.array(res)
+
+    def test_001_resume(self):
+        factory = ChannelFactory('frequency', 'rayleigh', 1., subcarriers=32,
+                                 carrier_frequency=3.8e9, velocity=15.)
+        channel = factory.create(5.)
+        self.run_steps(channel, 5)
+        save_checkpoint(self._filename, channel, sweep_index=np.array(5))
+        reference = self.run_steps(channel, 10)
+        tx = np.ones(32, dtype=np.complex64)
+        channel.transmit(tx)
+        reference_gains = channel.channel_gains()
+
+        restored = factory.create(5.)
+        extra = load_checkpoint(self._filename, restored)
+        self.assertEqual(int(extra['sweep_index']), 5)
+        np.testing.assert_array_equal(self.run_steps(restored, 10), reference)
+        restored.transmit(tx)
+        np.testing.assert_array_equal(restored.channel_gains(), reference_gains)
+
+    def test_002_bulk(self):
+        factory = ChannelFactory('time', 'rayleigh', 1., tx_antennas=2, rx_antennas=2,
+                                 carrier_frequency=3.8e9, velocity=15., equalizer_type='ZF')
+        channels = [factory.create(5.) for _ in range(4)]
+        save_checkpoint(self._filename, channels)
+        reference = [self.run_steps(c, 3) for c in channels]
+
+        restored = [factory.create(5.) for _ in range(4)]
+        load_checkpoint(self._filename, restored)
+        for c, r in zip(restored, reference):
+            np.testing.assert_array_equal(self.run_steps(c, 3), r)
+
+        self.assertRaises(ValueError, load_checkpoint, self._filename, restored[0])
+        self.assertRaises(ValueError, load_checkpoint, self._filename, restored[0:2])
+
+    def test_003_path(self):
+        filename = pathlib.Path(self._filename)
+        channel = ChannelFactory('time', 'rayleigh', 1., equalizer_type='ZF').create(5.)
+        save_checkpoint(filename, channel)
+        self.assertTrue(filename.exists())
+        self.assertFalse(filename.with_name(filename.name + '.tmp').exists())
+        restored = ChannelFactory('time', 'rayleigh', 1., equalizer_type='ZF').create(5.)
+        load_checkpoint(filename, restored)
+        np.testing.assert_array_equal(restored.channel_taps(), channel.channel_taps())
+
+    def test_004_importance_sampling(self):
+        for domain in ('time', 'frequency'):
+            factory = ChannelFactory(domain, 'rayleigh', 1., subcarriers=16, equalizer_type='ZF',
+                                     noise_scale=2., fading_scale=.1)
+            channel = factory.create(5.)
+            channel.step()
+            channel.transmit(np.ones(16, dtype=np.complex64))
+            save_checkpoint(self._filename, channel)
+
+            restored = factory.create(5.)
+            load_checkpoint(self._filename, restored)
+            self.assertNotEqual(channel.log_weights(), 0.)
+            self.assertEqual(restored.log_weights(), channel.log_weights())
+
+    def test_005_numba_random(self):
+        channel = ChannelFactory('time', 'rayleigh', 1., equalizer_type='ZF').create(5.)
+        kernels._numba_random_used = True
+        self.assertRaises(ValueError, save_checkpoint, self._filename, channel)
+        self.assertFalse(os.path.exists(self._filename))
+        save_checkpoint(self._filename, channel, include_rng=False)
+
+
+if __name__ == '__main__':
+    unittest.main(failfast=True)
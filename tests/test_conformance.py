@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright 2026 Johannes Demel.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+import numpy as np
+import unittest
+
+from channelmodel import ChannelFactory
+from channelmodel.coherence import ChannelCoherenceRappaport
+from channelmodel.conformance import run_conformance, check_coherence, z_score, format_results
+from channelmodel.powerdelayprofile import PowerDelayProfile
+from channelmodel.timevariantchannel import CoherentTimeVariantChannel
+
+
+class ConformanceTests(unittest.TestCase):
+    def setUp(self):
+        np.random.seed(11)
+
+    def tearDown(self):
+        pass
+
+    def test_001_configurations(self):
+        configurations = [
+            {'channel_domain': 'time', 'tx_antennas': 2, 'rx_antennas': 2},
+            {'channel_domain': 'time', 'carrier_frequency': 3.8e9, 'velocity': 15., 'backend': 'numpy'},
+            {'channel_domain': 'time', 'bandwidth': 1.e9, 'tap_threshold_db': -20.},
+            {'channel_domain': 'frequency', 'subcarriers': 64, 'carrier_frequency': 3.8e9, 'velocity': 15.},
+        ]
+        for c in configurations:
+            factory = ChannelFactory(channel_type='rayleigh', effective_rate=1., equalizer_type='ZF', **c)
+            results = run_conformance(factory, 2 ** 14)
+            self.assertTrue(all(r.passed for r in results), format_results(results))
+
+    def test_002_detect_violation(self):
+        class BrokenChannel(CoherentTimeVariantChannel):
+            def current_weight(self, covariance):
+                return covariance
+
+        pdp = PowerDelayProfile(46.8e-9, 250.e-9, 20.e6)
+        channel = BrokenChannel(pdp, ChannelCoherenceRappaport(3.8e9, 15.), (2 ** 14, ))
+        result = check_coherence(channel, (1.e-3, ), z_score(1.e-3))
+        self.assertFalse(result.passed)
+
+
+if __name__ == '__main__':
+    unittest.main(failfast=True)
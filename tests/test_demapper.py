@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright 2026 Johannes Demel.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+import numpy as np
+import unittest
+
+from channelmodel import ChannelFactory
+from channelmodel.awgn import AWGN
+from channelmodel.channel import FrequencyDomainRayleighChannel
+from channelmodel.demapper import QAMModem
+from channelmodel.estimation import LMMSEChannelEstimator
+
+
+class QAMModemTests(unittest.TestCase):
+    def setUp(self):
+        np.random.seed(19)
+
+    def tearDown(self):
+        pass
+
+    def test_001_constellation(self):
+        for order in (2, 4, 16, 64, 256):
+            modem = QAMModem(order)
+            constellation = modem.constellation()
+            self.assertEqual(constellation.size, order)
+            self.assertAlmostEqual(np.mean(np.abs(constellation) ** 2), 1., 5)
+            self.assertEqual(np.unique(np.round(constellation, 4)).size, order)
+            # Gray coding: nearest neighbors differ in one bit.
+            distances = np.abs(constellation[:, None] - constellation[None, :])
+            np.fill_diagonal(distances, np.inf)
+            neighbors = np.isclose(distances, np.amin(distances))
+            i, j = np.nonzero(neighbors)
+            self.assertTrue(np.all([bin(a ^ b).count('1') == 1 for a, b in zip(i, j)]))
+        self.assertRaises(ValueError, QAMModem, 8)
+
+    def test_002_demap(self):
+        modem = QAMModem(16)
+        bits = np.random.randint(0, 2, 4 * 1000)
+        symbols = modem.modulate(bits)
+        llrs = modem.demap(symbols, 100.)
+        self.assertEqual(llrs.shape, bits.shape)
+        np.testing.assert_array_equal(modem.hard_decision(llrs), bits)
+
+        # compare against the exhaustive max-log LLR.
+        rx = symbols[0:16] + .3 * (np.random.randn(16) + 1.j * np.random.randn(16))
+        constellation = modem.constellation()
+        labels = (np.arange(16)[:, None] >> np.arange(3, -1, -1)) & 1
+        distances = np.abs(rx[:, None] - constellation[None, :]) ** 2
+        expected = np.array([[np.amin(d[labels[:, b] == 1]) - np.amin(d[labels[:, b] == 0])
+                              for b in range(4)] for d in distances]).reshape(-1) * 2.
+        np.testing.assert_allclose(modem.demap(rx, 2.), expected, rtol=1.e-4, atol=1.e-4)
+
+    def test_003_channel(self):
+        modem = QAMModem(16)
+        bits = np.random.randint(0, 2, 4 * 64 * 8)
+        for equalizer_type in ('MF', 'ZF', 'MMSE'):
+            factory = ChannelFactory('frequency', 'rayleigh', 1., subcarriers=64, equalizer_type=equalizer_type)
+            channel = factory.create(40.)
+            rx, snr = channel.transmit(modem.modulate(bits), return_snr=True)
+            self.assertEqual(snr.shape, (64, ))
+            taps = channel.dynamic_state()['freq_taps']
+            np.testing.assert_allclose(snr, np.abs(taps) ** 2 * 10. ** 4, rtol=1.e-4)
+            self.assertIs(channel.effective_snr(), snr)
+            llrs = modem.demap(rx, snr, channel.equalizer_gain())
+            errors = np.mean(modem.hard_decision(llrs) != bits)
+            self.assertLess(errors, .02)
+            channel.step()
+            self.assertIsNot(channel.effective_snr(), snr)
+
+    def test_004_estimation_error(self):
+        modem = QAMModem(16)
+        bits = np.random.randint(0, 2, 4 * 64 * 8)
+        pilots = np.arange(0, 64, 8)
+        factory = ChannelFactory('frequency', 'rayleigh', 1., subcarriers=64, seed=4)
+        magnitudes = []
+        for pilot_snr in (30., 10., 0.):
+            fading_channel = factory.create_fading_channel()
+            estimator = LMMSEChannelEstimator(fading_channel.time_variant_channel().power_delay_profile(), 64,
+                                              pilots, pilot_snr)
+            channel = FrequencyDomainRayleighChannel(AWGN(30.), fading_channel, 'MMSE', estimator)
+            rx, snr = channel.transmit(modem.modulate(bits), return_snr=True)
+            np.testing.assert_allclose(channel.noise_variance(), 1.e-3 + estimator.mse())
+            magnitudes.append(np.mean(np.abs(modem.demap(rx, snr, channel.equalizer_gain()))))
+        # poor estimates yield less confident LLRs.
+        self.assertGreater(magnitudes[0], 2. * magnitudes[1])
+        self.assertGreater(magnitudes[1], 2. * magnitudes[2])
+
+
+if __name__ == '__main__':
+    unittest.main(failfast=True)
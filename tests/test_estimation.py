@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright 2026 Johannes Demel.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+import numpy as np
+import unittest
+
+from channelmodel import ChannelFactory
+from channelmodel.estimation import LMMSEChannelEstimator, frequency_correlation, lmmse_filter
+from channelmodel.frequencydomainchannel import FrequencyDomainChannel
+from channelmodel.powerdelayprofile import FFTPowerDelayProfile
+from channelmodel.timevariantchannel import TimeVariantChannel
+
+
+class LMMSEChannelEstimatorTests(unittest.TestCase):
+    def setUp(self):
+        np.random.seed(13)
+        self._pdp = FFTPowerDelayProfile(46.e-9, 250.e-9, 20.e6, 64)
+        self._pilots = np.arange(0, 64, 4)
+
+    def tearDown(self):
+        pass
+
+    def test_001_correlation(self):
+        r = frequency_correlation(self._pdp, 64, np.arange(64), np.arange(64))
+        np.testing.assert_allclose(r, r.conj().T, atol=1.e-6)
+        np.testing.assert_allclose(np.diag(r).real, 1., rtol=1.e-5)
+        channel = FrequencyDomainChannel(TimeVariantChannel(self._pdp, (2 ** 14, )))
+        freq_taps = channel.freq_domain_taps()
+        empirical = freq_taps[:, 0:4].T @ np.conj(freq_taps[:, 0:4]) / freq_taps.shape[0]
+        np.testing.assert_allclose(empirical, r[0:4, 0:4], atol=.05)
+
+    def test_002_filter(self):
+        w = lmmse_filter(self._pdp, 64, self._pilots, .01)
+        self.assertEqual(w.shape, (64, 16))
+        self.assertIs(lmmse_filter(self._pdp, 64, self._pilots, .01), w)
+        self.assertIsNot(lmmse_filter(self._pdp, 64, self._pilots, .1), w)
+        w = lmmse_filter(self._pdp, 64, self._pilots, .01, np.arange(8, 24))
+        self.assertEqual(w.shape, (16, 16))
+
+    def test_003_estimate(self):
+        estimator = LMMSEChannelEstimator(self._pdp, 64, self._pilots, 10.)
+        channel = FrequencyDomainChannel(TimeVariantChannel(self._pdp, (2 ** 12, )))
+        estimate = estimator.estimate_channel(channel.time_variant_channel())
+        self.assertEqual(estimate.shape, (2 ** 12, 64))
+        error = np.mean(np.abs(estimate - channel.freq_domain_taps()) ** 2, axis=0)
+        mse = estimator.mse()
+        np.testing.assert_allclose(error, mse, rtol=.15)
+        self.assertLess(np.amax(mse), estimator.noise_variance())
+
+    def test_004_factory(self):
+        factory = ChannelFactory('frequency', 'rayleigh', 1., subcarriers=64, equalizer_type='ZF',
+                                 pilot_indices=self._pilots)
+        channel = factory.create(60.)
+        self.assertEqual(channel.state()['estimator'], 'LMMSE')
+        tx = np.ones(128, dtype=np.complex64)
+        rx = channel.transmit(tx)
+        np.testing.assert_allclose(rx, tx, atol=.05)
+
+        channel = factory.create(0.)
+        rx = channel.transmit(tx)
+        self.assertGreater(np.mean(np.abs(rx - tx) ** 2), .1)
+
+
+if __name__ == '__main__':
+    unittest.main(failfast=True)
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright 2026 Johannes Demel.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+import numpy as np
+import unittest
+
+from channelmodel import ChannelFactory
+from channelmodel.ici import banded_ici, ici_coefficients
+
+
+def linear_variation_reference(freq_taps, tx_mod, cp_length):
+    """Time domain OFDM over taps that vary linearly between the symbol boundaries, one sample at a time."""
+    num_symbols, subcarriers = tx_mod.shape
+    taps = np.fft.ifft(freq_taps, axis=-1)
+    samples = np.arange(subcarriers)
+    res = np.empty(tx_mod.shape, dtype=complex)
+    for m in range(num_symbols):
+        body = np.fft.ifft(tx_mod[m])
+        rx = np.empty(subcarriers, dtype=complex)
+        for n in samples:
+            h = taps[m] + (cp_length + n + .5) / (subcarriers + cp_length) * (taps[m + 1] - taps[m])
+            rx[n] = np.sum(h * body[(n - samples) % subcarriers])
+        res[m] = np.fft.fft(rx)
+    return res
+
+
+class IntercarrierInterferenceTests(unittest.TestCase):
+    def setUp(self):
+        np.random.seed(9)
+        self._factory = ChannelFactory('frequency', 'rayleigh', 1., subcarriers=64, bandwidth=1.e6,
+                                       carrier_frequency=30.e9, velocity=140., equalizer_type='ZF', seed=4)
+        self._tx = np.exp(.5j * np.pi * np.random.randint(0, 4, (3, 64)) + .25j * np.pi).astype(np.complex64)
+
+    def tearDown(self):
+        pass
+
+    def test_001_coefficients(self):
+        offsets, coefficients = ici_coefficients(64, 16, 3)
+        np.testing.assert_array_equal(offsets, np.arange(-3, 4))
+        self.assertEqual(coefficients[3], 0.)
+        self.assertTrue(np.all(np.diff(np.abs(coefficients[4:])) < 0.))
+        offsets, coefficients = ici_coefficients(8, 0, 4)
+        self.assertEqual(np.unique(offsets % 8).size, offsets.size)
+        symbols = np.zeros(8, dtype=complex)
+        symbols[0] = 1.
+        np.testing.assert_allclose(banded_ici(symbols, offsets, coefficients)[1:4], coefficients[5:8])
+
+    def test_002_exact_model(self):
+        reference = self._factory.create_ici_channel(16, snr_db=300.)
+        expected = linear_variation_reference(reference.symbol_taps(3), self._tx, 16)
+        channel = self._factory.create_ici_channel(16, ici_bandwidth=32, snr_db=300.)
+        # undo the ZF equalizer.
+        rx = channel.transmit(self._tx.reshape(-1)).reshape(3, 64) * channel.mid_symbol_taps()
+        np.testing.assert_allclose(rx, expected, rtol=1.e-4, atol=1.e-5)
+
+    def test_003_banded_model(self):
+        reference = self._factory.create_ici_channel(16, snr_db=300.)
+        expected = linear_variation_reference(reference.symbol_taps(3), self._tx, 16)
+        channel = self._factory.create_ici_channel(16, ici_bandwidth=2, snr_db=300.)
+        rx = channel.transmit(self._tx.reshape(-1)).reshape(3, 64) * channel.mid_symbol_taps()
+        no_ici = channel.mid_symbol_taps() * self._tx
+        self.assertLess(np.mean(np.abs(rx - expected) ** 2), .5 * np.mean(np.abs(no_ici - expected) ** 2))
+
+    def test_004_static_channel(self):
+        factory = ChannelFactory('frequency', 'rayleigh', 1., subcarriers=64, carrier_frequency=3.8e9,
+                                 velocity=1.e-3, equalizer_type='ZF')
+        channel = factory.create_ici_channel(16, snr_db=300.)
+        np.testing.assert_allclose(channel.transmit(self._tx.reshape(-1)), self._tx.reshape(-1), rtol=1.e-3)
+        with self.assertRaises(ValueError):
+            ChannelFactory('frequency', 'rayleigh', 1., subcarriers=64).create_ici_channel(16)
+
+
+if __name__ == '__main__':
+    unittest.main(failfast=True)
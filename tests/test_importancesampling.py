@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright 2026 Johannes Demel.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+import numpy as np
+import unittest
+
+from channelmodel import ChannelFactory
+from channelmodel.importancesampling import (ImportanceSamplingAWGN, ImportanceSamplingEstimator,
+                                             ImportanceSamplingTimeVariantChannel)
+from channelmodel.powerdelayprofile import PowerDelayProfile
+
+
+class ImportanceSamplingTests(unittest.TestCase):
+    def setUp(self):
+        np.random.seed(17)
+
+    def tearDown(self):
+        pass
+
+    def test_001_noise(self):
+        # P(|n| ** 2 > 14 sigma ** 2) = exp(-14) ~ 8.3e-7
+        awgn = ImportanceSamplingAWGN(0., noise_scale=8.)
+        rx = awgn.transmit(np.zeros((2 ** 15, 1), dtype=np.complex64))
+        self.assertEqual(awgn.log_weights().shape, (2 ** 15, ))
+        estimator = ImportanceSamplingEstimator()
+        estimator.update(np.abs(rx[:, 0]) ** 2 > 14., awgn.log_weights())
+        self.assertLess(np.abs(estimator.estimate() / np.exp(-14.) - 1.), 4. * estimator.relative_error())
+        self.assertLess(estimator.relative_error(), .05)
+        self.assertAlmostEqual(estimator.mean_weight(), 1., 1)
+        self.assertGreater(estimator.effective_sample_size(), 100.)
+
+        awgn.step()
+        self.assertEqual(awgn.log_weights(), 0.)
+
+    def test_002_deep_fades(self):
+        # flat Rayleigh fading, P(|h| ** 2 < 1e-5) ~ 1e-5
+        pdp = PowerDelayProfile(46.e-9, 40.e-9, 20.e6)
+        self.assertEqual(pdp.num_taps(), 1)
+        channel = ImportanceSamplingTimeVariantChannel(pdp, 1.e-4, (2 ** 14, ))
+        estimator = ImportanceSamplingEstimator()
+        for _ in range(2):
+            gains = np.abs(channel.channel_taps()[:, 0]) ** 2
+            estimator.update(gains < 1.e-5, channel.log_weights())
+            channel.step()
+        self.assertEqual(estimator.num_frames(), 2 ** 15)
+        expected = 1. - np.exp(-1.e-5)
+        self.assertLess(np.abs(estimator.estimate() / expected - 1.), 4. * estimator.relative_error())
+        self.assertLess(estimator.relative_error(), .05)
+
+    def test_003_factory(self):
+        factory = ChannelFactory('frequency', 'rayleigh', 1., subcarriers=16, noise_scale=2., fading_scale=.1)
+        channel = factory.create(10.)
+        self.assertEqual(channel.state()['noise_scale'], 2.)
+        channel.transmit(np.ones(32, dtype=np.complex64))
+        self.assertEqual(np.shape(channel.log_weights()), ())
+        self.assertNotEqual(channel.log_weights(), 0.)
+
+        factory = ChannelFactory('time', 'rayleigh', 1., tx_antennas=2, rx_antennas=2, equalizer_type='ZF',
+                                 fading_scale=.1)
+        channel = factory.create(10.)
+        taps = np.array(channel.channel_taps())
+        self.assertEqual(np.shape(channel.log_weights()), ())
+        self.assertLess(np.mean(np.abs(taps) ** 2), .1 / 3.)
+        self.assertEqual(ChannelFactory('time', 'rayleigh', 1., equalizer_type='ZF').create().log_weights(), 0.)
+
+        factory = ChannelFactory('time', 'rayleigh', 1., equalizer_type='ZF', fading_scale=.1,
+                                 carrier_frequency=3.8e9, velocity=15.)
+        self.assertRaises(ValueError, factory.create)
+
+    def test_004_seek_initial(self):
+        factory = ChannelFactory('time', 'rayleigh', 1., equalizer_type='ZF', fading_scale=.1, seed=3)
+        channel = factory.create(10.)
+        taps = np.array(channel.channel_taps())
+        log_weights = channel.log_weights()
+        channel.step()
+        channel.seek(0)
+        np.testing.assert_array_equal(np.array(channel.channel_taps()), taps)
+        self.assertEqual(channel.log_weights(), log_weights)
+
+
+if __name__ == '__main__':
+    unittest.main(failfast=True)
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright 2026 Johannes Demel.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+import numpy as np
+import unittest
+
+from channelmodel import ChannelFactory
+
+
+class InterferenceChannelTests(unittest.TestCase):
+    def setUp(self):
+        np.random.seed(7)
+        self._powers_db = np.array([-3., -10., -20.])
+
+    def tearDown(self):
+        pass
+
+    def test_001_time_domain(self):
+        factory = ChannelFactory('time', 'rayleigh', 1., subcarriers=64, equalizer_type='ZF', max_taps=4)
+        channel = factory.create_interference_channel(3, self._powers_db, snr_db=300.)
+        self.assertEqual(channel.num_interferers(), 3)
+        tx = (np.random.normal(size=(4, 256)) + 1.j * np.random.normal(size=(4, 256))).astype(np.complex64)
+        rx = channel.transmit(tx)
+        taps = channel.channel_taps()
+        amplitudes = np.concatenate(([1.], 10. ** (self._powers_db / 20.)))
+        expected = np.sum([a * np.convolve(s, h)[0:s.size] for a, s, h in zip(amplitudes, tx, taps)], axis=0)
+        np.testing.assert_allclose(rx, expected, rtol=1.e-4, atol=1.e-4)
+
+        sinr = channel.sinr()
+        self.assertEqual(sinr.shape, (64, ))
+        freq_taps = np.fft.fft(taps, 64)
+        gains = np.abs(freq_taps) ** 2
+        np.testing.assert_allclose(sinr, gains[0] / np.sum(amplitudes[1:, None] ** 2 * gains[1:], axis=0), rtol=1.e-3)
+
+        self.assertRaises(ValueError, channel.transmit, tx[0:3])
+        mimo = ChannelFactory('time', 'rayleigh', 1., tx_antennas=2, equalizer_type='ZF')
+        self.assertRaises(ValueError, mimo.create_interference_channel, 3)
+
+    def test_002_frequency_domain(self):
+        factory = ChannelFactory('frequency', 'rayleigh', 1., subcarriers=32, equalizer_type='MF')
+        channel = factory.create_interference_channel(3, self._powers_db, snr_db=10.)
+        freq_taps = channel.dynamic_state()['freq_taps']
+        self.assertEqual(freq_taps.shape, (4, 32))
+        gains = np.abs(freq_taps) ** 2
+        amplitudes = np.concatenate(([1.], 10. ** (self._powers_db / 20.)))
+        expected = gains[0] / (np.sum(amplitudes[1:, None] ** 2 * gains[1:], axis=0) + .1)
+        np.testing.assert_allclose(channel.sinr(), expected, rtol=1.e-4)
+
+        channel = factory.create_interference_channel(3, self._powers_db, snr_db=300.)
+        freq_taps = channel.dynamic_state()['freq_taps']
+        tx = np.ones((4, 64), dtype=np.complex64)
+        rx = channel.transmit(tx)
+        h = np.tile(freq_taps, 2)
+        expected = np.sum(amplitudes[:, None] * h, axis=0) * np.conj(h[0])
+        np.testing.assert_allclose(rx, expected, rtol=1.e-4, atol=1.e-5)
+        self.assertRaises(ValueError, channel.transmit, tx[:, 0:40])
+
+        channel.step()
+        self.assertFalse(np.all(channel.dynamic_state()['freq_taps'] == freq_taps))
+
+
+if __name__ == '__main__':
+    unittest.main(failfast=True)
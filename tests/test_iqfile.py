@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright 2026 Johannes Demel.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+import os
+import shutil
+import tempfile
+import numpy as np
+import unittest
+
+from channelmodel import ChannelFactory
+from channelmodel.awgn import AWGN
+from channelmodel.iqfile import IQReader, complex_to_iq, iq_to_complex, iq_view, process_iq_file
+from channelmodel.largescale import LargeScaleFading, LargeScaleFadingChannel, PathLoss
+
+
+class IQFileTests(unittest.TestCase):
+    def setUp(self):
+        np.random.seed(23)
+        self._directory = tempfile.mkdtemp()
+        self._input = os.path.join(self._directory, 'capture.iq')
+        self._output = os.path.join(self._directory, 'output.iq')
+        self._samples = (.1 * (np.random.randn(10000) + 1.j * np.random.randn(10000))).astype(np.complex64)
+
+    def tearDown(self):
+        shutil.rmtree(self._directory)
+
+    def test_001_conversion(self):
+        interleaved = self._samples.view(np.float32)
+        view = iq_view(interleaved)
+        self.assertTrue(np.shares_memory(view, interleaved))
+        np.testing.assert_array_equal(view, self._samples)
+        self.assertRaises(ValueError, iq_view, interleaved.astype(np.float64))
+
+        raw = np.empty(2 * self._samples.size, dtype=np.int16)
+        complex_to_iq(self._samples, raw)
+        np.testing.assert_allclose(iq_to_complex(raw), self._samples, atol=1. / 32768.)
+        complex_to_iq(np.array([2. + 2.j], dtype=np.complex64), raw[0:2])
+        np.testing.assert_array_equal(raw[0:2], [32767, 32767])
+
+    def test_002_awgn(self):
+        self._samples.view(np.float32).tofile(self._input)
+        reader = IQReader(self._input, chunk_size=4096)
+        self.assertEqual(reader.num_samples(), 10000)
+        self.assertEqual([c.size for c in reader.chunks()], [4096, 4096, 1808])
+
+        num_samples = process_iq_file(AWGN(300.), self._input, self._output, chunk_size=4096)
+        self.assertEqual(num_samples, 10000)
+        output = np.fromfile(self._output, dtype=np.complex64)
+        np.testing.assert_allclose(output, self._samples, atol=1.e-6)
+
+    def test_003_fading(self):
+        raw = np.empty(2 * self._samples.size, dtype=np.int16)
+        complex_to_iq(self._samples, raw)
+        raw.tofile(self._input)
+        reference = iq_to_complex(raw)
+        factory = ChannelFactory('time', 'rayleigh', 1., equalizer_type='ZF')
+        channel = factory.create(300.)
+        self.assertGreater(channel.channel_length(), 1)
+        process_iq_file(channel, self._input, self._output, dtype='int16', output_dtype='float32', chunk_size=1000)
+        output = np.fromfile(self._output, dtype=np.complex64)
+        expected = np.convolve(reference, channel.channel_taps()[0][0])[0:reference.size]
+        np.testing.assert_allclose(output, expected, atol=1.e-5)
+
+        process_iq_file(channel, self._input, self._output, dtype='int16', chunk_size=1000)
+        output = iq_to_complex(np.fromfile(self._output, dtype=np.int16))
+        np.testing.assert_allclose(output, expected, atol=2. / 32768.)
+
+        mimo = ChannelFactory('time', 'rayleigh', 1., tx_antennas=2, equalizer_type='ZF').create()
+        rejected = os.path.join(self._directory, 'rejected.iq')
+        self.assertRaises(ValueError, process_iq_file, mimo, self._input, rejected, dtype='int16')
+        self.assertFalse(os.path.exists(rejected))
+
+    def test_004_in_place(self):
+        factory = ChannelFactory('time', 'rayleigh', 1., equalizer_type='ZF')
+        channel = factory.create(300.)
+        for dtype in ('float32', 'int16'):
+            raw = np.empty(2 * self._samples.size, dtype=dtype)
+            complex_to_iq(self._samples, raw)
+            raw.tofile(self._input)
+            reference = iq_to_complex(raw)
+            expected = np.convolve(reference, channel.channel_taps()[0][0])[0:reference.size]
+            self.assertEqual(process_iq_file(channel, self._input, self._input, dtype=dtype, chunk_size=999),
+                             self._samples.size)
+            output = iq_to_complex(np.fromfile(self._input, dtype=dtype))
+            np.testing.assert_allclose(output, expected, atol=2. / 32768.)
+        self.assertRaises(ValueError, process_iq_file, channel, self._input, self._input,
+                          dtype='int16', output_dtype='float32')
+
+    def test_005_ofdm(self):
+        self._samples.tofile(self._input)
+        factory = ChannelFactory('time', 'rayleigh', 1., subcarriers=16, equalizer_type='ZF')
+        channel = factory.create_ofdm_channel(4, snr_db=300.)
+        self.assertGreater(channel.channel_length(), 1)
+        process_iq_file(channel, self._input, self._output, chunk_size=80)
+        output = np.fromfile(self._output, dtype=np.complex64)
+        expected = np.convolve(self._samples, channel.channel_taps())[0:self._samples.size]
+        np.testing.assert_allclose(output, expected, atol=1.e-5)
+
+        # the wrapper does not report its memory, thus it cannot be streamed.
+        wrapped = LargeScaleFadingChannel(channel, LargeScaleFading(PathLoss(reference_loss_db=40.)))
+        rejected = os.path.join(self._directory, 'rejected.iq')
+        self.assertRaises(ValueError, process_iq_file, wrapped, self._input, rejected)
+        self.assertFalse(os.path.exists(rejected))
+
+
+if __name__ == '__main__':
+    unittest.main(failfast=True)
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright 2026 Johannes Demel.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+import numpy as np
+import unittest
+
+from channelmodel import ChannelFactory
+from channelmodel.kernels import get_backend, verify_backend, numba
+
+
+class BackendTests(unittest.TestCase):
+    def setUp(self):
+        self._kwargs = {'tx_antennas': 2, 'rx_antennas': 3, 'carrier_frequency': 3.8e9,
+                        'velocity': 15., 'equalizer_type': 'ZF'}
+        self._tx = np.exp(1.j * np.random.uniform(0., 2. * np.pi, (2, 300))).astype(np.complex64)
+
+    def tearDown(self):
+        pass
+
+    def run_channel(self, backend, seed):
+        np.random.seed(seed)
+        channel = ChannelFactory('time', 'rayleigh', 1., backend=backend, **self._kwargs).create(5.)
+        res = []
+        for _ in range(4):
+            channel.step()
+            res.append(np.array(channel.transmit(self._tx)))
+        return np.array(res)
+
+    def test_001_numpy_reference(self):
+        np.testing.assert_array_equal(self.run_channel('numpy', 42), self.run_channel(None, 42))
+        self.assertTrue(all(verify_backend('numpy').values()))
+        self.assertRaises(ValueError, get_backend, 'penguin')
+
+    def test_002_fallback(self):
+        if numba is None:
+            with self.assertWarns(UserWarning):
+                backend = get_backend('numba')
+            self.assertEqual(backend.name(), 'numpy')
+
+    @unittest.skipIf(numba is None, 'numba not installed')
+    def test_003_numba(self):
+        backend = get_backend('numba')
+        self.assertEqual(backend.name(), 'numba')
+        backend.seed(7)
+        self.assertTrue(all(verify_backend(backend).values()))
+        rx = self.run_channel('numba', 3)
+        self.assertEqual(rx.shape, (4, 3, 300))
+        out = [np.zeros(300, dtype=np.complex64) for _ in range(3)]
+        channel = ChannelFactory('time', 'rayleigh', 1., backend='numba', **self._kwargs).create(100.)
+        ref = ChannelFactory('time', 'rayleigh', 1., **self._kwargs).create(100.)
+        channel._fading_channels = ref._fading_channels
+        channel.transmit(self._tx, out=out)
+        np.testing.assert_allclose(np.array(out), np.array(ref.transmit(self._tx)), atol=.05)
+
+        # rows of a wider buffer do not flatten into a view.
+        out = np.zeros((2, 400), dtype=np.complex64)
+        tx = np.ones((2, 300), dtype=np.complex64)
+        self.assertIs(backend.add_noise(tx, .01, out[:, 0:300]).base, out)
+        np.testing.assert_allclose(out[:, 0:300], tx, atol=.1)
+        np.testing.assert_array_equal(out[:, 300:], 0.)
+        state = np.zeros((4, 16), dtype=np.complex64)
+        self.assertRaises(ValueError, backend.ar_update, state[:, 0:8], np.sqrt(.9), np.sqrt(.1))
+
+
+if __name__ == '__main__':
+    unittest.main(failfast=True)
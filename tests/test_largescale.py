@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright 2026 Johannes Demel.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+import numpy as np
+import unittest
+
+from channelmodel import ChannelFactory
+from channelmodel.largescale import PathLoss, ShadowingMap, LargeScaleFading, LargeScaleFadingChannel
+
+
+class LargeScaleFadingTests(unittest.TestCase):
+    def setUp(self):
+        np.random.seed(5)
+        self._map = ShadowingMap(8., 50., (2000., 1500.), resolution=5.)
+
+    def tearDown(self):
+        pass
+
+    def test_001_path_loss(self):
+        path_loss = PathLoss(2., carrier_freq=3.8e9)
+        self.assertAlmostEqual(path_loss.loss_db(1.), 44.04, 1)
+        self.assertAlmostEqual(path_loss.loss_db(100.) - path_loss.loss_db(10.), 20.)
+        self.assertEqual(path_loss.loss_db(.1), path_loss.loss_db(1.))
+        self.assertRaises(ValueError, PathLoss, 3.)
+
+    def test_002_shadowing_statistics(self):
+        m = self._map.map()
+        self.assertEqual(m.shape, (401, 301))
+        self.assertAlmostEqual(np.std(m) / 8., 1., 0)
+        lag = 10  # one decorrelation distance
+        corr = np.mean(m[lag:] * m[0:-lag]) / np.var(m)
+        self.assertLess(np.abs(corr - np.exp(-1.)), .15)
+
+    def test_003_lookup(self):
+        m = self._map.map()
+        positions = np.array([[0., 0.], [5., 10.], [1995., 1495.]])
+        np.testing.assert_allclose(self._map.shadowing_db(positions), [m[0, 0], m[1, 2], m[399, 299]], rtol=1.e-5)
+        middle = self._map.shadowing_db([2.5, 0.])
+        self.assertAlmostEqual(middle, .5 * (m[0, 0] + m[1, 0]), 4)
+        self.assertAlmostEqual(self._map.shadowing_db([-100., -100.]), m[0, 0], 5)
+        users = np.random.uniform(0., 1500., (10, 1000, 2))
+        self.assertEqual(self._map.shadowing_db(users).shape, (10, 1000))
+
+    def test_004_channel(self):
+        large_scale = LargeScaleFading(PathLoss(3., reference_loss_db=40.), self._map, (1000., 750.))
+        factory = ChannelFactory('time', 'awgn', 1., equalizer_type='ZF')
+        channel = LargeScaleFadingChannel(factory.create(200.), large_scale, (1100., 750.))
+        expected_loss = 40. + 30. * 2. + self._map.shadowing_db([1100., 750.])
+        self.assertAlmostEqual(channel.loss_db(), expected_loss, 4)
+        self.assertAlmostEqual(channel.snr(), 200. - expected_loss, 4)
+        tx = np.ones(32, dtype=np.complex64)
+        rx = channel.transmit(tx)
+        self.assertEqual(rx.dtype, np.complex64)
+        np.testing.assert_allclose(rx, 10. ** (-expected_loss / 20.), rtol=1.e-3)
+
+
+if __name__ == '__main__':
+    unittest.main(failfast=True)
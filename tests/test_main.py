@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright 2026 Johannes Demel.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+import json
+import os
+import shutil
+import tempfile
+import numpy as np
+import unittest
+
+from channelmodel.__main__ import main
+
+
+class CommandLineTests(unittest.TestCase):
+    def setUp(self):
+        self._directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self._directory)
+
+    def test_001_generate(self):
+        args = ['generate', '--output', self._directory, '--realizations', '250', '--chunk-size', '100',
+                '--links', '20', '--workers', '2', '--domain', 'frequency', '--subcarriers', '32',
+                '--carrier-frequency', '3.8e9', '--velocity', '15']
+        self.assertEqual(main(args), 0)
+        with open(os.path.join(self._directory, 'manifest.json')) as f:
+            manifest = json.load(f)
+        self.assertEqual(len(manifest['shards']), 3)
+        self.assertEqual(manifest['realizations'], 300)
+        with np.load(os.path.join(self._directory, manifest['shards'][0][0])) as shard:
+            self.assertEqual(shard['freq_taps'].shape, (5, 20, 32))
+            self.assertEqual(shard['gains'].shape, (5, 20, 32))
+            self.assertEqual(shard['taps'].shape, (5, 20, 5))
+            self.assertAlmostEqual(np.mean(shard['gains']), 1., 0)
+            taps = shard['taps']
+        with np.load(os.path.join(self._directory, manifest['shards'][1][0])) as other:
+            self.assertFalse(np.allclose(taps, other['taps']))
+
+    def test_002_generate_mimo(self):
+        args = ['generate', '--output', self._directory, '--realizations', '40', '--chunk-size', '40',
+                '--workers', '1', '--tx-antennas', '2', '--rx-antennas', '3', '--format', 'npy',
+                '--fields', 'taps']
+        self.assertEqual(main(args), 0)
+        taps = np.load(os.path.join(self._directory, 'shard_000000_taps.npy'))
+        self.assertEqual(taps.shape, (1, 40, 3, 2, 5))
+
+    def test_003_bench(self):
+        args = ['bench', '--domain', 'time', 'frequency', '--type', 'awgn', 'rayleigh',
+                '--subcarriers', '48', '--duration', '0.02', '--block-size', '100']
+        self.assertEqual(main(args), 0)
+
+
+if __name__ == '__main__':
+    unittest.main(failfast=True)
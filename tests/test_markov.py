@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright 2026 Johannes Demel.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+import numpy as np
+import unittest
+
+from channelmodel import ChannelFactory
+from channelmodel.markov import (MAX_STATES, MarkovChannelModel, _cache_key, fit_markov_model, simulate_gains,
+                                 validate_markov_model)
+
+
+class MarkovChannelModelTests(unittest.TestCase):
+    def setUp(self):
+        np.random.seed(11)
+        self._factory = ChannelFactory('time', 'rayleigh', 1., equalizer_type='ZF',
+                                       carrier_frequency=3.8e9, velocity=3.)
+
+    def tearDown(self):
+        pass
+
+    def test_001_generate(self):
+        transition_matrix = np.array([[.9, .1, 0.], [.05, .9, .05], [0., .2, .8]])
+        model = MarkovChannelModel([1., 2.], [.5, 1.5, 2.5], transition_matrix)
+        expected = np.array([1. / 3., 2. / 3., 1. / 6.])
+        np.testing.assert_allclose(model.stationary_distribution(), expected / np.sum(expected))
+        states = model.generate(2 ** 20, runs_per_block=2 ** 12)
+        self.assertEqual(states.size, 2 ** 20)
+        self.assertEqual(states.dtype, np.uint8)
+        pairs = states[:-1].astype(int) * 3 + states[1:]
+        counts = np.bincount(pairs, minlength=9).reshape((3, 3))
+        np.testing.assert_allclose(counts / np.sum(counts, axis=1, keepdims=True), transition_matrix, atol=5.e-3)
+        np.testing.assert_allclose(model.gains(states[0:3]), model.levels()[states[0:3]])
+
+    def test_002_fit(self):
+        gains = simulate_gains(self._factory, num_links=256, num_steps=256)
+        model = fit_markov_model(self._factory, num_states=6, gains=gains)
+        self.assertEqual(model.num_states(), 6)
+        np.testing.assert_allclose(np.sum(model.transition_matrix(), axis=1), 1.)
+        np.testing.assert_allclose(model.stationary_distribution(), 1. / 6., atol=.02)
+        self.assertTrue(np.all(np.diff(model.levels()) > 0.))
+        self.assertRaises(ValueError, fit_markov_model, self._factory, num_states=MAX_STATES + 1, gains=gains)
+        self.assertRaises(ValueError, MarkovChannelModel, np.arange(MAX_STATES), np.arange(MAX_STATES + 1),
+                          np.eye(MAX_STATES + 1))
+
+        res = validate_markov_model(model, gains, num_slots=2 ** 18)
+        markov, reference = res['lcr']
+        np.testing.assert_allclose(markov, reference, rtol=.15)
+        markov, reference = res['afd']
+        np.testing.assert_allclose(markov, reference, rtol=.15)
+
+    def test_003_cache(self):
+        model = fit_markov_model(self._factory, num_states=4, num_links=64, num_steps=32)
+        self.assertIs(fit_markov_model(self._factory, num_states=4, num_links=64, num_steps=32), model)
+        self.assertIsNot(fit_markov_model(self._factory, num_states=4, num_links=64, num_steps=32, cache=False), model)
+
+        # numpy summarizes large arrays in `repr`, the key must not.
+        indices = np.arange(2000)
+        other = indices.copy()
+        other[1000] = 2001
+        keys = [_cache_key(ChannelFactory('frequency', 'rayleigh', 1., subcarriers=4096, subcarrier_indices=i), 8)
+                for i in (indices, other, indices.copy())]
+        self.assertEqual(repr(indices), repr(other))
+        self.assertNotEqual(keys[0], keys[1])
+        self.assertEqual(keys[0], keys[2])
+
+
+if __name__ == '__main__':
+    unittest.main(failfast=True)
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright 2026 Johannes Demel.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+import numpy as np
+import unittest
+
+from channelmodel import ChannelFactory
+from channelmodel.metrics import (capacity, capacity_metrics, channel_eigenvalues, channel_matrices,
+                                  ergodic_capacity, outage_probability, rayleigh_ergodic_capacity,
+                                  rayleigh_outage_probability)
+
+
+class CapacityMetricsTests(unittest.TestCase):
+    def setUp(self):
+        np.random.seed(11)
+        self._snr_db = np.arange(0., 21., 5.)
+
+    def tearDown(self):
+        pass
+
+    def test_001_eigenvalues(self):
+        h = (np.random.normal(size=(50, 3, 2, 3)) + 1.j * np.random.normal(size=(50, 3, 2, 3)))
+        eigenvalues = channel_eigenvalues(h)
+        self.assertEqual(eigenvalues.shape, (50, 3, 2))
+        expected = np.linalg.det(np.eye(2) + 10. * h @ np.conj(np.swapaxes(h, -2, -1))).real
+        np.testing.assert_allclose(np.prod(1. + 10. * eigenvalues, axis=-1), expected, rtol=1.e-8)
+        # the transposed channel has the same non-zero eigenvalues.
+        np.testing.assert_allclose(channel_eigenvalues(np.swapaxes(h, -2, -1)), eigenvalues, rtol=1.e-8)
+
+    def test_002_siso_closed_form(self):
+        factory = ChannelFactory('time', 'rayleigh', 1.)
+        capacities = capacity(channel_eigenvalues(channel_matrices(factory, 50000, fft_len=1)), self._snr_db)
+        self.assertEqual(capacities.shape, (self._snr_db.size, 50000))
+        np.testing.assert_allclose(ergodic_capacity(capacities), rayleigh_ergodic_capacity(self._snr_db), rtol=.02)
+        np.testing.assert_allclose(outage_probability(capacities, 1.),
+                                   rayleigh_outage_probability(1., self._snr_db), rtol=.05, atol=2.e-3)
+
+    def test_003_simo_diversity(self):
+        factory = ChannelFactory('time', 'rayleigh', 1., rx_antennas=2)
+        snr_db = np.array([0., 5., 10.])
+        capacities = capacity(channel_eigenvalues(channel_matrices(factory, 50000, fft_len=1)), snr_db)
+        np.testing.assert_allclose(outage_probability(capacities, 1.),
+                                   rayleigh_outage_probability(1., snr_db, diversity=2), rtol=.05, atol=2.e-3)
+
+    def test_004_capacity_metrics(self):
+        factory = ChannelFactory('frequency', 'rayleigh', 1., subcarriers=64, seed=3)
+        metrics = capacity_metrics(factory, self._snr_db, 2., num_realizations=2000)
+        # Monte-Carlo estimate, every realization averages over 64 correlated subcarriers.
+        np.testing.assert_allclose(metrics['ergodic_capacity'], rayleigh_ergodic_capacity(self._snr_db), rtol=.03)
+        self.assertFalse(np.array_equal(metrics['ergodic_capacity'], rayleigh_ergodic_capacity(self._snr_db)))
+        self.assertTrue(np.all(np.diff(metrics['outage_probability']) <= 0.))
+        # frequency diversity beyond a single Rayleigh branch.
+        self.assertGreater(metrics['diversity_order'][-1], 1.)
+        mimo = ChannelFactory('time', 'rayleigh', 1., tx_antennas=2, rx_antennas=2, subcarriers=16)
+        metrics = capacity_metrics(mimo, self._snr_db, 2., num_realizations=2000)
+        self.assertGreater(metrics['ergodic_capacity'][-1], rayleigh_ergodic_capacity(20.))
+
+
+if __name__ == '__main__':
+    unittest.main(failfast=True)
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright 2026 Johannes Demel.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+import numpy as np
+import unittest
+
+from channelmodel import ChannelFactory
+from channelmodel.ofdm import cyclic_prefix_convolve
+
+
+def ofdm_modulate(symbols, cp_length):
+    body = np.fft.ifft(symbols, axis=-1)
+    return np.concatenate((body[:, body.shape[-1] - cp_length:], body), axis=-1).astype(np.complex64)
+
+
+class CyclicPrefixOFDMTests(unittest.TestCase):
+    def setUp(self):
+        np.random.seed(3)
+        self._factory = ChannelFactory('time', 'rayleigh', 1., subcarriers=64, equalizer_type='ZF',
+                                       bandwidth=20.e6, max_delay_spread=400.e-9)
+        symbols = np.exp(.5j * np.pi * np.random.randint(0, 4, (10, 64)))
+        self._tx = ofdm_modulate(symbols, 16)
+
+    def tearDown(self):
+        pass
+
+    def test_001_cyclic_prefix_convolve(self):
+        taps = (np.random.normal(size=8) + 1.j * np.random.normal(size=8)).astype(np.complex64)
+        freq_taps = np.fft.fft(taps, 64)
+        rx = cyclic_prefix_convolve(self._tx, freq_taps, taps, 16)
+        expected = np.convolve(self._tx.reshape(-1), taps)[0:self._tx.size]
+        np.testing.assert_allclose(rx.reshape(-1), expected, rtol=1.e-4, atol=1.e-5)
+
+    def test_002_paths(self):
+        channel = self._factory.create_ofdm_channel(16, snr_db=300., method='frequency')
+        self.assertEqual(channel.channel_length(), 8)
+        rx = channel.transmit(self._tx.reshape(-1))
+        self.assertEqual(rx.dtype, np.complex64)
+        expected = np.convolve(self._tx.reshape(-1), channel.channel_taps())[0:self._tx.size]
+        np.testing.assert_allclose(rx, expected, rtol=1.e-4, atol=1.e-5)
+
+        # received subcarriers equal the transmitted symbols times the frequency response.
+        rx_symbols = np.fft.fft(rx.reshape((10, 80))[:, 16:], axis=-1)
+        tx_symbols = np.fft.fft(self._tx[:, 16:], axis=-1)
+        np.testing.assert_allclose(rx_symbols, tx_symbols * channel.freq_domain_taps(), rtol=1.e-3, atol=1.e-4)
+
+        self.assertRaises(ValueError, channel.transmit, self._tx.reshape(-1)[0:100])
+        channel = self._factory.create_ofdm_channel(16, snr_db=300.)
+        self.assertEqual(channel.transmit(self._tx.reshape(-1)).size, self._tx.size)
+
+        short_cp = ofdm_modulate(np.ones((10, 64)), 4)
+        channel = self._factory.create_ofdm_channel(4, snr_db=300.)
+        rx = channel.transmit(short_cp.reshape(-1))
+        np.testing.assert_allclose(rx, np.convolve(short_cp.reshape(-1), channel.channel_taps())[0:rx.size],
+                                   rtol=1.e-4, atol=1.e-5)
+        channel = self._factory.create_ofdm_channel(4, method='frequency')
+        self.assertRaises(ValueError, channel.transmit, short_cp.reshape(-1))
+
+    def test_003_subcarriers(self):
+        symbols = np.exp(.5j * np.pi * np.random.randint(0, 4, (200, 64))).astype(np.complex64)
+        channel = self._factory.create_ofdm_channel(16, snr_db=300.)
+        rx = channel.transmit_subcarriers(symbols.reshape(-1))
+        self.assertEqual(rx.dtype, np.complex64)
+        expected = np.fft.fft(channel.transmit(ofdm_modulate(symbols, 16).reshape(-1)).reshape((200, 80))[:, 16:])
+        np.testing.assert_allclose(rx, expected.reshape(-1), rtol=1.e-3, atol=1.e-4)
+
+        # the noise per subcarrier equals the FFT of the time domain noise.
+        channel = self._factory.create_ofdm_channel(16, snr_db=10.)
+        noise = channel.transmit_subcarriers(symbols.reshape(-1)) - (symbols * channel.freq_domain_taps()).reshape(-1)
+        time_noise = channel.transmit(np.zeros(200 * 80, dtype=np.complex64)).reshape((200, 80))[:, 16:]
+        self.assertAlmostEqual(np.var(noise) / np.var(np.fft.fft(time_noise)), 1., delta=.05)
+        channel = self._factory.create_ofdm_channel(4)
+        self.assertRaises(ValueError, channel.transmit_subcarriers, symbols.reshape(-1))
+
+
+if __name__ == '__main__':
+    unittest.main(failfast=True)
@@ -11,7 +11,7 @@ import unittest
 
 from .helpers import calculate_average_signal_energy
 
-from channelmodel.powerdelayprofile import PowerDelayProfile, FFTPowerDelayProfile
+from channelmodel.powerdelayprofile import PowerDelayProfile, FFTPowerDelayProfile, prune_tap_indices
 
 
 class PowerDelayProfileTests(unittest.TestCase):
@@ -61,3 +61,40 @@ class PowerDelayProfileTests(unittest.TestCase):
                 f_taps = np.fft.fft(pdp.taps(), subcarriers)
                 e = calculate_average_signal_energy(f_taps)
                 self.assertAlmostEqual(e, 1.0, 5)
+
+    def test_pruning(self):
+        bandwidth = 1.e9
+        dense = PowerDelayProfile(self._rms_delay_spread,
+                                  self._max_delay_spread, bandwidth)
+        self.assertFalse(dense.is_sparse())
+        self.assertEqual(dense.delay_length(), dense.num_taps())
+        np.testing.assert_array_equal(dense.dense_taps(), dense.taps())
+
+        pdp = PowerDelayProfile(self._rms_delay_spread,
+                                self._max_delay_spread, bandwidth,
+                                threshold_db=-30.)
+        self.assertTrue(pdp.is_sparse())
+        self.assertLess(pdp.num_taps(), dense.num_taps())
+        self.assertEqual(pdp.taps().size, pdp.num_taps())
+        self.assertEqual(pdp.supports().size, pdp.num_taps())
+        self.assertAlmostEqual(np.sum(np.abs(pdp.taps()) ** 2), 1.0, 5)
+        powers = np.abs(pdp.taps()) ** 2
+        self.assertGreaterEqual(np.amin(powers) / np.amax(powers), 10. ** -3.)
+        self.assertEqual(pdp.dense_taps().size, pdp.delay_length())
+
+        pdp = PowerDelayProfile(self._rms_delay_spread,
+                                self._max_delay_spread, bandwidth, max_taps=7)
+        self.assertEqual(pdp.num_taps(), 7)
+        np.testing.assert_array_equal(pdp.tap_indices(), np.arange(7))
+        self.assertRaises(ValueError, PowerDelayProfile, self._rms_delay_spread,
+                          self._max_delay_spread, bandwidth, max_taps=0)
+        self.assertRaises(ValueError, PowerDelayProfile, self._rms_delay_spread,
+                          self._max_delay_spread, bandwidth, threshold_db=3.)
+        np.testing.assert_array_equal(prune_tap_indices(np.array([.1, .5, .2]), threshold_db=0.), [1])
+
+        pdp = FFTPowerDelayProfile(self._rms_delay_spread,
+                                   self._max_delay_spread, bandwidth, 1024,
+                                   threshold_db=-20.)
+        self.assertTrue(pdp.is_sparse())
+        f_taps = np.fft.fft(pdp.dense_taps(), 1024)
+        self.assertAlmostEqual(calculate_average_signal_energy(f_taps), 1.0, 5)
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright 2026 Johannes Demel.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+import numpy as np
+import os
+import tempfile
+import unittest
+
+from channelmodel import ChannelFactory
+from channelmodel.awgn import AWGN
+from channelmodel.checkpoint import load_checkpoint, save_checkpoint
+from channelmodel.coherence import ChannelCoherenceRappaport
+from channelmodel.powerdelayprofile import PowerDelayProfile
+from channelmodel.randomstream import KeyedRandomStream
+from channelmodel.timevariantchannel import CoherentTimeVariantChannel, TimeVariantChannel
+
+
+class KeyedRandomStreamTests(unittest.TestCase):
+    def setUp(self):
+        self._pdp = PowerDelayProfile(46.8e-9, 250.e-9, 20.e6)
+        self._coherence = ChannelCoherenceRappaport(3.8e9, 15.)
+
+    def tearDown(self):
+        pass
+
+    def test_001_generator(self):
+        stream = KeyedRandomStream(42, (3, 1))
+        a = stream.generator(5000000).normal(size=8)
+        np.random.seed(0)
+        np.testing.assert_array_equal(KeyedRandomStream(42, (3, 1)).generator(5000000).normal(size=8), a)
+        self.assertFalse(np.any(stream.generator(5000001).normal(size=8) == a))
+        self.assertFalse(np.any(KeyedRandomStream(42, (3, 2)).generator(5000000).normal(size=8) == a))
+        self.assertEqual(stream.substream(7).link(), (3, 1, 7))
+
+    def test_002_seek(self):
+        channel = TimeVariantChannel(self._pdp, (4, ), KeyedRandomStream(1, 0))
+        for _ in range(10):
+            channel.step()
+        other = TimeVariantChannel(self._pdp, (4, ), KeyedRandomStream(1, 0))
+        other.seek(10)
+        self.assertEqual(other.slot(), 10)
+        np.testing.assert_array_equal(other.channel_taps(), channel.channel_taps())
+        self.assertRaises(ValueError, TimeVariantChannel(self._pdp).seek, 10)
+
+        awgn = AWGN(10., stream=KeyedRandomStream(1, 1))
+        tx = np.zeros(16, dtype=np.complex64)
+        awgn.step()
+        awgn.step()
+        rx = awgn.transmit(tx)
+        awgn.seek(2)
+        np.testing.assert_array_equal(awgn.transmit(tx), rx)
+
+    def test_003_coherent_split(self):
+        channel = CoherentTimeVariantChannel(self._pdp, self._coherence, stream=KeyedRandomStream(1, 0))
+        for _ in range(5):
+            channel.step()
+        snapshot = {k: np.array(v) for k, v in channel.dynamic_state().items()}
+        for _ in range(5):
+            channel.step()
+
+        # a second worker continues the trajectory from slot 5.
+        worker = CoherentTimeVariantChannel(self._pdp, self._coherence, stream=KeyedRandomStream(1, 0))
+        worker.set_dynamic_state(snapshot)
+        self.assertEqual(worker.slot(), 5)
+        for _ in range(5):
+            worker.step()
+        np.testing.assert_array_equal(worker.channel_taps(), channel.channel_taps())
+
+    def test_004_factory(self):
+        tx = np.ones((2, 64), dtype=np.complex64)
+        outputs = []
+        for _ in range(2):
+            factory = ChannelFactory('time', 'rayleigh', 1., tx_antennas=2, rx_antennas=2, equalizer_type='ZF',
+                                     carrier_frequency=3.8e9, velocity=15., seed=3)
+            channel = factory.create(10., link=7)
+            channel.step()
+            outputs.append(np.array(channel.transmit(tx)))
+        np.testing.assert_array_equal(outputs[0], outputs[1])
+        channel = factory.create(10., link=8)
+        channel.step()
+        self.assertFalse(np.any(np.array(channel.transmit(tx)) == outputs[0]))
+
+        factory = ChannelFactory('frequency', 'rayleigh', 1., subcarriers=16, seed=3)
+        channel = factory.create(10.)
+        channel.seek(100)
+        rx = channel.transmit(np.ones(16, dtype=np.complex64))
+        channel = factory.create(10.)
+        for _ in range(100):
+            channel.step()
+        np.testing.assert_array_equal(channel.transmit(np.ones(16, dtype=np.complex64)), rx)
+
+    def test_005_checkpoint_noise(self):
+        tx = np.ones(16, dtype=np.complex64)
+        configurations = [('frequency', {'subcarriers': 16}), ('time', {'rx_antennas': 2, 'equalizer_type': 'ZF'})]
+        for domain, kwargs in configurations:
+            factory = ChannelFactory(domain, 'rayleigh', 1., carrier_frequency=3.8e9, velocity=15., seed=5, **kwargs)
+            channel = factory.create(10.)
+            for _ in range(5):
+                channel.step()
+            with tempfile.TemporaryDirectory() as tmp:
+                filename = os.path.join(tmp, 'checkpoint.npz')
+                save_checkpoint(filename, channel)
+                for _ in range(3):
+                    channel.step()
+                rx = np.array(channel.transmit(tx if domain == 'frequency' else [tx]))
+
+                restored = factory.create(10.)
+                load_checkpoint(filename, restored)
+            for _ in range(3):
+                restored.step()
+            np.testing.assert_array_equal(np.array(restored.transmit(tx if domain == 'frequency' else [tx])), rx)
+
+    def test_006_factory_wrappers(self):
+        factories = {'ofdm': ChannelFactory('time', 'rayleigh', 1., subcarriers=16, equalizer_type='ZF', seed=9),
+                     'time': ChannelFactory('time', 'rayleigh', 1., subcarriers=16, equalizer_type='ZF', seed=9),
+                     'frequency': ChannelFactory('frequency', 'rayleigh', 1., subcarriers=16, seed=9),
+                     'estimation': ChannelFactory('frequency', 'rayleigh', 1., subcarriers=16, seed=9,
+                                                  pilot_indices=np.arange(0, 16, 4))}
+        creators = {'ofdm': lambda f: f.create_ofdm_channel(4, 10., link=2),
+                    'time': lambda f: f.create_interference_channel(2, -3., 10., link=2),
+                    'frequency': lambda f: f.create_interference_channel(2, -3., 10., link=2),
+                    'estimation': lambda f: f.create(10., link=2)}
+        for name, create in creators.items():
+            tx = np.ones(40, dtype=np.complex64) if name == 'ofdm' else np.ones(32, dtype=np.complex64)
+            if name in ('time', 'frequency'):
+                tx = np.ones((3, 32), dtype=np.complex64)
+            outputs = []
+            for _ in range(2):
+                channel = create(factories[name])
+                rx = channel.transmit(tx)
+                channel.step()
+                channel.step()
+                channel.seek(0)
+                outputs.append((rx, channel.transmit(tx)))
+            np.testing.assert_array_equal(outputs[0][0], outputs[1][0], err_msg=name)
+            np.testing.assert_array_equal(outputs[0][1], outputs[0][0], err_msg=name)
+
+
+if __name__ == '__main__':
+    unittest.main(failfast=True)
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright 2026 Johannes Demel.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+import numpy as np
+import unittest
+
+from channelmodel import ChannelFactory
+from channelmodel.scfde import add_cyclic_prefix
+
+
+class SingleCarrierFDETests(unittest.TestCase):
+    def setUp(self):
+        np.random.seed(5)
+        self._tx = np.exp(.5j * np.pi * np.random.randint(0, 4, 20 * 64) + .25j * np.pi).astype(np.complex64)
+
+    def tearDown(self):
+        pass
+
+    def test_001_add_cyclic_prefix(self):
+        blocks = add_cyclic_prefix(np.arange(8), 4, 2)
+        np.testing.assert_array_equal(blocks, [[2, 3, 0, 1, 2, 3], [6, 7, 4, 5, 6, 7]])
+
+    def test_002_zero_forcing(self):
+        for rx_antennas in (1, 3):
+            factory = ChannelFactory('time', 'rayleigh', 1., rx_antennas=rx_antennas, equalizer_type='ZF',
+                                     max_delay_spread=400.e-9)
+            channel = factory.create_scfde_channel(64, 16, snr_db=300.)
+            self.assertEqual(channel.weights().shape, (rx_antennas, 64))
+            rx = channel.transmit(self._tx)
+            self.assertEqual(rx.dtype, np.complex64)
+            np.testing.assert_allclose(rx, self._tx, rtol=1.e-3, atol=1.e-3)
+
+    def test_003_mmse(self):
+        factory = ChannelFactory('time', 'rayleigh', 1., rx_antennas=2, equalizer_type='MMSE')
+        channel = factory.create_scfde_channel(64, 16, snr_db=10.)
+        tx = np.tile(self._tx, 20)
+        rx, snr = channel.transmit(tx, return_snr=True)
+        gain = channel.equalizer_gain()
+        self.assertLess(gain, 1.)
+        # the unbiased error power matches the effective SNR.
+        error = np.mean(np.abs(rx / gain - tx) ** 2)
+        self.assertAlmostEqual(10. * np.log10(1. / error), 10. * np.log10(snr), delta=.5)
+
+    def test_004_cache(self):
+        channel = ChannelFactory('time', 'rayleigh', 1., equalizer_type='MMSE').create_scfde_channel(64, 16)
+        weights = channel.weights()
+        self.assertIs(channel.weights(), weights)
+        channel.step()
+        self.assertFalse(np.array_equal(channel.weights(), weights))
+
+    def test_005_factory(self):
+        self.assertEqual(ChannelFactory('time', 'awgn', 1.).state()['equalizer_type'], 'ZF')
+        self.assertEqual(ChannelFactory('frequency', 'awgn', 1.).state()['equalizer_type'], 'MF')
+        with self.assertRaises(ValueError):
+            ChannelFactory('time', 'rayleigh', 1., equalizer_type='MF')
+        with self.assertRaises(ValueError):
+            ChannelFactory('time', 'rayleigh', 1., tx_antennas=2).create_scfde_channel(64, 16)
+
+
+if __name__ == '__main__':
+    unittest.main(failfast=True)
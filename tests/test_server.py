@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright 2026 Johannes Demel.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+import os
+import shutil
+import tempfile
+import threading
+import numpy as np
+import unittest
+
+from channelmodel import ChannelFactory
+from channelmodel.server import ChannelServer, ChannelClient, OP_TRANSMIT, _OP_CREATE, _Job, _Session
+
+
+class ChannelServerTests(unittest.TestCase):
+    def setUp(self):
+        self._directory = tempfile.mkdtemp()
+        self._address = os.path.join(self._directory, 'channel.sock')
+
+    def tearDown(self):
+        shutil.rmtree(self._directory)
+
+    def start_server(self, *args, **kwargs):
+        factory = ChannelFactory(*args, **kwargs)
+        factory.set_snr(60.)
+        server = ChannelServer(factory, self._address)
+        server.start()
+        return server
+
+    def test_001_awgn_batch(self):
+        server = self.start_server('time', 'awgn', 1., equalizer_type='ZF')
+        results = {}
+
+        def run_client(i):
+            tx = np.full(1000 + i, i + 1.j, dtype=np.complex64)
+            with ChannelClient(self._address) as client:
+                for _ in range(20):
+                    rx = client.transmit(tx)
+                    client.step()
+                results[i] = (tx, rx)
+
+        threads = [threading.Thread(target=run_client, args=(i, )) for i in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        server.shutdown()
+        self.assertEqual(len(results), 8)
+        for tx, rx in results.values():
+            self.assertEqual(rx.size, tx.size)
+            np.testing.assert_allclose(rx, tx, atol=1.e-2)
+        self.assertFalse(os.path.exists(self._address))
+
+    def test_002_rayleigh(self):
+        server = self.start_server('frequency', 'rayleigh', 1., subcarriers=16, equalizer_type='ZF')
+        with ChannelClient(self._address) as client:
+            tx = np.exp(1.j * np.random.uniform(0., 2. * np.pi, 64)).astype(np.complex64)
+            np.testing.assert_allclose(client.transmit(tx), tx, atol=1.e-1)
+            self.assertEqual(client.state()['subcarriers'], 16)
+            self.assertRaises(RuntimeError, client.transmit, tx[0:10])
+            client.step(1.e-3)
+            self.assertEqual(client.transmit(tx).size, tx.size)
+        server.shutdown()
+
+    def test_003_mimo_tcp(self):
+        factory = ChannelFactory('time', 'rayleigh', 1., tx_antennas=2, rx_antennas=3, equalizer_type='ZF')
+        server = ChannelServer(factory, ('127.0.0.1', 0))
+        server.start()
+        with ChannelClient(server.address()) as client:
+            self.assertEqual(client.transmit(np.ones(200, dtype=np.complex64)).size, 300)
+            self.assertRaises(RuntimeError, client.transmit, np.ones(3, dtype=np.complex64))
+        server.shutdown()
+
+    def test_004_steps(self):
+        factory = ChannelFactory('frequency', 'rayleigh', 1., subcarriers=16, equalizer_type='ZF', seed=7)
+        factory.set_snr(10.)
+        server = ChannelServer(factory, self._address)
+        server.start()
+        channel = factory.create()
+        channel.step(1.e-3, 3)
+        tx = np.exp(1.j * np.random.uniform(0., 2. * np.pi, 64)).astype(np.complex64)
+        with ChannelClient(self._address) as client:
+            client.step(1.e-3, 3)
+            np.testing.assert_allclose(client.transmit(tx), channel.transmit(tx), rtol=1.e-5, atol=1.e-6)
+        server.shutdown()
+
+    def test_005_malformed_batch(self):
+        server = self.start_server('time', 'awgn', 1., equalizer_type='ZF')
+        tx = np.full(100, 1.j, dtype=np.complex64)
+        sessions = [_Session() for _ in range(3)]
+        server._process([_Job(s, _OP_CREATE, None) for s in sessions])
+        # all jobs in one batch, the malformed payload is not a multiple of 8 bytes.
+        batch = [_Job(sessions[0], OP_TRANSMIT, tx.tobytes()), _Job(sessions[1], OP_TRANSMIT, b'\x00' * 12),
+                 _Job(sessions[2], OP_TRANSMIT, tx.tobytes())]
+        server._process(batch)
+        self.assertTrue(all(j.done.is_set() for j in batch))
+        self.assertIsInstance(batch[1].error, ValueError)
+        for j in batch[0::2]:
+            self.assertIsNone(j.error)
+            np.testing.assert_allclose(j.result, tx, atol=1.e-2)
+
+        results = {}
+
+        def run_client(i):
+            with ChannelClient(self._address) as client:
+                for _ in range(20):
+                    if i % 2:
+                        self.assertRaises(RuntimeError, client._request, OP_TRANSMIT, b'\x00' * 12)
+                    else:
+                        results[i] = client.transmit(tx)
+
+        threads = [threading.Thread(target=run_client, args=(i, )) for i in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(30.)
+        self.assertFalse(any(t.is_alive() for t in threads))
+        for rx in results.values():
+            np.testing.assert_allclose(rx, tx, atol=1.e-2)
+        self.assertEqual(len(results), 4)
+        server.shutdown()
+
+
+if __name__ == '__main__':
+    unittest.main(failfast=True)
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright 2026 Johannes Demel.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+import multiprocessing
+import pickle
+import numpy as np
+import unittest
+
+from channelmodel import ChannelFactory
+from channelmodel.sharedmemory import SampleRingBuffer, SharedChannelState, SharedMemoryChannel
+
+
+def _consume(ring, num_samples, result):
+    samples = np.zeros(num_samples, dtype=np.complex64)
+    done = 0
+    while done < num_samples:
+        done += ring.read(num_samples - done, samples[done:]).size
+    result.put(np.sum(samples))
+
+
+class SampleRingBufferTests(unittest.TestCase):
+    def setUp(self):
+        self._ring = SampleRingBuffer(16)
+
+    def tearDown(self):
+        self._ring.close()
+        self._ring.unlink()
+
+    def test_001_wrap(self):
+        ring = self._ring
+        self.assertEqual(ring.capacity(), 16)
+        self.assertEqual(ring.free(), 16)
+        data = (np.arange(40) + 1.j * np.arange(40)).astype(np.complex64)
+        self.assertEqual(ring.write(data[0:10]), 10)
+        np.testing.assert_array_equal(ring.read(6), data[0:6])
+        self.assertEqual(ring.write(data[10:40]), 12)
+        self.assertEqual(ring.available(), 16)
+        self.assertEqual(ring.free(), 0)
+        np.testing.assert_array_equal(ring.read(), data[6:22])
+
+        view = ring.write_view(16)
+        self.assertEqual(view.size, 10)
+        view[:] = 1.j
+        ring.commit_write(view.size)
+        self.assertEqual(ring.read_view().size, 10)
+
+    def test_002_attach(self):
+        other = pickle.loads(pickle.dumps(self._ring))
+        self.assertEqual(other.capacity(), 16)
+        self._ring.write(np.ones(5, dtype=np.complex64))
+        self.assertEqual(other.available(), 5)
+        np.testing.assert_array_equal(other.read(), np.ones(5))
+        self.assertEqual(self._ring.available(), 0)
+        other.close()
+
+    def test_003_process(self):
+        num_samples = 1000
+        data = (np.random.randn(num_samples) + 1.j * np.random.randn(num_samples)).astype(np.complex64)
+        result = multiprocessing.Queue()
+        consumer = multiprocessing.Process(target=_consume, args=(self._ring, num_samples, result))
+        consumer.start()
+        done = 0
+        while done < num_samples:
+            done += self._ring.write(data[done:])
+        consumer.join(10.)
+        self.assertAlmostEqual(result.get(timeout=1.), np.sum(data), 3)
+
+
+class SharedMemoryChannelTests(unittest.TestCase):
+    def test_001_state(self):
+        state = SharedChannelState((2, 3))
+        reader = pickle.loads(pickle.dumps(state))
+        values = np.arange(6).reshape((2, 3)).astype(np.complex64)
+        state.publish(values)
+        snapshot, version = reader.snapshot()
+        np.testing.assert_array_equal(snapshot, values)
+        self.assertEqual(version, 1)
+        reader.close()
+        state.close()
+        state.unlink()
+
+    def test_002_transmit(self):
+        factory = ChannelFactory('frequency', 'rayleigh', 1., subcarriers=8, equalizer_type='ZF')
+        channel = factory.create(100.)
+        tx_ring = SampleRingBuffer(64)
+        rx_ring = SampleRingBuffer(64)
+        channel_state = SharedChannelState.for_channel(channel)
+        shared = SharedMemoryChannel(channel, tx_ring, rx_ring, channel_state, block_size=8)
+        tx = np.exp(1.j * np.random.uniform(0., 2. * np.pi, 44)).astype(np.complex64)
+        tx_ring.write(tx)
+        self.assertEqual(shared.process(), 40)
+        self.assertEqual(tx_ring.available(), 4)
+        np.testing.assert_allclose(rx_ring.read(), tx[0:40], atol=1.e-3)
+        shared.step()
+        taps, version = channel_state.snapshot()
+        np.testing.assert_array_equal(taps, channel.channel_taps())
+        self.assertEqual(version, 3)
+
+        factory = ChannelFactory('time', 'rayleigh', 1., tx_antennas=1, rx_antennas=2, equalizer_type='ZF')
+        channel = factory.create(10.)
+        rx_rings = [SampleRingBuffer(64), SampleRingBuffer(64)]
+        shared = SharedMemoryChannel(channel, [tx_ring], rx_rings)
+        tx_ring.write(tx[0:20])
+        self.assertEqual(shared.process(), 24)
+        self.assertEqual(rx_rings[1].available(), 24)
+
+        # chunks continue the convolution of the previous chunk.
+        factory = ChannelFactory('time', 'rayleigh', 1., equalizer_type='ZF')
+        channel = factory.create(300.)
+        self.assertGreater(channel.channel_length(), 1)
+        rx_ring.read()
+        shared = SharedMemoryChannel(channel, [tx_ring], [rx_ring])
+        tx_ring.write(tx)
+        while shared.process(max_samples=7) > 0:
+            pass
+        expected = np.convolve(tx[0:44], channel.channel_taps()[0][0])[0:44]
+        np.testing.assert_allclose(rx_ring.read(), expected, atol=1.e-4)
+
+        factory = ChannelFactory('time', 'rayleigh', 1., subcarriers=16, equalizer_type='ZF')
+        channel = factory.create_ofdm_channel(4, snr_db=300.)
+        self.assertGreater(channel.channel_length(), 1)
+        shared = SharedMemoryChannel(channel, tx_ring, rx_ring)
+        tx_ring.write(tx)
+        while shared.process(max_samples=7) > 0:
+            pass
+        expected = np.convolve(tx[0:44], channel.channel_taps())[0:44]
+        np.testing.assert_allclose(rx_ring.read(), expected, atol=1.e-4)
+
+        for b in [tx_ring, rx_ring, channel_state] + rx_rings:
+            b.close()
+            b.unlink()
+
+
+if __name__ == '__main__':
+    unittest.main(failfast=True)
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright 2026 Johannes Demel.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+import numpy as np
+import unittest
+
+from channelmodel import ChannelFactory
+from channelmodel.markov import fading_statistics
+from channelmodel.statistics import (ChannelStatistics, FixedBinHistogram, LevelCrossingAccumulator,
+                                     RunningMoments)
+
+
+class StreamingStatisticsTests(unittest.TestCase):
+    def setUp(self):
+        np.random.seed(13)
+
+    def tearDown(self):
+        pass
+
+    def test_001_moments(self):
+        values = np.random.exponential(size=(500, 8)) + 1.e6
+        moments = RunningMoments()
+        for v in values:
+            moments.update(v)
+        self.assertEqual(moments.count(), 500)
+        np.testing.assert_allclose(moments.mean(), np.mean(values, axis=0))
+        np.testing.assert_allclose(moments.variance(), np.var(values, axis=0, ddof=1), rtol=1.e-6)
+
+    def test_002_histogram(self):
+        values = np.random.normal(size=(100, 100))
+        histogram = FixedBinHistogram(-2., 2., 16)
+        for v in values:
+            histogram.update(v)
+        counts, edges = np.histogram(values, bins=16, range=(-2., 2.))
+        np.testing.assert_array_equal(histogram.counts(), counts)
+        np.testing.assert_allclose(histogram.bin_edges(), edges)
+        self.assertEqual(histogram.underflow(), np.count_nonzero(values < -2.))
+        self.assertEqual(histogram.overflow(), np.count_nonzero(values >= 2.))
+        self.assertAlmostEqual(histogram.cdf()[-1], 1. - histogram.overflow() / values.size)
+
+    def test_003_level_crossings(self):
+        gains = np.random.exponential(size=(1000, 16))
+        thresholds = np.array([.1, .5, 1.])
+        accumulator = LevelCrossingAccumulator(thresholds, 1.e-3, max_fade_steps=8)
+        for g in gains:
+            accumulator.update(g)
+        lcr, afd = fading_statistics(gains, thresholds, 1.e-3)
+        np.testing.assert_allclose(accumulator.level_crossing_rate(), lcr)
+        np.testing.assert_allclose(accumulator.average_fade_duration(), afd)
+
+        trace = np.array([1., .2, .2, 1., .2, 1., .2, .2, .2])
+        accumulator = LevelCrossingAccumulator([.5], max_fade_steps=4)
+        for g in trace:
+            accumulator.update([g])
+        # the last fade is not completed yet.
+        np.testing.assert_array_equal(accumulator.fade_duration_counts()[0], [0, 1, 1, 0, 0])
+        self.assertEqual(accumulator.crossings()[0], 3)
+
+    def test_004_channel_statistics(self):
+        factory = ChannelFactory('frequency', 'rayleigh', 1., subcarriers=32, carrier_frequency=3.8e9, velocity=30.)
+        statistics = ChannelStatistics(factory.create_fading_channel((64, )), thresholds_db=(-10., 0.))
+        statistics.step(200)
+        self.assertEqual(statistics.num_steps(), 201)
+        self.assertEqual(statistics.moments().mean().shape, (64, 32))
+        self.assertAlmostEqual(statistics.moments().total_mean(), 1., delta=.2)
+        self.assertEqual(statistics.histogram().num_values(), 201 * 64 * 32)
+        lcr = statistics.level_crossings().level_crossing_rate()
+        self.assertTrue(np.all(lcr > 0.))
+        channel = ChannelFactory('frequency', 'rayleigh', 1., subcarriers=64).create(10.)
+        frequency_domain = ChannelStatistics(channel)
+        frequency_domain.step(10)
+        self.assertEqual(frequency_domain.moments().mean().shape, (64, ))
+        np.testing.assert_array_equal(frequency_domain.moments().mean() > 0., True)
+        ofdm = ChannelFactory('time', 'rayleigh', 1., subcarriers=64).create_ofdm_channel(16)
+        ofdm_statistics = ChannelStatistics(ofdm)
+        ofdm_statistics.update()
+        self.assertEqual(ofdm_statistics.moments().mean().shape, (64, ))
+        time_domain = ChannelStatistics(ChannelFactory('time', 'rayleigh', 1., rx_antennas=2).create())
+        time_domain.step(10)
+        self.assertEqual(time_domain.moments().mean().shape, (2, 1))
+
+
+if __name__ == '__main__':
+    unittest.main(failfast=True)